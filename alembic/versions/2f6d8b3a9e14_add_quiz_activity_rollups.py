@@ -0,0 +1,58 @@
+"""add quiz_activity_hourly and quiz_activity_daily rollups
+
+Revision ID: 2f6d8b3a9e14
+Revises: 7c4e1a9f2b58
+Create Date: 2026-10-19 14:05:12.530114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f6d8b3a9e14'
+down_revision: Union[str, None] = '7c4e1a9f2b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('quiz_activity_hourly',
+       sa.Column('quiz_id', sa.UUID(), nullable=False),
+       sa.Column('bucket_start', sa.DateTime(), nullable=False),
+       sa.Column('attempts', sa.BigInteger(), nullable=False),
+       sa.Column('score_sum', sa.BigInteger(), nullable=False),
+       sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ),
+       sa.PrimaryKeyConstraint('quiz_id', 'bucket_start')
+    )
+    op.create_table('quiz_activity_daily',
+       sa.Column('quiz_id', sa.UUID(), nullable=False),
+       sa.Column('day', sa.Date(), nullable=False),
+       sa.Column('attempts', sa.BigInteger(), nullable=False),
+       sa.Column('score_sum', sa.BigInteger(), nullable=False),
+       sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ),
+       sa.PrimaryKeyConstraint('quiz_id', 'day')
+    )
+
+    # Backfill every hour from the existing results; the rollup compaction
+    # (on startup, then every ROLLUP_COMPACTION_INTERVAL_SECONDS) folds the old
+    # ones into days.
+    if op.get_bind().dialect.name == 'postgresql':
+        hour = "date_trunc('hour', taken_at)"
+    else:
+        hour = "strftime('%Y-%m-%d %H:00:00.000000', taken_at)"
+    op.execute(
+        f"""
+        INSERT INTO quiz_activity_hourly (quiz_id, bucket_start, attempts, score_sum)
+        SELECT quiz_id, {hour}, COUNT(*), SUM(score)
+        FROM results
+        GROUP BY quiz_id, {hour}
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('quiz_activity_daily')
+    op.drop_table('quiz_activity_hourly')
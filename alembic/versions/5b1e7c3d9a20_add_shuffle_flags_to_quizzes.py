@@ -0,0 +1,28 @@
+"""add shuffle_questions and shuffle_options to quizzes
+
+Revision ID: 5b1e7c3d9a20
+Revises: 2f6d8b3a9e14
+Create Date: 2026-10-19 16:20:41.208337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1e7c3d9a20'
+down_revision: Union[str, None] = '2f6d8b3a9e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('quizzes', sa.Column('shuffle_questions', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.add_column('quizzes', sa.Column('shuffle_options', sa.Boolean(), nullable=False, server_default=sa.false()))
+
+
+def downgrade() -> None:
+    op.drop_column('quizzes', 'shuffle_options')
+    op.drop_column('quizzes', 'shuffle_questions')
@@ -0,0 +1,62 @@
+"""add quiz_stats and quiz_score_counts
+
+Revision ID: 5d2e8f41c7a9
+Revises: 41683bc0cfc0
+Create Date: 2026-10-18 10:12:31.482107
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8f41c7a9'
+down_revision: Union[str, None] = '41683bc0cfc0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('quiz_stats',
+       sa.Column('quiz_id', sa.UUID(), nullable=False),
+       sa.Column('attempts', sa.BigInteger(), nullable=False),
+       sa.Column('score_sum', sa.BigInteger(), nullable=False),
+       sa.Column('score_sq_sum', sa.BigInteger(), nullable=False),
+       sa.Column('min_score', sa.Integer(), nullable=True),
+       sa.Column('max_score', sa.Integer(), nullable=True),
+       sa.Column('updated_at', sa.DateTime(), nullable=False),
+       sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ),
+       sa.PrimaryKeyConstraint('quiz_id')
+    )
+    op.create_table('quiz_score_counts',
+       sa.Column('quiz_id', sa.UUID(), nullable=False),
+       sa.Column('score', sa.SmallInteger(), nullable=False),
+       sa.Column('attempts', sa.BigInteger(), nullable=False),
+       sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ),
+       sa.PrimaryKeyConstraint('quiz_id', 'score')
+    )
+
+    # Backfill from the existing results; new results maintain both tables on insert.
+    op.execute(
+        """
+        INSERT INTO quiz_stats (quiz_id, attempts, score_sum, score_sq_sum, min_score, max_score, updated_at)
+        SELECT quiz_id, COUNT(*), SUM(score), SUM(score * score), MIN(score), MAX(score), CURRENT_TIMESTAMP
+        FROM results
+        GROUP BY quiz_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO quiz_score_counts (quiz_id, score, attempts)
+        SELECT quiz_id, score, COUNT(*)
+        FROM results
+        GROUP BY quiz_id, score
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('quiz_score_counts')
+    op.drop_table('quiz_stats')
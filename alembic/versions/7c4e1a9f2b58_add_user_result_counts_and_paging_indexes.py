@@ -0,0 +1,53 @@
+"""add user_result_counts and results paging indexes
+
+Revision ID: 7c4e1a9f2b58
+Revises: e3a9d0b6c215
+Create Date: 2026-10-19 09:21:47.093518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4e1a9f2b58'
+down_revision: Union[str, None] = 'e3a9d0b6c215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_result_counts',
+       sa.Column('user_id', sa.UUID(), nullable=False),
+       sa.Column('attempts', sa.BigInteger(), nullable=False),
+       sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+       sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # Backfill from the existing results; new results maintain the table on insert.
+    op.execute(
+        """
+        INSERT INTO user_result_counts (user_id, attempts)
+        SELECT user_id, COUNT(*)
+        FROM results
+        WHERE user_id IS NOT NULL
+        GROUP BY user_id
+        """
+    )
+
+    # On a large PostgreSQL table consider creating these by hand with CREATE INDEX CONCURRENTLY
+    # before running this migration; if_not_exists makes the migration a no-op then.
+    op.create_index(
+        'ix_results_quiz_taken_at_id', 'results', ['quiz_id', 'taken_at', 'id'], if_not_exists=True
+    )
+    op.create_index(
+        'ix_results_user_taken_at_id', 'results', ['user_id', 'taken_at', 'id'], if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_results_user_taken_at_id', table_name='results')
+    op.drop_index('ix_results_quiz_taken_at_id', table_name='results')
+    op.drop_table('user_result_counts')
@@ -0,0 +1,33 @@
+"""add results leaderboard index
+
+Revision ID: 9b7c1e2d4f60
+Revises: 5d2e8f41c7a9
+Create Date: 2026-10-18 11:03:12.204815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b7c1e2d4f60'
+down_revision: Union[str, None] = '5d2e8f41c7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # On a large PostgreSQL table consider creating it by hand with CREATE INDEX CONCURRENTLY
+    # before running this migration; if_not_exists makes the migration a no-op then.
+    op.create_index(
+        'ix_results_quiz_score_taken_at',
+        'results',
+        ['quiz_id', sa.text('score DESC'), 'taken_at'],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_results_quiz_score_taken_at', table_name='results')
@@ -0,0 +1,40 @@
+"""add question_item_stats
+
+Revision ID: e3a9d0b6c215
+Revises: 9b7c1e2d4f60
+Create Date: 2026-10-18 12:26:40.931552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9d0b6c215'
+down_revision: Union[str, None] = '9b7c1e2d4f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('question_item_stats',
+       sa.Column('question_id', sa.UUID(), nullable=False),
+       sa.Column('quiz_id', sa.UUID(), nullable=False),
+       sa.Column('responses', sa.BigInteger(), nullable=False),
+       sa.Column('correct', sa.BigInteger(), nullable=False),
+       sa.Column('p_value', sa.Float(), nullable=False),
+       sa.Column('discrimination', sa.Float(), nullable=True),
+       sa.Column('option_counts', sa.JSON(), nullable=False),
+       sa.Column('computed_at', sa.DateTime(), nullable=False),
+       sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ),
+       sa.ForeignKeyConstraint(['quiz_id'], ['quizzes.id'], ),
+       sa.PrimaryKeyConstraint('question_id')
+    )
+    op.create_index(op.f('ix_question_item_stats_quiz_id'), 'question_item_stats', ['quiz_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_question_item_stats_quiz_id'), table_name='question_item_stats')
+    op.drop_table('question_item_stats')
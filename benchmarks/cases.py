@@ -0,0 +1,113 @@
+"""Benchmark cases for the hot, CPU-bound paths of a request.
+
+Each case is a zero-argument callable; fixtures are built once, outside the
+timed region. ORM models are transient (never attached to a session), which
+keeps the numbers about attribute mapping rather than database round trips.
+"""
+from datetime import datetime, timezone
+from typing import Callable, Dict
+from uuid import uuid4
+
+from src.api.schemas import QuizResponse
+from src.infrastructure.auth.password import get_password_hash, verify_password
+from src.infrastructure.auth.token import create_access_token, verify_token
+from src.infrastructure.database.models import QuestionModel, QuestionOptionModel, QuizModel
+from src.infrastructure.repositories.question_repository_impl import QuestionRepositoryImpl
+from src.infrastructure.repositories.quiz_repository_impl import QuizRepositoryImpl
+
+QUESTIONS_PER_QUIZ = 20
+OPTIONS_PER_QUESTION = 4
+
+
+def _question_model(quiz_id, index: int) -> QuestionModel:
+    now = datetime.now(timezone.utc)
+    question_id = uuid4()
+    question = QuestionModel(
+        id=question_id,
+        text=f"Benchmark question {index}?",
+        quiz_id=quiz_id,
+        correct_answer=1,
+        created_at=now,
+        updated_at=now,
+    )
+    question.options = [
+        QuestionOptionModel(
+            id=uuid4(),
+            question_id=question_id,
+            reference_id=o + 1,
+            text=f"Option {o + 1}",
+            order=o + 1,
+            is_correct=o == 0,
+            image_url=None,
+            metadata_json=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for o in range(OPTIONS_PER_QUESTION)
+    ]
+    return question
+
+
+def _quiz_model() -> QuizModel:
+    now = datetime.now(timezone.utc)
+    quiz_id = uuid4()
+    quiz = QuizModel(
+        id=quiz_id,
+        title="Benchmark quiz",
+        description="Quiz used by the microbenchmarks",
+        journey_id=None,
+        user_id=uuid4(),
+        estimated_time=10,
+        feedback_mode="final",
+        difficulty="medio",
+        image_url=None,
+        created_at=now,
+        updated_at=now,
+    )
+    quiz.questions = [_question_model(quiz_id, i) for i in range(QUESTIONS_PER_QUIZ)]
+    return quiz
+
+
+def _quiz_response(quiz) -> QuizResponse:
+    # Mirrors GET /api/quizzes/{quiz_id}
+    return QuizResponse(
+        id=quiz.id,
+        title=quiz.title,
+        description=quiz.description,
+        journey_id=quiz.journey_id,
+        user_id=quiz.user_id,
+        estimated_time=quiz.estimated_time,
+        feedback_mode=quiz.feedback_mode,
+        difficulty=quiz.difficulty,
+        image_url=quiz.image_url,
+        created_at=quiz.created_at,
+        updated_at=quiz.updated_at,
+        questions=quiz.questions or [],
+    )
+
+
+def build_cases() -> Dict[str, Callable[[], object]]:
+    quiz_repo = QuizRepositoryImpl(None)
+    question_repo = QuestionRepositoryImpl(None)
+    quiz_model = _quiz_model()
+    question_model = quiz_model.questions[0]
+    quiz = quiz_repo._to_entity(quiz_model, include_questions=True)
+    question = question_repo._to_entity(question_model)
+    response = _quiz_response(quiz)
+    token = create_access_token({"sub": str(uuid4())})
+    password_hash = get_password_hash("benchmark-password")
+
+    return {
+        "quiz_repository.to_entity": lambda: quiz_repo._to_entity(quiz_model),
+        "quiz_repository.to_entity_with_questions": lambda: quiz_repo._to_entity(
+            quiz_model, include_questions=True
+        ),
+        "question_repository.to_entity": lambda: question_repo._to_entity(question_model),
+        "question_repository.to_model": lambda: question_repo._to_model(question),
+        "quiz_response.validate": lambda: _quiz_response(quiz),
+        "quiz_response.dump_json": response.model_dump_json,
+        "jwt.create_access_token": lambda: create_access_token({"sub": "benchmark"}),
+        "jwt.verify_token": lambda: verify_token(token),
+        "argon2.hash": lambda: get_password_hash("benchmark-password"),
+        "argon2.verify": lambda: verify_password("benchmark-password", password_hash),
+    }
@@ -0,0 +1,77 @@
+"""Compare benchmark results against a baseline and fail on regressions.
+
+    python -m benchmarks.compare benchmarks/baseline.json .benchmarks/current.json --threshold 0.15
+
+Exits with status 1 when any benchmark's median time grew by more than
+`--threshold` (a fraction, 0.15 = 15%) over the baseline. A missing
+baseline fails too, unless `--allow-missing-baseline` is given, so a gate
+that has nothing to compare against cannot pass silently.
+"""
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional, Tuple
+
+
+def compare(baseline: dict, candidate: dict, threshold: float) -> Tuple[List[str], List[str]]:
+    """Return the report lines and the names of the benchmarks that regressed."""
+    lines = [f"{'benchmark':<45} {'baseline us':>12} {'current us':>12} {'change':>9}"]
+    regressions = []
+    for name in sorted(set(baseline["benchmarks"]) | set(candidate["benchmarks"])):
+        before = baseline["benchmarks"].get(name)
+        after = candidate["benchmarks"].get(name)
+        if before is None or after is None:
+            lines.append(f"{name:<45} {'missing' if before is None else 'present':>12} "
+                         f"{'missing' if after is None else 'present':>12}")
+            continue
+        b, a = before["median_us"], after["median_us"]
+        change = (a - b) / b if b else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        lines.append(f"{name:<45} {b:>12.3f} {a:>12.3f} {change * 100:>+8.1f}%{flag}")
+    return lines, regressions
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare two benchmarks.run JSON files.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown, e.g. 0.15")
+    parser.add_argument(
+        "--allow-missing-baseline",
+        action="store_true",
+        help="Skip the gate instead of failing when the baseline file does not exist",
+    )
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.baseline):
+        print(
+            f"no baseline at {args.baseline}. "
+            "Record one with `make bench-baseline` on the reference machine.",
+            file=sys.stderr,
+        )
+        if args.allow_missing_baseline:
+            return
+        sys.exit(1)
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+
+    lines, regressions = compare(baseline, candidate, args.threshold)
+    print("\n".join(lines))
+    if baseline.get("machine") != candidate.get("machine"):
+        print("warning: results come from different machines", file=sys.stderr)
+    if regressions:
+        print(
+            f"{len(regressions)} benchmark(s) slower than baseline by more than "
+            f"{args.threshold:.0%}: {', '.join(regressions)}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Run the microbenchmarks and write the timings as JSON.
+
+    python -m benchmarks.run --output benchmarks/baseline.json
+    python -m benchmarks.run --only quiz_repository --output .benchmarks/current.json
+
+Every case is calibrated with `timeit.Timer.autorange` and then timed
+`--repeat` times; the median and minimum time per call are reported in
+microseconds. Compare two files with `python -m benchmarks.compare`.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from .cases import build_cases
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    per_call = sorted(t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number))
+    return {
+        "median_us": round(statistics.median(per_call), 3),
+        "min_us": round(per_call[0], 3),
+        "stdev_us": round(statistics.stdev(per_call), 3) if len(per_call) > 1 else 0.0,
+        "loops": number,
+        "repeat": repeat,
+    }
+
+
+def run(only: Optional[List[str]] = None, repeat: int = 5) -> dict:
+    results: Dict[str, dict] = {}
+    for name, func in build_cases().items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        results[name] = measure(func, repeat)
+        print(f"{name:<45} {results[name]['median_us']:>12.3f} us", file=sys.stderr)
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()} {platform.processor()}".strip(),
+        "benchmarks": results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the microbenchmark suite.")
+    parser.add_argument("--only", action="append", help="Substring filter, may be repeated")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Write the JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    output = json.dumps(run(args.only, args.repeat), indent=2)
+    if args.output:
+        path = Path(args.output)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(output + "\n", encoding="utf-8")
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
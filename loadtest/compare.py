@@ -0,0 +1,45 @@
+"""Compare two load-test reports endpoint by endpoint.
+
+    python -m loadtest.compare loadtest-sqlite.json loadtest-postgres.json
+"""
+import argparse
+import json
+from typing import List, Optional
+
+METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _change(before: float, after: float) -> str:
+    if not before:
+        return "n/a"
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def compare(baseline: dict, candidate: dict) -> List[str]:
+    lines = [
+        f"{'endpoint':<16} {'metric':<15} {baseline.get('label') or 'baseline':>12} "
+        f"{candidate.get('label') or 'candidate':>12} {'change':>9}"
+    ]
+    for name in sorted(set(baseline["endpoints"]) | set(candidate["endpoints"])):
+        before = baseline["endpoints"].get(name, {})
+        after = candidate["endpoints"].get(name, {})
+        for metric in METRICS:
+            b, a = before.get(metric, 0.0), after.get(metric, 0.0)
+            lines.append(f"{name:<16} {metric:<15} {b:>12.2f} {a:>12.2f} {_change(b, a):>9}")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare two loadtest.run JSON reports.")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args(argv)
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding="utf-8") as f:
+        candidate = json.load(f)
+    print("\n".join(compare(baseline, candidate)))
+
+
+if __name__ == "__main__":
+    main()
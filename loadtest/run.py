@@ -0,0 +1,286 @@
+"""Load-test driver for the hot API endpoints.
+
+Seeds users and quizzes through the public API, then runs a weighted mix of
+login, latest quizzes, quiz detail, question listing and result submission
+requests for a fixed duration. Per-endpoint throughput and latency percentiles
+are written as JSON so runs (releases, SQLite vs Postgres) can be compared.
+
+    python -m loadtest.run --base-url http://localhost:8000 --duration 60 \
+        --concurrency 50 --label postgres --output loadtest-postgres.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import random
+import string
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import httpx
+
+DEFAULT_MIX = {
+    "login": 5,
+    "latest_quizzes": 30,
+    "get_quiz": 35,
+    "quiz_questions": 15,
+    "submit_result": 15,
+}
+
+
+@dataclass
+class SeedData:
+    users: List[Dict[str, str]] = field(default_factory=list)
+    tokens: List[str] = field(default_factory=list)
+    quiz_ids: List[str] = field(default_factory=list)
+
+
+@dataclass
+class EndpointStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+    status_codes: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
+
+    def record(self, latency: float, status_code: Optional[int]) -> None:
+        self.latencies.append(latency)
+        if status_code is None or status_code >= 400:
+            self.errors += 1
+        self.status_codes[status_code or 0] += 1
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _suffix(length: int = 8) -> str:
+    return "".join(random.choices(string.ascii_lowercase + string.digits, k=length))
+
+
+def _question_payload(index: int, options: int) -> dict:
+    return {
+        "text": f"Load test question {index}?",
+        "options": [
+            {"reference_id": i + 1, "text": f"Option {i + 1}", "order": i + 1}
+            for i in range(options)
+        ],
+        "correct_answer": 1 + index % options,
+    }
+
+
+async def seed(client: httpx.AsyncClient, args: argparse.Namespace) -> SeedData:
+    """Register users, log them in and create quizzes with questions."""
+    data = SeedData()
+    run_id = uuid.uuid4().hex[:8]
+    for i in range(args.users):
+        user = {
+            "username": f"load_{run_id}_{i}",
+            "email": f"load_{run_id}_{i}@example.com",
+            "password": "loadtest-password",
+        }
+        response = await client.post("/api/auth/register", json=user)
+        response.raise_for_status()
+        response = await client.post(
+            "/api/auth/login", json={"email": user["email"], "password": user["password"]}
+        )
+        response.raise_for_status()
+        data.users.append(user)
+        data.tokens.append(response.json()["access_token"])
+
+    for i in range(args.quizzes):
+        token = data.tokens[i % len(data.tokens)]
+        response = await client.post(
+            "/api/quizzes/",
+            json={
+                "title": f"Load test quiz {run_id} {i}",
+                "description": "Generated by loadtest.run",
+                "questions": [
+                    _question_payload(q, args.options) for q in range(args.questions)
+                ],
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        response.raise_for_status()
+        data.quiz_ids.append(response.json()["id"])
+    return data
+
+
+async def _login(client: httpx.AsyncClient, seed_data: SeedData) -> httpx.Response:
+    user = random.choice(seed_data.users)
+    return await client.post(
+        "/api/auth/login", json={"email": user["email"], "password": user["password"]}
+    )
+
+
+async def _latest_quizzes(client: httpx.AsyncClient, seed_data: SeedData) -> httpx.Response:
+    return await client.get("/api/quizzes/latest", params={"page": random.randint(1, 3)})
+
+
+async def _get_quiz(client: httpx.AsyncClient, seed_data: SeedData) -> httpx.Response:
+    return await client.get(f"/api/quizzes/{random.choice(seed_data.quiz_ids)}")
+
+
+async def _quiz_questions(client: httpx.AsyncClient, seed_data: SeedData) -> httpx.Response:
+    return await client.get(
+        "/api/questions/quiz", params={"quiz_id": random.choice(seed_data.quiz_ids)}
+    )
+
+
+async def _submit_result(client: httpx.AsyncClient, seed_data: SeedData) -> httpx.Response:
+    return await client.post(
+        "/api/results/",
+        json={
+            "respondent_name": f"Student {_suffix(4)}",
+            "quiz_id": random.choice(seed_data.quiz_ids),
+            "score": max(0, min(100, int(random.gauss(65, 15)))),
+            "total_questions": 10,
+        },
+    )
+
+
+SCENARIOS = {
+    "login": _login,
+    "latest_quizzes": _latest_quizzes,
+    "get_quiz": _get_quiz,
+    "quiz_questions": _quiz_questions,
+    "submit_result": _submit_result,
+}
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    seed_data: SeedData,
+    mix: Dict[str, int],
+    deadline: float,
+    stats: Dict[str, EndpointStats],
+) -> None:
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    while time.perf_counter() < deadline:
+        name = random.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            response = await SCENARIOS[name](client, seed_data)
+            status_code: Optional[int] = response.status_code
+        except httpx.HTTPError:
+            status_code = None
+        stats[name].record(time.perf_counter() - started, status_code)
+
+
+def build_report(
+    args: argparse.Namespace, mix: Dict[str, int], stats: Dict[str, EndpointStats], elapsed: float
+) -> dict:
+    endpoints = {}
+    for name, endpoint in sorted(stats.items()):
+        latencies = sorted(endpoint.latencies)
+        endpoints[name] = {
+            "requests": len(latencies),
+            "errors": endpoint.errors,
+            "throughput_rps": round(len(latencies) / elapsed, 2),
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "status_codes": {str(code): n for code, n in sorted(endpoint.status_codes.items())},
+        }
+    total = sum(e["requests"] for e in endpoints.values())
+    return {
+        "label": args.label,
+        "base_url": args.base_url,
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {
+            "duration_s": args.duration,
+            "concurrency": args.concurrency,
+            "users": args.users,
+            "quizzes": args.quizzes,
+            "questions_per_quiz": args.questions,
+            "seed": args.seed,
+            "mix": mix,
+        },
+        "elapsed_s": round(elapsed, 3),
+        "total_requests": total,
+        "total_errors": sum(e["errors"] for e in endpoints.values()),
+        "throughput_rps": round(total / elapsed, 2) if elapsed else 0.0,
+        "endpoints": endpoints,
+    }
+
+
+def parse_mix(value: Optional[str]) -> Dict[str, int]:
+    """Parse `name=weight,name=weight`; unknown scenario names are rejected."""
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"Unknown scenario '{name}'")
+        mix[name] = int(weight)
+    return mix
+
+
+async def run(args: argparse.Namespace) -> dict:
+    random.seed(args.seed)
+    mix = parse_mix(args.mix)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        seed_data = await seed(client, args)
+        if args.warmup > 0:
+            await asyncio.gather(
+                *(
+                    worker(client, seed_data, mix, time.perf_counter() + args.warmup, defaultdict(EndpointStats))
+                    for _ in range(args.concurrency)
+                )
+            )
+
+        stats: Dict[str, EndpointStats] = defaultdict(EndpointStats)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(worker(client, seed_data, mix, deadline, stats) for _ in range(args.concurrency))
+        )
+        elapsed = time.perf_counter() - started
+    return build_report(args, mix, stats, elapsed)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Drive a load-test mix against the quiz API.")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds before the run")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--users", type=int, default=10, help="Users to register for logins")
+    parser.add_argument("--quizzes", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=20, help="Questions per quiz")
+    parser.add_argument("--options", type=int, default=4, help="Options per question")
+    parser.add_argument("--mix", help="Weights, e.g. 'get_quiz=50,submit_result=50'")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible mixes")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--label", default="", help="Free-form tag, e.g. release or database")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(run(args))
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+        print(f"Report written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
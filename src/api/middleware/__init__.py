@@ -0,0 +1,11 @@
+from .query_stats import QueryStatsMiddleware
+from .tracing import TracingMiddleware
+from .profiling import ProfilingMiddleware
+from .idempotency import IdempotencyMiddleware
+
+__all__ = [
+    "QueryStatsMiddleware",
+    "TracingMiddleware",
+    "ProfilingMiddleware",
+    "IdempotencyMiddleware",
+]
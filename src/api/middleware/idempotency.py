@@ -0,0 +1,162 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import time
+from typing import List, Optional, Sequence
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.cache import TTLStore, cache_store
+
+IDEMPOTENCY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_LOCK_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_LOCK_TTL_SECONDS", "30"))
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "5"))
+IDEMPOTENCY_MAX_RESPONSE_BYTES = int(os.getenv("IDEMPOTENCY_MAX_RESPONSE_BYTES", "65536"))
+
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+MAX_KEY_LENGTH = 255
+# Bodies of these paths are streamed and can be far larger than memory; they
+# are not buffered to be fingerprinted, so a key sent to them is rejected
+STREAMING_PATHS = ("/api/quizzes/import",)
+
+
+class IdempotencyMiddleware:
+    """Replay the stored response of a write request retried with the same `Idempotency-Key`.
+
+    The first request with a key runs the handler and, when it succeeds (2xx),
+    its response is stored for `ttl` seconds. A retry with the same key gets
+    that response back with `Idempotent-Replayed: true`, without running the
+    handler. While the first request is in flight, duplicates wait up to
+    `wait` seconds for its response and otherwise get 409. Reusing a key with a
+    different request body is rejected with 422. Keys are scoped to the
+    method, path and Authorization header. Requests to `streaming_paths` with
+    a key get 400, since their bodies are not buffered.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: Optional[TTLStore] = None,
+        ttl: float = IDEMPOTENCY_TTL_SECONDS,
+        lock_ttl: float = IDEMPOTENCY_LOCK_TTL_SECONDS,
+        wait: float = IDEMPOTENCY_WAIT_SECONDS,
+        max_response_bytes: int = IDEMPOTENCY_MAX_RESPONSE_BYTES,
+        streaming_paths: Sequence[str] = STREAMING_PATHS,
+    ):
+        self.app = app
+        self.store = store or cache_store
+        self.ttl = ttl
+        self.lock_ttl = lock_ttl
+        self.wait = wait
+        self.max_response_bytes = max_response_bytes
+        self.streaming_paths = frozenset(streaming_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in WRITE_METHODS:
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        idempotency_key = headers.get("idempotency-key")
+        if idempotency_key is None:
+            await self.app(scope, receive, send)
+            return
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            await JSONResponse({"detail": "Invalid Idempotency-Key"}, 400)(scope, receive, send)
+            return
+        if scope["path"].rstrip("/") in self.streaming_paths:
+            await JSONResponse(
+                {"detail": "Idempotency-Key is not supported for streamed uploads"}, 400
+            )(scope, receive, send)
+            return
+
+        body = await self._read_body(receive)
+        key = "idempotency:" + hashlib.sha256(
+            "\n".join(
+                (scope["method"], scope["path"], headers.get("authorization", ""), idempotency_key)
+            ).encode()
+        ).hexdigest()
+        fingerprint = hashlib.sha256(scope.get("query_string", b"") + b"?" + body).hexdigest()
+
+        deadline = time.monotonic() + self.wait
+        while True:
+            stored = await self.store.get(key)
+            if stored is not None:
+                await self._replay(json.loads(stored), fingerprint, scope, receive, send)
+                return
+            if await self.store.add(key + ":lock", b"1", self.lock_ttl):
+                break
+            if time.monotonic() >= deadline:
+                await JSONResponse(
+                    {"detail": "A request with this Idempotency-Key is in progress"},
+                    409,
+                    headers={"Retry-After": "1"},
+                )(scope, receive, send)
+                return
+            await asyncio.sleep(0.05)
+
+        try:
+            await self._run(scope, body, receive, send, key, fingerprint)
+        finally:
+            await self.store.delete(key + ":lock")
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    async def _run(
+        self, scope: Scope, body: bytes, receive: Receive, send: Send, key: str, fingerprint: str
+    ) -> None:
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+        size = 0
+
+        async def capture(message: Message) -> None:
+            nonlocal start, size
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body" and size <= self.max_response_bytes:
+                chunks.append(message.get("body", b""))
+                size += len(chunks[-1])
+            await send(message)
+
+        await self.app(scope, replay_receive, capture)
+
+        if start is None or not 200 <= start["status"] < 300 or size > self.max_response_bytes:
+            return
+        record = {
+            "fingerprint": fingerprint,
+            "status": start["status"],
+            "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in start.get("headers", [])],
+            "body": base64.b64encode(b"".join(chunks)).decode(),
+        }
+        await self.store.set(key, json.dumps(record).encode(), self.ttl)
+
+    @staticmethod
+    async def _replay(record: dict, fingerprint: str, scope: Scope, receive: Receive, send: Send) -> None:
+        if record["fingerprint"] != fingerprint:
+            await JSONResponse(
+                {"detail": "Idempotency-Key was already used with a different request"}, 422
+            )(scope, receive, send)
+            return
+        headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in record["headers"]]
+        headers.append((b"idempotent-replayed", b"true"))
+        await send({"type": "http.response.start", "status": record["status"], "headers": headers})
+        await send({"type": "http.response.body", "body": base64.b64decode(record["body"])})
@@ -0,0 +1,67 @@
+import random
+import re
+import threading
+from typing import Optional
+from urllib.parse import parse_qs
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.observability import profiling
+from ...infrastructure.observability.profiling import SamplingProfiler, is_profiling_token
+
+_REQUEST_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class ProfilingMiddleware:
+    """Run selected requests under the sampling profiler and store a speedscope profile.
+
+    A request is profiled when it carries `X-Profile: <PROFILING_TOKEN>` (or
+    `?profile=<PROFILING_TOKEN>`), or at random with probability PROFILING_SAMPLE_RATE.
+    The profile is stored under the request id (`X-Request-Id` when supplied) and
+    the id is returned in the `X-Profile-Id` response header.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    def _should_profile(self, scope: Scope, headers: Headers) -> bool:
+        if is_profiling_token(headers.get("x-profile")):
+            return True
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+        if is_profiling_token((query.get("profile") or [None])[0]):
+            return True
+        return profiling.PROFILING_SAMPLE_RATE > 0 and random.random() < profiling.PROFILING_SAMPLE_RATE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if not self._should_profile(scope, headers):
+            await self.app(scope, receive, send)
+            return
+
+        request_id: Optional[str] = headers.get("x-request-id")
+        if not request_id or not _REQUEST_ID.match(request_id):
+            request_id = uuid4().hex
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = request_id
+            await send(message)
+
+        profiler = SamplingProfiler(
+            thread_id=threading.get_ident(), interval=profiling.PROFILING_INTERVAL_MS / 1000
+        )
+        with profiler:
+            await self.app(scope, receive, send_with_profile_id)
+
+        await run_in_threadpool(
+            profiling.profile_store.save,
+            request_id,
+            profiler.to_speedscope(f"{scope['method']} {scope['path']}"),
+        )
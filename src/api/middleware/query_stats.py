@@ -0,0 +1,48 @@
+import logging
+import os
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.observability import track_queries
+
+logger = logging.getLogger(__name__)
+
+N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_STATS_N_PLUS_ONE_THRESHOLD", "5"))
+
+
+class QueryStatsMiddleware:
+    """Report the number of SQL statements and DB time spent on each request.
+
+    Adds `X-DB-Query-Count` and `X-DB-Query-Time-Ms` response headers and logs a
+    warning when the same statement runs `n_plus_one_threshold` times or more.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Query-Count"] = str(stats.count)
+                    headers["X-DB-Query-Time-Ms"] = f"{stats.total_time_ms:.2f}"
+                await send(message)
+
+            await self.app(scope, receive, send_with_stats)
+
+        for statement, times in stats.repeated(self.n_plus_one_threshold).items():
+            logger.warning(
+                "Possible N+1 on %s %s: statement executed %d times: %s",
+                scope["method"],
+                scope["path"],
+                times,
+                " ".join(statement.split())[:200],
+            )
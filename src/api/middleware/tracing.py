@@ -0,0 +1,43 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...infrastructure.observability.tracing import tracer
+
+
+class TracingMiddleware:
+    """Open a root `server` span per HTTP request and return its trace id.
+
+    Spans started further down (use cases, repositories, SQL statements, password
+    hashing) nest under it, so the time not covered by child spans is spent in the
+    handler itself and in response serialization.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        with tracer.start_span(
+            f"{scope['method']} {scope['path']}",
+            kind="server",
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        ) as span:
+            if span is None:
+                # Tracing was switched off after the check above
+                await self.app(scope, receive, send)
+                return
+
+            async def send_with_trace(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    route = scope.get("route")
+                    if route is not None and hasattr(route, "path"):
+                        span.name = f"{scope['method']} {route.path}"
+                        span.set_attribute("http.route", route.path)
+                    MutableHeaders(scope=message)["X-Trace-Id"] = span.trace_id
+                await send(message)
+
+            await self.app(scope, receive, send_with_trace)
@@ -0,0 +1,27 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+
+Position = Tuple[datetime, UUID]
+
+
+def encode_cursor(taken_at: datetime, result_id: UUID) -> str:
+    """Opaque keyset cursor pointing just past the given row."""
+    raw = f"{taken_at.isoformat()}|{result_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Position]:
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        taken_at, result_id = raw.split("|")
+        return datetime.fromisoformat(taken_at), UUID(result_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        )
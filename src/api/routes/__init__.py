@@ -4,6 +4,10 @@ from .journeys import router as journeys_router
 from .quizzes import router as quizzes_router
 from .questions import router as questions_router
 from .results import router as results_router
+from .attempts import router as attempts_router
+from .live import router as live_router
+from .debug import router as debug_router
+from .health import router as health_router
 
 __all__ = [
     "auth_router",
@@ -12,4 +16,8 @@ __all__ = [
     "quizzes_router",
     "questions_router",
     "results_router",
+    "attempts_router",
+    "live_router",
+    "debug_router",
+    "health_router",
 ]
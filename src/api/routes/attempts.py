@@ -0,0 +1,180 @@
+from datetime import datetime, timezone
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated
+from uuid import UUID
+
+from ...application.use_cases import AttemptUseCases, ResultUseCases
+from ...application.use_cases.attempt_use_cases import (
+    AttemptInProgressError,
+    AttemptStoreFullError,
+    get_attempt_use_cases,
+)
+from ...application.use_cases.result_use_cases import get_result_use_cases
+from ...domain.entities.attempt import AnswerKey, Attempt
+from ...domain.entities.quiz import FeedbackMode
+from ..schemas import (
+    AttemptAnswer,
+    AttemptAnswerResponse,
+    AttemptCreate,
+    AttemptOptionResponse,
+    AttemptQuestionResponse,
+    AttemptResponse,
+    ResultResponse,
+)
+
+router = APIRouter(prefix="/api/attempts", tags=["attempts"])
+AttemptUseCasesDep = Annotated[AttemptUseCases, Depends(get_attempt_use_cases)]
+ResultUseCasesDep = Annotated[ResultUseCases, Depends(get_result_use_cases)]
+
+
+def _store_full(error: AttemptStoreFullError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": "5"},
+    )
+
+
+async def _get_attempt(attempt_id: UUID, attempt_use_cases: AttemptUseCases) -> Attempt:
+    attempt = await attempt_use_cases.get_attempt(attempt_id)
+    if not attempt:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Attempt not found or expired"
+        )
+    return attempt
+
+
+def _attempt_response(
+    attempt: Attempt, key: AnswerKey, attempt_use_cases: AttemptUseCases
+) -> AttemptResponse:
+    return AttemptResponse(
+        id=attempt.id,
+        quiz_id=attempt.quiz_id,
+        total_questions=key.total_questions,
+        feedback_mode=key.feedback_mode,
+        started_at=attempt.started_at,
+        expires_at=datetime.fromtimestamp(
+            attempt_use_cases.store.expires_at(attempt), tz=timezone.utc
+        ),
+        questions=[
+            AttemptQuestionResponse(
+                id=question.id,
+                text=question.text,
+                options=[
+                    AttemptOptionResponse(id=opt.id, text=opt.text, image_url=opt.image_url)
+                    for opt in options
+                ],
+            )
+            for question, options in key.paper(attempt.id)
+        ],
+    )
+
+
+@router.post("/", response_model=AttemptResponse, status_code=status.HTTP_201_CREATED)
+async def start_attempt(
+    attempt_data: AttemptCreate,
+    attempt_use_cases: AttemptUseCasesDep,
+) -> AttemptResponse:
+    """Start taking a quiz; answers are then checked one by one and stored when finished.
+
+    The response lists the questions in this attempt's order, shuffled when
+    the quiz asks for it.
+    """
+    attempt = Attempt(
+        quiz_id=attempt_data.quiz_id,
+        respondent_name=attempt_data.respondent_name,
+        user_id=attempt_data.user_id,
+    )
+    try:
+        key = await attempt_use_cases.start_attempt(attempt)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except AttemptStoreFullError as e:
+        raise _store_full(e)
+    if not key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+
+    return _attempt_response(attempt, key, attempt_use_cases)
+
+
+@router.get("/{attempt_id}", response_model=AttemptResponse)
+async def get_attempt(
+    attempt_id: UUID,
+    attempt_use_cases: AttemptUseCasesDep,
+) -> AttemptResponse:
+    """Get an attempt in progress, e.g. to resume it, with its questions in the same order."""
+    attempt = await _get_attempt(attempt_id, attempt_use_cases)
+    key = await attempt_use_cases.get_answer_key(attempt.quiz_id)
+    if not key:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+
+    return _attempt_response(attempt, key, attempt_use_cases)
+
+
+@router.post("/{attempt_id}/answers", response_model=AttemptAnswerResponse)
+async def answer_question(
+    attempt_id: UUID,
+    answer_data: AttemptAnswer,
+    attempt_use_cases: AttemptUseCasesDep,
+) -> AttemptAnswerResponse:
+    """Record the answer to one question, checked against the cached answer key.
+
+    In immediate feedback mode the response says whether the answer is correct
+    and which option is. A question keeps its first answer.
+    """
+    attempt = await _get_attempt(attempt_id, attempt_use_cases)
+    try:
+        answer, key, recorded = await attempt_use_cases.check_answer(
+            attempt, answer_data.question_id, answer_data.option_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except AttemptStoreFullError as e:
+        raise _store_full(e)
+
+    reveal = key.feedback_mode == FeedbackMode.IMEDIATO
+    return AttemptAnswerResponse(
+        question_id=answer.question_id,
+        selected_option_id=answer.selected_option_id,
+        is_correct=answer.is_correct if reveal else None,
+        correct_option_id=key.correct_options[answer.question_id] if reveal else None,
+        already_answered=not recorded,
+    )
+
+
+@router.post("/{attempt_id}/finish", response_model=ResultResponse)
+async def finish_attempt(
+    attempt_id: UUID,
+    attempt_use_cases: AttemptUseCasesDep,
+    result_use_cases: ResultUseCasesDep,
+) -> ResultResponse:
+    """Score the attempt and store the result with all its answers.
+
+    Finishing an attempt that was already finished returns its result. The
+    response includes the result's percentile rank among the quiz's results.
+    """
+    try:
+        result = await attempt_use_cases.finish_attempt(attempt_id)
+    except AttemptInProgressError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail=str(e), headers={"Retry-After": "1"}
+        )
+    if not result:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Attempt not found or expired"
+        )
+
+    return ResultResponse(
+        id=result.id,
+        user_id=result.user_id,
+        respondent_name=result.respondent_name,
+        quiz_id=result.quiz_id,
+        score=result.score,
+        total_questions=result.total_questions,
+        taken_at=result.taken_at,
+        percentile_rank=await result_use_cases.get_percentile_rank(result),
+    )
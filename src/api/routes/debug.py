@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Header, HTTPException, status
+from typing import Optional
+
+from ...infrastructure.observability import profiling
+from ...infrastructure.observability.loop_monitor import loop_monitor
+
+router = APIRouter(prefix="/api/debug", tags=["debug"])
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, x_profile: Optional[str] = Header(None)) -> dict:
+    """Download a stored speedscope profile. Requires `X-Profile: <PROFILING_TOKEN>`."""
+    if not profiling.is_profiling_token(x_profile):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    profile = profiling.profile_store.load(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return profile
+
+
+@router.get("/event-loop")
+async def get_event_loop_stats(x_profile: Optional[str] = Header(None)) -> dict:
+    """Event loop lag percentiles. Stacks of recent blocking calls require `X-Profile`."""
+    return loop_monitor.snapshot(include_stacks=profiling.is_profiling_token(x_profile))
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Response, status
+
+from ...infrastructure.health import health_checker
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get("/live")
+async def liveness() -> dict:
+    """Liveness probe: the process is up and serving requests."""
+    return {"status": "alive"}
+
+
+@router.get("/ready")
+async def readiness(response: Response) -> dict:
+    """Readiness probe: DB round trip, pool saturation, upload dir and loop lag.
+
+    Returns 503 when any check fails so load balancers stop routing to this node.
+    Results are cached for HEALTH_CACHE_TTL_SECONDS.
+    """
+    results = await health_checker.run()
+    ready = all(result.healthy for result in results)
+    if not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return {
+        "status": "ready" if ready else "unavailable",
+        "checks": {result.name: result.to_dict() for result in results},
+    }
@@ -1,16 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Annotated, List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Annotated, List, Literal
 from uuid import UUID
 
-from ...application.use_cases import JourneyUseCases
+from ...application.use_cases import JourneyUseCases, ResultUseCases
 from ...application.use_cases.journey_use_cases import get_journey_use_cases
+from ...application.use_cases.result_use_cases import get_result_use_cases
 from ...domain.entities.journey import Journey
 from ...domain.entities.user import User
-from ..schemas import JourneyCreate, JourneyResponse, JourneyUpdate
+from ..schemas import (
+    ActivityResponse,
+    JourneyCreate,
+    JourneyProgressResponse,
+    JourneyResponse,
+    JourneyUpdate,
+    QuizProgressResponse,
+)
 from ..dependencies import get_current_active_user
 
 router = APIRouter(prefix="/api/journeys", tags=["journeys"])
 JourneyUseCasesDep = Annotated[JourneyUseCases, Depends(get_journey_use_cases)]
+ResultUseCasesDep = Annotated[ResultUseCases, Depends(get_result_use_cases)]
 
 
 @router.post("/", response_model=JourneyResponse, status_code=status.HTTP_201_CREATED)
@@ -90,6 +99,64 @@ async def get_journey(
     )
 
 
+@router.get("/{journey_id}/progress", response_model=JourneyProgressResponse)
+async def get_journey_progress(
+    journey_id: UUID,
+    journey_use_cases: JourneyUseCasesDep,
+    result_use_cases: ResultUseCasesDep,
+    current_user: User = Depends(get_current_active_user),
+) -> JourneyProgressResponse:
+    """The current user's best score, attempts and completion for every quiz of a journey.
+
+    Computed in one grouped query and cached per user until they record a new result.
+    """
+    journey = await journey_use_cases.get_journey(journey_id)
+    if not journey:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Journey not found"
+        )
+
+    progress = await result_use_cases.get_journey_progress(journey_id, current_user.id)
+    return JourneyProgressResponse(
+        journey_id=journey_id,
+        total_quizzes=len(progress),
+        completed_quizzes=sum(1 for p in progress if p.completed),
+        quizzes=[QuizProgressResponse.model_validate(p) for p in progress],
+    )
+
+
+@router.get("/{journey_id}/activity", response_model=ActivityResponse)
+async def get_journey_activity(
+    journey_id: UUID,
+    days: int = Query(30, ge=1, le=366),
+    granularity: Literal["hour", "day"] = Query("day"),
+    journey_use_cases: JourneyUseCasesDep = ...,
+    result_use_cases: ResultUseCasesDep = ...,
+    current_user: User = Depends(get_current_active_user),
+) -> ActivityResponse:
+    """Attempts and average score per UTC hour or day across the journey's quizzes.
+
+    Read from the activity rollups, like the quiz activity endpoint.
+    """
+    journey = await journey_use_cases.get_journey(journey_id)
+    if not journey:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Journey not found"
+        )
+
+    if journey.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this journey",
+        )
+
+    try:
+        buckets = await result_use_cases.get_activity(days, granularity, journey_id=journey_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ActivityResponse.from_buckets(granularity, buckets)
+
+
 @router.put("/{journey_id}", response_model=JourneyResponse)
 async def update_journey(
     journey_id: UUID,
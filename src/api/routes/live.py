@@ -0,0 +1,203 @@
+import json
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from sqlalchemy.orm import Session
+from typing import Annotated, Optional
+from uuid import UUID
+
+from ...application.use_cases import QuizUseCases, ResultUseCases
+from ...application.use_cases.quiz_use_cases import get_quiz_use_cases
+from ...application.use_cases.result_use_cases import get_result_use_cases
+from ...domain.entities.user import User
+from ...infrastructure.database import get_db
+from ...infrastructure.live_rooms import Connection, LiveRoom, RoomError, live_rooms
+from ..dependencies import get_current_active_user, get_current_user
+from ..schemas import LiveRoomCreate, LiveRoomResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/live", tags=["live"])
+QuizUseCasesDep = Annotated[QuizUseCases, Depends(get_quiz_use_cases)]
+ResultUseCasesDep = Annotated[ResultUseCases, Depends(get_result_use_cases)]
+
+# Application close codes sent before the socket is used
+ROOM_NOT_FOUND = 4404
+NOT_AUTHORIZED = 4403
+
+
+def _connection(websocket: WebSocket) -> Connection:
+    return Connection(websocket.send_text, lambda code: websocket.close(code=code))
+
+
+@router.post("/rooms", response_model=LiveRoomResponse, status_code=status.HTTP_201_CREATED)
+async def create_room(
+    room_data: LiveRoomCreate,
+    quiz_use_cases: QuizUseCasesDep,
+    current_user: User = Depends(get_current_active_user),
+) -> LiveRoomResponse:
+    """Open a live room for one of your quizzes; participants join with its code."""
+    quiz = await quiz_use_cases.get_quiz(room_data.quiz_id, include_questions=True)
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+    if quiz.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to host this quiz",
+        )
+    if not quiz.questions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Quiz has no questions"
+        )
+    try:
+        room = live_rooms.create(quiz, current_user.id)
+    except RoomError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+
+    return LiveRoomResponse(
+        code=room.code,
+        quiz_id=quiz.id,
+        total_questions=len(quiz.questions),
+        host_url=f"{router.prefix}/rooms/{room.code}/host",
+        play_url=f"{router.prefix}/rooms/{room.code}/play",
+    )
+
+
+async def _finish(room: LiveRoom, result_use_cases: ResultUseCases) -> None:
+    """Store the scores, then announce them and close the room.
+
+    The room is only marked finished once the results are stored; when storing
+    fails it stays open and `finish` can be sent again.
+    """
+    results = room.final_results()
+    try:
+        # Participant ids are the result ids, so a retry does not store them twice
+        await result_use_cases.create_results(results, skip_existing=True)
+    except Exception as e:
+        logger.exception("Room %s: storing %d results failed", room.code, len(results))
+        raise RoomError("Could not store the results, send finish again to retry") from e
+    room.finish(results)
+    await room.flush()
+    live_rooms.close(room.code)
+
+
+@router.websocket("/rooms/{code}/host")
+async def host_room(
+    websocket: WebSocket,
+    code: str,
+    result_use_cases: ResultUseCasesDep,
+    token: str = Query(...),
+    db: Session = Depends(get_db),
+) -> None:
+    """Drive the room: send {"action": "next" | "reveal" | "finish"}.
+
+    `finish` stores one result per participant in a single batch and closes
+    the room; so does the last host disconnecting without it. Errors are
+    answered with {"type": "error", "detail": ...}.
+    """
+    await websocket.accept()
+    room = live_rooms.get(code)
+    try:
+        user = await get_current_user(token=token, db=db)
+    except HTTPException:
+        user = None
+    finally:
+        # Do not keep a pooled connection checked out for the life of the socket
+        db.close()
+    if room is None:
+        await websocket.close(code=ROOM_NOT_FOUND)
+        return
+    if user is None or user.id != room.host_id:
+        await websocket.close(code=NOT_AUTHORIZED)
+        return
+
+    connection = _connection(websocket)
+    room.hosts.append(connection)
+    try:
+        while True:
+            command = await websocket.receive_json()
+            action = command.get("action") if isinstance(command, dict) else None
+            try:
+                if action == "next":
+                    room.next_question()
+                elif action == "reveal":
+                    room.reveal()
+                elif action == "finish":
+                    await _finish(room, result_use_cases)
+                    return
+                else:
+                    raise RoomError(f"Unknown action {action!r}")
+            except RoomError as e:
+                connection.offer(json.dumps({"type": "error", "detail": str(e)}))
+    except WebSocketDisconnect:
+        pass
+    finally:
+        connection.close()
+        if connection in room.hosts:
+            room.hosts.remove(connection)
+        last_host = all(host.closed for host in room.hosts)
+        if last_host and not room.finished and live_rooms.get(code) is room:
+            try:
+                await _finish(room, result_use_cases)
+            except RoomError:
+                # Already logged; the room stays open for the host to reconnect
+                pass
+
+
+@router.websocket("/rooms/{code}/play")
+async def play_room(
+    websocket: WebSocket,
+    code: str,
+    name: str = Query(..., min_length=1, max_length=200),
+    token: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+) -> None:
+    """Join as a participant and answer with {"question_id": ..., "option_id": ...}.
+
+    Pass `token` to have the result stored as yours; without it the
+    participant plays anonymously. Messages received: welcome, answered,
+    question, counts (at most every LIVE_COUNTS_INTERVAL_MS), reveal and
+    finished. Clients that fall LIVE_CLIENT_QUEUE_SIZE messages behind are
+    disconnected with code 1013.
+    """
+    await websocket.accept()
+    room = live_rooms.get(code)
+    user: Optional[User] = None
+    try:
+        if token is not None:
+            user = await get_current_user(token=token, db=db)
+    except HTTPException:
+        await websocket.close(code=NOT_AUTHORIZED)
+        return
+    finally:
+        db.close()
+    if room is None:
+        await websocket.close(code=ROOM_NOT_FOUND)
+        return
+    connection = _connection(websocket)
+    try:
+        # Only ids of authenticated users reach the results table
+        participant = room.join(name, user.id if user else None, connection)
+    except RoomError:
+        connection.drop(ROOM_NOT_FOUND)
+        return
+
+    try:
+        while True:
+            message = await websocket.receive_json()
+            try:
+                question_id = UUID(message["question_id"])
+                accepted = room.answer(participant, question_id, UUID(message["option_id"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+            connection.offer(
+                json.dumps(
+                    {"type": "answered", "question_id": str(question_id), "accepted": accepted}
+                )
+            )
+    except WebSocketDisconnect:
+        pass
+    finally:
+        connection.close()
+        room.leave(participant)
@@ -2,30 +2,47 @@ import os
 import uuid as uuid_mod
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, UploadFile, status
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import func
-from typing import Annotated, List
+from typing import Annotated, List, Literal
 from uuid import UUID
 import math
 
 from ...infrastructure.database import get_db
 from ...infrastructure.repositories import QuizRepositoryImpl
 from ...infrastructure.database.models import QuizModel
-from ...application.use_cases import QuizUseCases, JourneyUseCases, QuestionUseCases
+from ...infrastructure.database.quiz_import import (
+    QUIZ_IMPORT_BATCH_SIZE,
+    LineSplitter,
+    QuizImporter,
+)
+from ...application.use_cases import QuizUseCases, JourneyUseCases, QuestionUseCases, ResultUseCases
 from ...application.use_cases.quiz_use_cases import get_quiz_use_cases
 from ...application.use_cases.journey_use_cases import get_journey_use_cases
 from ...application.use_cases.question_use_cases import get_question_use_cases
+from ...application.use_cases.result_use_cases import get_result_use_cases
 from ...domain.entities.quiz import Quiz
 from ...domain.entities.question import Question
 from ...domain.entities.user import User
-from ..schemas import QuizCreate, QuizResponse, QuizUpdate, QuizzesListResponse
+from ..schemas import (
+    ActivityResponse,
+    QuestionItemStatsResponse,
+    QuizCreate,
+    QuizImportLineError,
+    QuizImportResponse,
+    QuizResponse,
+    QuizUpdate,
+    QuizzesListResponse,
+)
 from ..dependencies import get_current_active_user
 
 router = APIRouter(prefix="/api/quizzes", tags=["quizzes"])
 QuizUseCasesDep = Annotated[QuizUseCases, Depends(get_quiz_use_cases)]
 JourneyUseCasesDep = Annotated[JourneyUseCases, Depends(get_journey_use_cases)]
 QuestionUseCasesDep = Annotated[QuestionUseCases, Depends(get_question_use_cases)]
+ResultUseCasesDep = Annotated[ResultUseCases, Depends(get_result_use_cases)]
 
 
 @router.post("/", response_model=QuizResponse, status_code=status.HTTP_201_CREATED)
@@ -59,6 +76,8 @@ async def create_quiz(
         feedback_mode=quiz_data.feedback_mode,
         difficulty=quiz_data.difficulty,
         image_url=quiz_data.image_url,
+        shuffle_questions=quiz_data.shuffle_questions,
+        shuffle_options=quiz_data.shuffle_options,
     )
 
     created_quiz = await quiz_use_cases.create_quiz(quiz)
@@ -90,11 +109,48 @@ async def create_quiz(
         feedback_mode=created_quiz.feedback_mode,
         difficulty=created_quiz.difficulty,
         image_url=created_quiz.image_url,
+        shuffle_questions=created_quiz.shuffle_questions,
+        shuffle_options=created_quiz.shuffle_options,
         created_at=created_quiz.created_at,
         updated_at=created_quiz.updated_at,
     )
 
 
+@router.post("/import", response_model=QuizImportResponse)
+async def import_quizzes(
+    request: Request,
+    batch_size: int = Query(QUIZ_IMPORT_BATCH_SIZE, ge=1, le=10_000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> QuizImportResponse:
+    """Import quizzes from an NDJSON body, one QuizCreate object per line.
+
+    The body is parsed as it arrives and valid quizzes are written
+    `batch_size` at a time, each batch in one transaction. Invalid lines are
+    skipped and listed in the response with their line numbers.
+    """
+    importer = QuizImporter(db, QuizCreate, user_id=current_user.id, batch_size=batch_size)
+    lines = LineSplitter()
+    async for chunk in request.stream():
+        for number, line in lines.feed(chunk):
+            importer.add(number, line)
+            if importer.full:
+                await run_in_threadpool(importer.flush)
+    for number, line in lines.close():
+        importer.add(number, line)
+    await run_in_threadpool(importer.flush)
+
+    report = importer.report
+    return QuizImportResponse(
+        lines=report.lines,
+        imported_quizzes=report.imported_quizzes,
+        imported_questions=report.imported_questions,
+        failed=report.failed,
+        errors=[QuizImportLineError(line=e.line, errors=e.errors) for e in report.errors],
+        errors_truncated=report.errors_truncated,
+    )
+
+
 @router.get("/latest", response_model=QuizzesListResponse, status_code=status.HTTP_200_OK)
 async def get_latest_quizzes(page: int = 1, db: Session = Depends(get_db)) -> QuizzesListResponse:
     """Public endpoint: return latest quizzes ordered by created_at desc, paginated (20 per page).
@@ -130,6 +186,8 @@ async def get_latest_quizzes(page: int = 1, db: Session = Depends(get_db)) -> Qu
             "feedback_mode": q.feedback_mode,
             "difficulty": q.difficulty,
             "image_url": q.image_url,
+            "shuffle_questions": q.shuffle_questions,
+            "shuffle_options": q.shuffle_options,
             "created_at": q.created_at,
             "updated_at": q.updated_at,
             "questions": [],
@@ -179,6 +237,8 @@ async def get_my_created_quizzes(
             feedback_mode=quiz.feedback_mode,
             difficulty=quiz.difficulty,
             image_url=quiz.image_url,
+            shuffle_questions=quiz.shuffle_questions,
+            shuffle_options=quiz.shuffle_options,
             created_at=quiz.created_at,
             updated_at=quiz.updated_at,
         )
@@ -229,6 +289,8 @@ async def get_quizzes_by_journey(
             feedback_mode=quiz.feedback_mode,
             difficulty=quiz.difficulty,
             image_url=quiz.image_url,
+            shuffle_questions=quiz.shuffle_questions,
+            shuffle_options=quiz.shuffle_options,
             created_at=quiz.created_at,
             updated_at=quiz.updated_at,
         )
@@ -258,12 +320,73 @@ async def get_quiz(
         feedback_mode=quiz.feedback_mode,
         difficulty=quiz.difficulty,
         image_url=quiz.image_url,
+        shuffle_questions=quiz.shuffle_questions,
+        shuffle_options=quiz.shuffle_options,
         created_at=quiz.created_at,
         updated_at=quiz.updated_at,
         questions=quiz.questions or [],
     )
 
 
+@router.get("/{quiz_id}/item-analysis", response_model=List[QuestionItemStatsResponse])
+async def get_quiz_item_analysis(
+    quiz_id: UUID,
+    quiz_use_cases: QuizUseCasesDep,
+    question_use_cases: QuestionUseCasesDep,
+    current_user: User = Depends(get_current_active_user),
+) -> List[QuestionItemStatsResponse]:
+    """Per-question difficulty, discrimination and option frequencies, for the quiz author.
+
+    Computed by the `src.infrastructure.analytics.item_analysis` batch job;
+    questions without analyzed answers are omitted.
+    """
+    quiz = await quiz_use_cases.get_quiz(quiz_id)
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+    if quiz.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this quiz's analysis",
+        )
+
+    stats = await question_use_cases.get_item_stats(quiz_id)
+    return [QuestionItemStatsResponse.model_validate(s) for s in stats]
+
+
+@router.get("/{quiz_id}/activity", response_model=ActivityResponse)
+async def get_quiz_activity(
+    quiz_id: UUID,
+    days: int = Query(30, ge=1, le=366),
+    granularity: Literal["hour", "day"] = Query("day"),
+    quiz_use_cases: QuizUseCasesDep = ...,
+    result_use_cases: ResultUseCasesDep = ...,
+    current_user: User = Depends(get_current_active_user),
+) -> ActivityResponse:
+    """Attempts and average score per UTC hour or day over the last `days` days, for the author.
+
+    Read from the activity rollups, so the cost does not depend on the number
+    of results. Hourly buckets cover at most ROLLUP_HOURLY_RETENTION_DAYS days.
+    """
+    quiz = await quiz_use_cases.get_quiz(quiz_id)
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+    if quiz.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to view this quiz's activity",
+        )
+
+    try:
+        buckets = await result_use_cases.get_activity(days, granularity, quiz_id=quiz_id)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ActivityResponse.from_buckets(granularity, buckets)
+
+
 @router.put("/{quiz_id}", response_model=QuizResponse)
 async def update_quiz(
     quiz_id: UUID,
@@ -300,6 +423,10 @@ async def update_quiz(
         quiz.difficulty = quiz_data.difficulty
     if quiz_data.image_url is not None:
         quiz.image_url = quiz_data.image_url
+    if quiz_data.shuffle_questions is not None:
+        quiz.shuffle_questions = quiz_data.shuffle_questions
+    if quiz_data.shuffle_options is not None:
+        quiz.shuffle_options = quiz_data.shuffle_options
     if quiz_data.journey_id is not None:
         new_journey = await journey_use_cases.get_journey(quiz_data.journey_id)
         if not new_journey or new_journey.user_id != current_user.id:
@@ -321,6 +448,8 @@ async def update_quiz(
             feedback_mode=updated_quiz.feedback_mode,
             difficulty=updated_quiz.difficulty,
             image_url=updated_quiz.image_url,
+            shuffle_questions=updated_quiz.shuffle_questions,
+            shuffle_options=updated_quiz.shuffle_options,
             created_at=updated_quiz.created_at,
             updated_at=updated_quiz.updated_at,
         )
@@ -417,6 +546,8 @@ async def upload_quiz_image(
         feedback_mode=updated_quiz.feedback_mode,
         difficulty=updated_quiz.difficulty,
         image_url=updated_quiz.image_url,
+        shuffle_questions=updated_quiz.shuffle_questions,
+        shuffle_options=updated_quiz.shuffle_options,
         created_at=updated_quiz.created_at,
         updated_at=updated_quiz.updated_at,
     )
@@ -1,31 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import Annotated, List
-from uuid import UUID, uuid4
+import asyncio
+import csv
+import io
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from typing import Annotated, AsyncIterator, Dict, Iterable, Iterator, List, Literal, Optional
+from uuid import UUID
 
 from ...application.use_cases import QuizUseCases, ResultUseCases
 from ...application.use_cases.quiz_use_cases import get_quiz_use_cases
 from ...application.use_cases.result_use_cases import get_result_use_cases
 from ...domain.entities.results import Result
+from ...domain.ids import uuid7
+from ...infrastructure.result_buffer import BufferFullError, result_buffer
+from ...infrastructure.result_feed import (
+    RESULTS_STREAM_KEEPALIVE_SECONDS,
+    Subscription,
+    result_feed,
+)
 from ...domain.entities.user import User
-from ..schemas.results import ResultCreate, ResultResponse, ResultsListResponse
+from ..schemas.results import (
+    LeaderboardEntry,
+    LeaderboardResponse,
+    QuizStatsResponse,
+    ResultCreate,
+    ResultResponse,
+    ResultRank,
+    ResultsListResponse,
+    ScoreBucket,
+)
 from ..dependencies import get_current_active_user
+from ..pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/api/results", tags=["results"])
 QuizUseCasesDep = Annotated[QuizUseCases, Depends(get_quiz_use_cases)]
 ResultUseCasesDep = Annotated[ResultUseCases, Depends(get_result_use_cases)]
 
 
+CURSOR_DESCRIPTION = "`next_cursor` of the previous page"
+
+
+def _next_cursor(results: List[Result], limit: int) -> Optional[str]:
+    """Cursor of the next page; `results` holds one row more than the page when there is one."""
+    if len(results) <= limit:
+        return None
+    last = results[limit - 1]
+    return encode_cursor(last.taken_at, last.id)
+
+
 @router.get("/me", response_model=ResultsListResponse)
 async def get_my_results(
-    skip: int = 0,
-    limit: int = 100,
-    result_use_cases: ResultUseCasesDep = ...,
+    result_use_cases: ResultUseCasesDep,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
     current_user: User = Depends(get_current_active_user),
 ) -> ResultsListResponse:
-    """Get all quiz results for the current user."""
+    """Get the current user's quiz results, newest first, one page at a time."""
     results = await result_use_cases.get_results_by_user(
-        user_id=current_user.id, skip=skip, limit=limit
+        user_id=current_user.id, skip=skip, limit=limit + 1, before=decode_cursor(cursor)
     )
+    total = await result_use_cases.count_results_by_user(current_user.id)
     items = [
         ResultResponse(
             id=r.id,
@@ -36,18 +71,24 @@ async def get_my_results(
             total_questions=r.total_questions,
             taken_at=r.taken_at,
         )
-        for r in results
+        for r in results[:limit]
     ]
-    return ResultsListResponse(items=items, total=len(items))
+    return ResultsListResponse(items=items, total=total, next_cursor=_next_cursor(results, limit))
 
 
 @router.post("/", response_model=ResultResponse, status_code=status.HTTP_201_CREATED)
 async def create_result(
     result_data: ResultCreate,
+    response: Response,
     quiz_use_cases: QuizUseCasesDep,
     result_use_cases: ResultUseCasesDep,
 ) -> ResultResponse:
-    """Submit a quiz result."""
+    """Submit a quiz result.
+
+    The response includes the result's percentile rank among the quiz's results.
+    With RESULTS_INGESTION_MODE=buffered the result is spooled and queued for a
+    batched insert, and the response is 202 Accepted with the assigned id.
+    """
     quiz = await quiz_use_cases.get_quiz(result_data.quiz_id)
 
     if not quiz:
@@ -56,7 +97,7 @@ async def create_result(
         )
 
     result = Result(
-        id=uuid4(),
+        id=uuid7(),
         user_id=result_data.user_id,
         respondent_name=result_data.respondent_name,
         quiz_id=result_data.quiz_id,
@@ -64,7 +105,22 @@ async def create_result(
         total_questions=result_data.total_questions,
     )
 
-    created = await result_use_cases.create_result(result)
+    if result_buffer.running:
+        try:
+            await result_buffer.submit(result)
+        except BufferFullError as e:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": "1"},
+            )
+        response.status_code = status.HTTP_202_ACCEPTED
+        created = result
+    else:
+        created = await result_use_cases.create_result(result)
+    percentile_rank = await result_use_cases.get_percentile_rank(
+        created, recorded=not result_buffer.running
+    )
     return ResultResponse(
         id=created.id,
         user_id=created.user_id,
@@ -73,18 +129,24 @@ async def create_result(
         score=created.score,
         total_questions=created.total_questions,
         taken_at=created.taken_at,
+        percentile_rank=percentile_rank,
     )
 
 
 @router.get("/quiz/{quiz_id}", response_model=ResultsListResponse)
 async def get_results_by_quiz(
     quiz_id: UUID,
-    skip: int = 0,
-    limit: int = 100,
-    quiz_use_cases: QuizUseCasesDep = ...,
-    result_use_cases: ResultUseCasesDep = ...,
+    quiz_use_cases: QuizUseCasesDep,
+    result_use_cases: ResultUseCasesDep,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description=CURSOR_DESCRIPTION),
 ) -> ResultsListResponse:
-    """Get all results for a specific quiz."""
+    """Get a quiz's results, newest first, one page at a time.
+
+    Pass the returned `next_cursor` to get the next page; unlike `skip`, it
+    costs the same however deep the page is. `total` counts all results.
+    """
     quiz = await quiz_use_cases.get_quiz(quiz_id)
 
     if not quiz:
@@ -92,7 +154,10 @@ async def get_results_by_quiz(
             status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
         )
 
-    results = await result_use_cases.get_results_by_quiz(quiz_id, skip=skip, limit=limit)
+    results = await result_use_cases.get_results_by_quiz(
+        quiz_id, skip=skip, limit=limit + 1, before=decode_cursor(cursor)
+    )
+    total = await result_use_cases.count_results_by_quiz(quiz_id)
     items = [
         ResultResponse(
             id=r.id,
@@ -103,6 +168,232 @@ async def get_results_by_quiz(
             total_questions=r.total_questions,
             taken_at=r.taken_at,
         )
-        for r in results
+        for r in results[:limit]
     ]
-    return ResultsListResponse(items=items, total=len(items))
+    return ResultsListResponse(items=items, total=total, next_cursor=_next_cursor(results, limit))
+
+
+EXPORT_CHUNK_ROWS = 1000
+
+
+def _csv_chunks(fieldnames: List[str], rows: Iterable[Dict]) -> Iterator[str]:
+    """CSV with a header row (even without rows), emitted every EXPORT_CHUNK_ROWS rows."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= EXPORT_CHUNK_ROWS:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _ndjson_chunks(rows: Iterable[Dict]) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str))
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+@router.get("/quiz/{quiz_id}/export")
+async def export_results(
+    quiz_id: UUID,
+    quiz_use_cases: QuizUseCasesDep,
+    result_use_cases: ResultUseCasesDep,
+    format: Literal["csv", "ndjson"] = Query("csv"),
+    include_answers: bool = Query(False, description="One row per answer instead of per result"),
+    current_user: User = Depends(get_current_active_user),
+) -> StreamingResponse:
+    """Stream every result of a quiz as CSV or NDJSON, for the quiz author.
+
+    Rows are read from a server-side cursor and written out in chunks, so the
+    response size is not limited by server memory.
+    """
+    quiz = await quiz_use_cases.get_quiz(quiz_id)
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+    if quiz.user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to export this quiz's results",
+        )
+
+    rows = result_use_cases.export_results(quiz_id, include_answers=include_answers)
+    if format == "csv":
+        fieldnames = result_use_cases.export_columns(include_answers=include_answers)
+        body, media_type = _csv_chunks(fieldnames, rows), "text/csv"
+    else:
+        body, media_type = _ndjson_chunks(rows), "application/x-ndjson"
+    filename = f"results-{quiz_id}{'-answers' if include_answers else ''}.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/quiz/{quiz_id}/stats", response_model=QuizStatsResponse)
+async def get_quiz_stats(
+    quiz_id: UUID,
+    quiz_use_cases: QuizUseCasesDep,
+    result_use_cases: ResultUseCasesDep,
+    bucket_size: int = Query(10, ge=1, le=100),
+) -> QuizStatsResponse:
+    """Attempt count, score summary and histogram from the maintained aggregates."""
+    quiz = await quiz_use_cases.get_quiz(quiz_id)
+
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+
+    stats = await result_use_cases.get_quiz_stats(quiz_id)
+    return QuizStatsResponse(
+        quiz_id=quiz_id,
+        attempts=stats.attempts,
+        average_score=round(stats.average, 2) if stats.average is not None else None,
+        stddev_score=round(stats.stddev, 2) if stats.stddev is not None else None,
+        min_score=stats.min_score,
+        max_score=stats.max_score,
+        histogram=[
+            ScoreBucket(min_score=low, max_score=high, count=count)
+            for low, high, count in stats.histogram(bucket_size)
+        ],
+        updated_at=stats.updated_at,
+    )
+
+
+@router.get("/quiz/{quiz_id}/leaderboard", response_model=LeaderboardResponse)
+async def get_leaderboard(
+    quiz_id: UUID,
+    response: Response,
+    quiz_use_cases: QuizUseCasesDep,
+    result_use_cases: ResultUseCasesDep,
+    limit: int = Query(10, ge=1, le=100),
+    result_id: Optional[UUID] = Query(None, description="Also return the rank of this result"),
+) -> LeaderboardResponse:
+    """Top results of a quiz (highest score, earliest attempt first) and a result's rank.
+
+    Ranks are competition ranks: equal scores share a rank. The rank of
+    `result_id` is counted from the score histogram, not from the results table.
+    """
+    quiz = await quiz_use_cases.get_quiz(quiz_id)
+
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+
+    top = await result_use_cases.get_leaderboard(quiz_id, limit=limit)
+    stats = await result_use_cases.get_quiz_stats(quiz_id)
+
+    entries: List[LeaderboardEntry] = []
+    for position, r in enumerate(top, 1):
+        rank = entries[-1].rank if entries and entries[-1].score == r.score else position
+        entries.append(
+            LeaderboardEntry(
+                rank=rank,
+                result_id=r.id,
+                user_id=r.user_id,
+                respondent_name=r.respondent_name,
+                score=r.score,
+                taken_at=r.taken_at,
+            )
+        )
+
+    result_rank = None
+    if result_id is not None:
+        result = await result_use_cases.get_result(result_id)
+        if not result or result.quiz_id != quiz_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Result not found"
+            )
+        result_rank = ResultRank(
+            result_id=result.id,
+            score=result.score,
+            rank=stats.rank_of(result.score),
+            tied_with=max(stats.score_counts.get(result.score, 0) - 1, 0),
+        )
+
+    # Clients poll this during live events; let shared caches absorb bursts
+    response.headers["Cache-Control"] = "public, max-age=2"
+    return LeaderboardResponse(
+        quiz_id=quiz_id,
+        total_attempts=stats.attempts,
+        entries=entries,
+        result_rank=result_rank,
+    )
+
+
+async def _stream_events(subscription: Subscription, snapshot: str) -> AsyncIterator[str]:
+    try:
+        yield snapshot
+        while True:
+            try:
+                data = await asyncio.wait_for(
+                    subscription.get(), timeout=RESULTS_STREAM_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            if data is None:
+                # Too far behind: end the stream so the client reconnects to a new snapshot
+                return
+            yield data
+    finally:
+        result_feed.unsubscribe(subscription)
+
+
+@router.get("/quiz/{quiz_id}/stream")
+async def stream_results(
+    quiz_id: UUID,
+    quiz_use_cases: QuizUseCasesDep,
+    result_use_cases: ResultUseCasesDep,
+) -> StreamingResponse:
+    """Server-Sent Events with a quiz's new results and leaderboard changes.
+
+    The stream starts with a `snapshot` event (top results and attempt count),
+    followed by at most one `update` event per RESULTS_STREAM_INTERVAL_MS with
+    the results recorded since the previous one, the leaderboard entries that
+    are new or changed rank and the ids that left it. Only the first watcher of
+    a quiz queries the database; updates are built once per quiz and shared.
+    """
+    quiz = await quiz_use_cases.get_quiz(quiz_id)
+
+    if not quiz:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Quiz not found"
+        )
+
+    subscription = result_feed.subscribe(quiz_id)
+    try:
+        if not result_feed.is_seeded(quiz_id):
+            top = await result_use_cases.get_leaderboard(
+                quiz_id, limit=result_feed.leaderboard_size
+            )
+            stats = await result_use_cases.get_quiz_stats(quiz_id)
+            result_feed.seed(quiz_id, top, stats.attempts)
+        snapshot = result_feed.snapshot(quiz_id)
+        if snapshot is None:
+            raise RuntimeError(f"Result feed for quiz {quiz_id} was not seeded")
+    except BaseException:
+        result_feed.unsubscribe(subscription)
+        raise
+
+    return StreamingResponse(
+        _stream_events(subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,4 +1,4 @@
-from . import users, auth, journeys, options, questions, quizzes, results
+from . import users, auth, journeys, options, questions, quizzes, results, attempts, live, activity
 
 from .users import *
 from .auth import *
@@ -7,6 +7,9 @@ from .options import *
 from .questions import *
 from .quizzes import *
 from .results import *
+from .attempts import *
+from .live import *
+from .activity import *
 
 __all__ = [
     *users.__all__,
@@ -16,4 +19,7 @@ __all__ = [
     *questions.__all__,
     *quizzes.__all__,
     *results.__all__,
+    *attempts.__all__,
+    *live.__all__,
+    *activity.__all__,
 ]
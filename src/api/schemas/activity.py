@@ -0,0 +1,42 @@
+from pydantic import BaseModel
+from typing import List, Literal, Optional
+from datetime import datetime
+
+
+class ActivityBucketResponse(BaseModel):
+    start: datetime
+    attempts: int
+    average_score: Optional[float] = None
+
+
+class ActivityResponse(BaseModel):
+    granularity: Literal["hour", "day"]
+    since: datetime
+    attempts: int
+    average_score: Optional[float] = None
+    buckets: List[ActivityBucketResponse]
+
+    @classmethod
+    def from_buckets(cls, granularity: str, buckets: list) -> "ActivityResponse":
+        attempts = sum(b.attempts for b in buckets)
+        score_sum = sum(b.score_sum for b in buckets)
+        return cls(
+            granularity=granularity,
+            since=buckets[0].start,
+            attempts=attempts,
+            average_score=round(score_sum / attempts, 2) if attempts else None,
+            buckets=[
+                ActivityBucketResponse(
+                    start=b.start,
+                    attempts=b.attempts,
+                    average_score=round(b.average, 2) if b.attempts else None,
+                )
+                for b in buckets
+            ],
+        )
+
+
+__all__ = [
+    "ActivityBucketResponse",
+    "ActivityResponse",
+]
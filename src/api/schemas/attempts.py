@@ -0,0 +1,59 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from uuid import UUID
+
+from ...domain.entities.quiz import FeedbackMode
+
+
+class AttemptCreate(BaseModel):
+    user_id: Optional[UUID] = None
+    respondent_name: str = Field(..., min_length=1, max_length=200)
+    quiz_id: UUID
+
+
+class AttemptOptionResponse(BaseModel):
+    id: UUID
+    text: Optional[str] = None
+    image_url: Optional[str] = None
+
+
+class AttemptQuestionResponse(BaseModel):
+    id: UUID
+    text: str
+    options: List[AttemptOptionResponse]
+
+
+class AttemptResponse(BaseModel):
+    id: UUID
+    quiz_id: UUID
+    total_questions: int
+    feedback_mode: FeedbackMode
+    started_at: datetime
+    expires_at: datetime
+    # In this attempt's order, without the correct answers
+    questions: List[AttemptQuestionResponse] = []
+
+
+class AttemptAnswer(BaseModel):
+    question_id: UUID
+    option_id: UUID
+
+
+class AttemptAnswerResponse(BaseModel):
+    question_id: UUID
+    selected_option_id: UUID
+    # Only revealed for quizzes in immediate feedback mode
+    is_correct: Optional[bool] = None
+    correct_option_id: Optional[UUID] = None
+    already_answered: bool = False
+
+
+__all__ = [
+    "AttemptCreate",
+    "AttemptOptionResponse",
+    "AttemptQuestionResponse",
+    "AttemptResponse",
+    "AttemptAnswer",
+    "AttemptAnswerResponse",
+]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -24,8 +24,25 @@ class JourneyResponse(JourneyBase):
     created_at: datetime
     updated_at: datetime
 
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class QuizProgressResponse(BaseModel):
+    quiz_id: UUID
+    title: str
+    best_score: Optional[int] = None
+    attempts: int
+    completed: bool
+    last_taken_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class JourneyProgressResponse(BaseModel):
+    journey_id: UUID
+    total_quizzes: int
+    completed_quizzes: int
+    quizzes: List[QuizProgressResponse]
 
 
 __all__ = [
@@ -33,4 +50,6 @@ __all__ = [
     "JourneyCreate",
     "JourneyUpdate",
     "JourneyResponse",
+    "QuizProgressResponse",
+    "JourneyProgressResponse",
 ]
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from uuid import UUID
+
+
+class LiveRoomCreate(BaseModel):
+    quiz_id: UUID
+
+
+class LiveRoomResponse(BaseModel):
+    code: str
+    quiz_id: UUID
+    total_questions: int
+    host_url: str
+    play_url: str
+
+
+__all__ = [
+    "LiveRoomCreate",
+    "LiveRoomResponse",
+]
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, List, Optional
 from datetime import datetime
 from uuid import UUID
 
@@ -30,8 +30,7 @@ class QuestionResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuestionResponseWithAnswer(QuestionResponse):
@@ -48,6 +47,18 @@ class AnswerResult(BaseModel):
     correct_answer: Optional[str] = None
 
 
+class QuestionItemStatsResponse(BaseModel):
+    question_id: UUID
+    responses: int
+    correct: int
+    p_value: float
+    discrimination: Optional[float] = None
+    option_counts: Dict[str, int]
+    computed_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 __all__ = [
     "QuestionBase",
     "QuestionCreate",
@@ -56,4 +67,5 @@ __all__ = [
     "QuestionResponseWithAnswer",
     "AnswerCheck",
     "AnswerResult",
+    "QuestionItemStatsResponse",
 ]
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
@@ -31,6 +31,12 @@ class QuizCreate(QuizBase):
         None, description="Difficulty level: 'facil', 'medio', 'dificil', 'expert'"
     )
     image_url: Optional[str] = None
+    shuffle_questions: bool = Field(
+        False, description="Give every attempt its own question order"
+    )
+    shuffle_options: bool = Field(
+        False, description="Give every attempt its own option order"
+    )
 
 
 class QuizUpdate(BaseModel):
@@ -41,6 +47,8 @@ class QuizUpdate(BaseModel):
     feedback_mode: Optional[FeedbackMode] = None
     difficulty: Optional[Difficulty] = None
     image_url: Optional[str] = None
+    shuffle_questions: Optional[bool] = None
+    shuffle_options: Optional[bool] = None
 
 
 class QuizResponse(QuizBase):
@@ -51,12 +59,13 @@ class QuizResponse(QuizBase):
     feedback_mode: FeedbackMode = FeedbackMode.FINAL
     difficulty: Optional[Difficulty] = None
     image_url: Optional[str] = None
+    shuffle_questions: bool = False
+    shuffle_options: bool = False
     created_at: datetime
     updated_at: datetime
     questions: Optional[List[QuestionResponse]] = []
 
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # List response for latest quizzes with pagination metadata
@@ -65,8 +74,22 @@ class QuizzesListResponse(BaseModel):
     total_items: int
     total_pages: int
 
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+class QuizImportLineError(BaseModel):
+    line: int
+    errors: List[str]
+
+
+class QuizImportResponse(BaseModel):
+    lines: int
+    imported_quizzes: int
+    imported_questions: int
+    failed: int
+    # Only the first QUIZ_IMPORT_MAX_ERRORS failed lines are listed
+    errors: List[QuizImportLineError]
+    errors_truncated: bool = False
 
 
 __all__ = [
@@ -76,4 +99,6 @@ __all__ = [
     "QuizUpdate",
     "QuizResponse",
     "QuizzesListResponse",
+    "QuizImportLineError",
+    "QuizImportResponse",
 ]
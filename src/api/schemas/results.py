@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 from datetime import datetime
 from uuid import UUID
@@ -20,18 +20,66 @@ class ResultResponse(BaseModel):
     score: int
     total_questions: int
     taken_at: datetime
+    percentile_rank: Optional[float] = Field(
+        default=None, description="Percentage of the quiz's results with a lower score; set on submission"
+    )
 
-    class ConfigDict:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ResultsListResponse(BaseModel):
     items: List[ResultResponse]
     total: int
+    next_cursor: Optional[str] = None
+
+
+class ScoreBucket(BaseModel):
+    min_score: int
+    max_score: int
+    count: int
+
+
+class QuizStatsResponse(BaseModel):
+    quiz_id: UUID
+    attempts: int
+    average_score: Optional[float] = None
+    stddev_score: Optional[float] = None
+    min_score: Optional[int] = None
+    max_score: Optional[int] = None
+    histogram: List[ScoreBucket]
+    updated_at: Optional[datetime] = None
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    result_id: UUID
+    user_id: Optional[UUID] = None
+    respondent_name: str
+    score: int
+    taken_at: datetime
+
+
+class ResultRank(BaseModel):
+    result_id: UUID
+    score: int
+    rank: int
+    tied_with: int
+
+
+class LeaderboardResponse(BaseModel):
+    quiz_id: UUID
+    total_attempts: int
+    entries: List[LeaderboardEntry]
+    result_rank: Optional[ResultRank] = None
 
 
 __all__ = [
     "ResultCreate",
     "ResultResponse",
     "ResultsListResponse",
+    "ScoreBucket",
+    "QuizStatsResponse",
+    "LeaderboardEntry",
+    "ResultRank",
+    "LeaderboardResponse",
 ]
@@ -3,5 +3,6 @@ from .journey_use_cases import JourneyUseCases
 from .quiz_use_cases import QuizUseCases
 from .question_use_cases import QuestionUseCases
 from .result_use_cases import ResultUseCases
+from .attempt_use_cases import AttemptUseCases
 
-__all__ = ["UserUseCases", "JourneyUseCases", "QuizUseCases", "QuestionUseCases", "ResultUseCases"]
+__all__ = ["UserUseCases", "JourneyUseCases", "QuizUseCases", "QuestionUseCases", "ResultUseCases", "AttemptUseCases"]
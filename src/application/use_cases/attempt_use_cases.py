@@ -0,0 +1,117 @@
+from typing import Annotated, Optional, Tuple
+from uuid import UUID
+
+from fastapi import Depends
+
+from src.infrastructure.attempts import AnswerKeyCache, AttemptStore, answer_key_cache, attempt_store
+from src.infrastructure.cache import StoreFullError
+from src.infrastructure.repositories.quiz_repository_impl import get_quiz_repository
+from src.infrastructure.repositories.result_repository_impl import get_result_repository
+from src.infrastructure.observability import traced_class
+
+from ...domain.entities.attempt import Answer, AnswerKey, Attempt
+from ...domain.entities.results import Result
+from ...domain.repositories.quiz_repository import QuizRepository
+from ...domain.repositories.result_repository import ResultRepository
+
+
+class AttemptInProgressError(Exception):
+    """Another request is already finishing this attempt."""
+
+
+class AttemptStoreFullError(Exception):
+    """The attempt store holds as many attempts in progress as it can."""
+
+
+@traced_class()
+class AttemptUseCases:
+    """Attempts live in the attempt store and reach the database once, when finished."""
+
+    def __init__(
+        self,
+        quiz_repository: QuizRepository,
+        result_repository: ResultRepository,
+        store: AttemptStore = attempt_store,
+        answer_keys: AnswerKeyCache = answer_key_cache,
+    ):
+        self.quiz_repository = quiz_repository
+        self.result_repository = result_repository
+        self.store = store
+        self.answer_keys = answer_keys
+
+    async def get_answer_key(self, quiz_id: UUID) -> Optional[AnswerKey]:
+        key = self.answer_keys.get(quiz_id)
+        if key is None:
+            quiz = await self.quiz_repository.get_by_id(quiz_id, include_questions=True)
+            if quiz is None:
+                return None
+            key = AnswerKey.from_quiz(quiz)
+            self.answer_keys.put(key)
+        return key
+
+    async def start_attempt(self, attempt: Attempt) -> Optional[AnswerKey]:
+        """Store a new attempt; returns None when the quiz does not exist."""
+        key = await self.get_answer_key(attempt.quiz_id)
+        if key is None:
+            return None
+        if not key.total_questions:
+            raise ValueError("Quiz has no questions")
+        try:
+            await self.store.save(attempt)
+        except StoreFullError as e:
+            raise AttemptStoreFullError("Too many attempts in progress") from e
+        return key
+
+    async def get_attempt(self, attempt_id: UUID) -> Optional[Attempt]:
+        return await self.store.get(attempt_id)
+
+    async def check_answer(
+        self, attempt: Attempt, question_id: UUID, option_id: UUID
+    ) -> Tuple[Answer, AnswerKey, bool]:
+        """Record an answer; returns it, the answer key and whether it was recorded just now.
+
+        A question keeps its first answer: answering it again returns that one.
+        """
+        key = await self.get_answer_key(attempt.quiz_id)
+        if key is None:
+            raise ValueError("Quiz not found")
+        answer = Answer(question_id, option_id, key.check(question_id, option_id))
+        try:
+            recorded = await self.store.record_answer(attempt, answer)
+        except StoreFullError as e:
+            raise AttemptStoreFullError("Too many attempts in progress") from e
+        return recorded, key, recorded is answer
+
+    async def finish_attempt(self, attempt_id: UUID) -> Optional[Result]:
+        """Score and store the attempt with its answers in one transaction.
+
+        Finishing again returns the stored result, so the call can be retried.
+        """
+        attempt = await self.store.get(attempt_id)
+        if attempt is None:
+            return await self.result_repository.get_by_id(attempt_id)
+        key = await self.get_answer_key(attempt.quiz_id)
+        if key is None:
+            return None
+        if not await self.store.claim(attempt):
+            raise AttemptInProgressError("Attempt is already being finished")
+        try:
+            # A concurrent finish may have stored and released it after our read
+            stored = await self.result_repository.get_by_id(attempt.id)
+            if stored is not None:
+                return stored
+            answers = await self.store.answers(attempt, key.correct_options)
+            result = await self.result_repository.create_with_answers(
+                attempt.to_result(answers, key.total_questions), answers
+            )
+            await self.store.discard(attempt, key.correct_options)
+        finally:
+            await self.store.release(attempt)
+        return result
+
+
+def get_attempt_use_cases(
+    quiz_repository: Annotated[QuizRepository, Depends(get_quiz_repository)],
+    result_repository: Annotated[ResultRepository, Depends(get_result_repository)],
+) -> AttemptUseCases:
+    return AttemptUseCases(quiz_repository, result_repository)
@@ -4,11 +4,13 @@ from uuid import UUID
 from fastapi import Depends
 
 from src.infrastructure.repositories.journey_repository_impl import get_journey_repository
+from src.infrastructure.observability import traced_class
 
 from ...domain.entities.journey import Journey
 from ...domain.repositories.journey_repository import JourneyRepository
 
 
+@traced_class()
 class JourneyUseCases:
     """Use cases for Journey entity."""
 
@@ -3,18 +3,25 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from src.infrastructure.attempts import AnswerKeyCache, answer_key_cache
 from src.infrastructure.repositories.question_repository_impl import get_question_repository
+from src.infrastructure.observability import traced_class
 
+from ...domain.entities.item_stats import QuestionItemStats
 from ...domain.entities.question import Question
 from ...domain.entities.option import Option
 from ...domain.repositories.question_repository import QuestionRepository
 
 
+@traced_class()
 class QuestionUseCases:
     """Use cases for Question entity."""
 
-    def __init__(self, question_repository: QuestionRepository):
+    def __init__(
+        self, question_repository: QuestionRepository, answer_keys: AnswerKeyCache = answer_key_cache
+    ):
         self.question_repository = question_repository
+        self.answer_keys = answer_keys
 
     async def create_question(self, question: Question) -> Question:
         """Create a new question."""
@@ -41,6 +48,7 @@ class QuestionUseCases:
             raise ValueError("Option reference_ids must be unique and not None")
             
 
+        self.answer_keys.invalidate(question.quiz_id)
         return await self.question_repository.create(question)
 
     async def get_question(self, question_id: UUID) -> Optional[Question]:
@@ -83,6 +91,7 @@ class QuestionUseCases:
         if question.correct_answer not in [option.reference_id for option in question.options]:
             raise ValueError("Correct answer must be one of the options")
 
+        self.answer_keys.invalidate(existing_question.quiz_id)
         return await self.question_repository.update(question)
 
     async def delete_question(self, question_id: UUID) -> bool:
@@ -91,8 +100,14 @@ class QuestionUseCases:
         if not existing_question:
             raise ValueError(f"Question with ID '{question_id}' not found")
 
+        self.answer_keys.invalidate(existing_question.quiz_id)
         return await self.question_repository.delete(question_id)
 
+    async def get_item_stats(self, quiz_id: UUID) -> List[QuestionItemStats]:
+        """Get the item analysis of a quiz's questions, hardest first."""
+        stats = await self.question_repository.get_item_stats_by_quiz(quiz_id)
+        return sorted(stats, key=lambda s: s.p_value)
+
 
 def get_question_use_cases(
     question_repository: Annotated[QuestionRepository, Depends(get_question_repository)],
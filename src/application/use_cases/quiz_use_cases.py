@@ -3,15 +3,21 @@ from uuid import UUID
 
 from fastapi.params import Depends
 
+from src.infrastructure.attempts import AnswerKeyCache, answer_key_cache
 from src.infrastructure.repositories.quiz_repository_impl import get_quiz_repository
+from src.infrastructure.observability import traced_class
 
 from ...domain.entities.quiz import Quiz
 from ...domain.repositories.quiz_repository import QuizRepository
 
 
+@traced_class()
 class QuizUseCases:
-    def __init__(self, quiz_repository: QuizRepository):
+    def __init__(
+        self, quiz_repository: QuizRepository, answer_keys: AnswerKeyCache = answer_key_cache
+    ):
         self.quiz_repository = quiz_repository
+        self.answer_keys = answer_keys
 
     async def create_quiz(self, quiz: Quiz) -> Quiz:
         return await self.quiz_repository.create(quiz)
@@ -42,6 +48,8 @@ class QuizUseCases:
         if not existing_quiz:
             raise ValueError(f"Quiz with ID '{quiz.id}' not found")
 
+        # The answer key carries the feedback mode and shuffle flags
+        self.answer_keys.invalidate(quiz.id)
         return await self.quiz_repository.update(quiz)
 
     async def delete_quiz(self, quiz_id: UUID) -> bool:
@@ -49,6 +57,7 @@ class QuizUseCases:
         if not existing_quiz:
             raise ValueError(f"Quiz with ID '{quiz_id}' not found")
 
+        self.answer_keys.invalidate(quiz_id)
         return await self.quiz_repository.delete(quiz_id)
 
 def get_quiz_use_cases(quiz_repository: Annotated[QuizRepository, Depends(get_quiz_repository)]) -> QuizUseCases:
@@ -1,27 +1,139 @@
-from typing import Annotated, List
+from datetime import datetime, timedelta, timezone
+from typing import Annotated, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from fastapi import Depends
 
+from src.infrastructure.analytics.rollups import ROLLUP_HOURLY_RETENTION_DAYS, start_of_day
+from src.infrastructure.journey_progress import JourneyProgressCache, journey_progress_cache
+from src.infrastructure.leaderboard import LeaderboardCache, leaderboard_cache
 from src.infrastructure.repositories.result_repository_impl import get_result_repository
+from src.infrastructure.observability import traced_class
 
+from ...domain.entities.activity import ActivityBucket
+from ...domain.entities.journey_progress import QuizProgress
+from ...domain.entities.quiz_stats import QuizStats
 from ...domain.entities.results import Result
 from ...domain.repositories.result_repository import ResultRepository
 
 
+@traced_class()
 class ResultUseCases:
 
-    def __init__(self, result_repository: ResultRepository):
+    def __init__(
+        self,
+        result_repository: ResultRepository,
+        leaderboard: LeaderboardCache = leaderboard_cache,
+        journey_progress: JourneyProgressCache = journey_progress_cache,
+    ):
         self.result_repository = result_repository
+        self.leaderboard = leaderboard
+        self.journey_progress = journey_progress
 
     async def create_result(self, result: Result) -> Result:
         return await self.result_repository.create(result)
 
-    async def get_results_by_quiz(self, quiz_id: UUID, skip: int = 0, limit: int = 100) -> List[Result]:
-        return await self.result_repository.get_by_quiz_id(quiz_id, skip=skip, limit=limit)
+    async def create_results(self, results: List[Result], skip_existing: bool = False) -> int:
+        return await self.result_repository.create_many(results, skip_existing=skip_existing)
 
-    async def get_results_by_user(self, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Result]:
-        return await self.result_repository.get_by_user_id(user_id, skip=skip, limit=limit)
+    async def get_result(self, result_id: UUID) -> Optional[Result]:
+        return await self.result_repository.get_by_id(result_id)
+
+    async def get_leaderboard(self, quiz_id: UUID, limit: int = 10) -> List[Result]:
+        """Top results of a quiz, from the in-memory board when it is warm."""
+        if limit <= self.leaderboard.size:
+            cached = self.leaderboard.get(quiz_id, limit)
+            if cached is not None:
+                return cached
+        top = await self.result_repository.get_top_by_quiz(quiz_id, max(limit, self.leaderboard.size))
+        self.leaderboard.put(quiz_id, top)
+        return top[:limit]
+
+    async def get_results_by_quiz(
+        self,
+        quiz_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Result]:
+        return await self.result_repository.get_by_quiz_id(quiz_id, skip=skip, limit=limit, before=before)
+
+    async def get_results_by_user(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Result]:
+        return await self.result_repository.get_by_user_id(user_id, skip=skip, limit=limit, before=before)
+
+    async def count_results_by_quiz(self, quiz_id: UUID) -> int:
+        return await self.result_repository.count_by_quiz_id(quiz_id)
+
+    async def count_results_by_user(self, user_id: UUID) -> int:
+        return await self.result_repository.count_by_user_id(user_id)
+
+    def export_columns(self, include_answers: bool = False) -> List[str]:
+        return self.result_repository.export_columns(include_answers=include_answers)
+
+    def export_results(self, quiz_id: UUID, include_answers: bool = False) -> Iterator[Dict]:
+        return self.result_repository.stream_by_quiz(quiz_id, include_answers=include_answers)
+
+    async def get_percentile_rank(self, result: Result, recorded: bool = True) -> Optional[float]:
+        """Percentage of the quiz's results with a lower score ("better than X%").
+
+        Read from the per-quiz score histogram, so it costs one small query
+        however many results the quiz has. Pass `recorded=False` when the result
+        is not in the histogram yet (buffered ingestion).
+        """
+        below, total = await self.result_repository.count_scores_below(result.quiz_id, result.score)
+        if not recorded:
+            total += 1
+        return round(100 * below / total, 1) if total else None
+
+    async def get_quiz_stats(self, quiz_id: UUID) -> QuizStats:
+        stats = await self.result_repository.get_quiz_stats(quiz_id)
+        return stats or QuizStats(quiz_id=quiz_id)
+
+    async def get_journey_progress(self, journey_id: UUID, user_id: UUID) -> List[QuizProgress]:
+        """A user's progress through a journey, cached until the user records a result."""
+        progress = self.journey_progress.get(user_id, journey_id)
+        if progress is None:
+            progress = await self.result_repository.get_journey_progress(journey_id, user_id)
+            self.journey_progress.put(user_id, journey_id, progress)
+        return progress
+
+    async def get_activity(
+        self,
+        days: int,
+        granularity: str = "day",
+        quiz_id: Optional[UUID] = None,
+        journey_id: Optional[UUID] = None,
+        now: Optional[datetime] = None,
+    ) -> List[ActivityBucket]:
+        """Attempts per UTC hour or day over the last `days` days, one bucket per step.
+
+        The last bucket is the current (partial) hour or day. Hourly buckets are
+        only kept for ROLLUP_HOURLY_RETENTION_DAYS days.
+        """
+        if granularity == "hour" and days > ROLLUP_HOURLY_RETENTION_DAYS:
+            raise ValueError(f"Hourly activity covers at most {ROLLUP_HOURLY_RETENTION_DAYS} days")
+        now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc).replace(tzinfo=None)
+        if granularity == "hour":
+            step, steps = timedelta(hours=1), days * 24
+            last = now.replace(minute=0, second=0, microsecond=0)
+        else:
+            step, steps = timedelta(days=1), days
+            last = start_of_day(now)
+        since = last - step * (steps - 1)
+        stored = {
+            bucket.start: bucket
+            for bucket in await self.result_repository.get_activity(
+                since, granularity, quiz_id=quiz_id, journey_id=journey_id
+            )
+        }
+        starts = (since + step * i for i in range(steps))
+        return [stored.get(start) or ActivityBucket(start) for start in starts]
 
 
 def get_result_use_cases(
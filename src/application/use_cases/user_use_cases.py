@@ -4,11 +4,13 @@ from uuid import UUID
 from fastapi import Depends
 
 from src.infrastructure.repositories.user_repository_impl import get_user_repository
+from src.infrastructure.observability import traced_class
 
 from ...domain.entities.user import User
 from ...domain.repositories.user_repository import UserRepository
 
 
+@traced_class()
 class UserUseCases:
     """Use cases for User entity."""
 
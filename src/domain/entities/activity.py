@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import Optional
+
+
+class ActivityBucket:
+    """Attempts and score sum of one UTC hour or day."""
+
+    __slots__ = ("start", "attempts", "score_sum")
+
+    def __init__(self, start: datetime, attempts: int = 0, score_sum: int = 0):
+        self.start = start
+        self.attempts = attempts
+        self.score_sum = score_sum
+
+    @property
+    def average(self) -> Optional[float]:
+        return self.score_sum / self.attempts if self.attempts else None
+
+    def add(self, attempts: int, score_sum: int) -> None:
+        self.attempts += attempts
+        self.score_sum += score_sum
+
+    def __repr__(self) -> str:
+        return f"ActivityBucket(start={self.start}, attempts={self.attempts})"
@@ -0,0 +1,160 @@
+import random
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from ..ids import uuid7
+from .option import Option
+from .question import Question
+from .quiz import FeedbackMode, Quiz
+from .results import Result, percent_score
+
+
+class Answer:
+    """The option chosen for one question of an attempt."""
+
+    __slots__ = ("question_id", "selected_option_id", "is_correct", "answered_at")
+
+    def __init__(
+        self,
+        question_id: UUID,
+        selected_option_id: UUID,
+        is_correct: bool,
+        answered_at: Optional[datetime] = None,
+    ):
+        self.question_id = question_id
+        self.selected_option_id = selected_option_id
+        self.is_correct = is_correct
+        self.answered_at = answered_at or datetime.now(timezone.utc)
+
+
+class AnswerKey:
+    """Correct option and valid options of every question of a quiz.
+
+    It also keeps the quiz's questions, shared read-only by every attempt:
+    an attempt's order is computed from its id (see `paper`), never stored
+    or copied into the key.
+    """
+
+    __slots__ = (
+        "quiz_id",
+        "feedback_mode",
+        "correct_options",
+        "options",
+        "questions",
+        "shuffle_questions",
+        "shuffle_options",
+    )
+
+    def __init__(
+        self,
+        quiz_id: UUID,
+        feedback_mode: FeedbackMode,
+        correct_options: Dict[UUID, Optional[UUID]],
+        options: Dict[UUID, FrozenSet[UUID]],
+        questions: Sequence[Question] = (),
+        shuffle_questions: bool = False,
+        shuffle_options: bool = False,
+    ):
+        self.quiz_id = quiz_id
+        self.feedback_mode = feedback_mode
+        self.correct_options = correct_options
+        self.options = options
+        self.questions = tuple(questions)
+        self.shuffle_questions = shuffle_questions
+        self.shuffle_options = shuffle_options
+
+    @classmethod
+    def from_quiz(cls, quiz: Quiz) -> "AnswerKey":
+        """Build from a quiz loaded with its questions and options."""
+        correct_options = {}
+        options = {}
+        for question in quiz.questions:
+            options[question.id] = frozenset(opt.id for opt in question.options)
+            correct_options[question.id] = next(
+                (opt.id for opt in question.options if opt.reference_id == question.correct_answer),
+                None,
+            )
+        questions = list(quiz.questions)
+        if quiz.shuffle_questions:
+            # The permutation needs the same starting order on every load; ids are
+            # only a stable sort key here, older ones are not time-ordered
+            questions.sort(key=lambda question: question.id)
+        return cls(
+            quiz.id,
+            quiz.feedback_mode,
+            correct_options,
+            options,
+            questions,
+            quiz.shuffle_questions,
+            quiz.shuffle_options,
+        )
+
+    def paper(self, attempt_id: UUID) -> List[Tuple[Question, Tuple[Option, ...]]]:
+        """The questions and their options in the order one attempt sees them.
+
+        The permutation comes from a PRNG seeded with the attempt id, so it is
+        the same on every call and in every process. The shared Question and
+        Option objects are returned as they are, only their order differs.
+        """
+        rng = random.Random(attempt_id.int)
+        questions = list(self.questions)
+        if self.shuffle_questions:
+            rng.shuffle(questions)
+        paper = []
+        for question in questions:
+            options = list(question.options)
+            if self.shuffle_options:
+                # Options created without an explicit order all share 0, and tied rows
+                # can load in any order; start the permutation from a fixed one
+                options.sort(key=lambda option: (option.order, option.id))
+                rng.shuffle(options)
+            paper.append((question, tuple(options)))
+        return paper
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.correct_options)
+
+    def check(self, question_id: UUID, option_id: UUID) -> bool:
+        """Whether `option_id` is the correct answer; raises ValueError for foreign ids."""
+        if question_id not in self.options:
+            raise ValueError("Question is not part of this quiz")
+        if option_id not in self.options[question_id]:
+            raise ValueError("Option is not part of this question")
+        return option_id == self.correct_options[question_id]
+
+
+class Attempt:
+    """A quiz being taken: answers are checked one by one, then scored once."""
+
+    __slots__ = ("id", "quiz_id", "user_id", "respondent_name", "started_at")
+
+    def __init__(
+        self,
+        quiz_id: UUID,
+        respondent_name: str,
+        user_id: Optional[UUID] = None,
+        id: Optional[UUID] = None,
+        started_at: Optional[datetime] = None,
+    ):
+        self.id = id or uuid7()
+        self.quiz_id = quiz_id
+        self.respondent_name = respondent_name
+        self.user_id = user_id
+        self.started_at = started_at or datetime.now(timezone.utc)
+
+    def to_result(self, answers: Iterable[Answer], total_questions: int) -> Result:
+        """Score as the percentage of correct answers; unanswered questions count as wrong."""
+        correct = sum(1 for answer in answers if answer.is_correct)
+        return Result(
+            id=self.id,
+            user_id=self.user_id,
+            respondent_name=self.respondent_name,
+            quiz_id=self.quiz_id,
+            score=percent_score(correct, total_questions),
+            total_questions=total_questions,
+        )
+
+    def __repr__(self) -> str:
+        return f"Attempt(id={self.id}, quiz_id={self.quiz_id}, respondent_name={self.respondent_name})"
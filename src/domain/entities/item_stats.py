@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Dict, Optional
+from uuid import UUID
+
+
+class QuestionItemStats:
+    """Item analysis of one question, as computed by the batch job."""
+
+    __slots__ = (
+        "question_id",
+        "quiz_id",
+        "responses",
+        "correct",
+        "p_value",
+        "discrimination",
+        "option_counts",
+        "computed_at",
+    )
+
+    def __init__(
+        self,
+        question_id: UUID,
+        quiz_id: UUID,
+        responses: int,
+        correct: int,
+        p_value: float,
+        discrimination: Optional[float],
+        option_counts: Dict[str, int],
+        computed_at: datetime,
+    ):
+        self.question_id = question_id
+        self.quiz_id = quiz_id
+        self.responses = responses
+        self.correct = correct
+        self.p_value = p_value
+        self.discrimination = discrimination
+        self.option_counts = option_counts
+        self.computed_at = computed_at
+
+    def __repr__(self) -> str:
+        return (
+            f"QuestionItemStats(question_id={self.question_id}, p_value={self.p_value}, "
+            f"discrimination={self.discrimination})"
+        )
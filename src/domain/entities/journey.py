@@ -1,11 +1,15 @@
 from datetime import datetime, timezone
 from typing import Optional, List
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from ..ids import uuid7
 
 
 class Journey:
     """Domain entity representing a journey containing multiple quizzes."""
 
+    __slots__ = ("id", "title", "description", "user_id", "created_at", "updated_at")
+
     def __init__(
         self,
         title: str,
@@ -15,13 +19,34 @@ class Journey:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
-        self.id = id or uuid4()
+        self.id = id or uuid7()
         self.title = title
         self.description = description
         self.user_id = user_id
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
 
+    @classmethod
+    def hydrate(
+        cls,
+        *,
+        id: UUID,
+        title: str,
+        description: str,
+        user_id: UUID,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "Journey":
+        """Build from complete stored values, skipping id/timestamp defaults."""
+        entity = object.__new__(cls)
+        entity.id = id
+        entity.title = title
+        entity.description = description
+        entity.user_id = user_id
+        entity.created_at = created_at
+        entity.updated_at = updated_at
+        return entity
+
     def __repr__(self) -> str:
         return f"Journey(id={self.id}, title={self.title})"
 
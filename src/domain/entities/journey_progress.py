@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+
+class QuizProgress:
+    """A user's results on one quiz of a journey."""
+
+    __slots__ = ("quiz_id", "title", "best_score", "attempts", "last_taken_at")
+
+    def __init__(
+        self,
+        quiz_id: UUID,
+        title: str,
+        best_score: Optional[int] = None,
+        attempts: int = 0,
+        last_taken_at: Optional[datetime] = None,
+    ):
+        self.quiz_id = quiz_id
+        self.title = title
+        self.best_score = best_score
+        self.attempts = attempts
+        self.last_taken_at = last_taken_at
+
+    @property
+    def completed(self) -> bool:
+        return self.attempts > 0
+
+    def __repr__(self) -> str:
+        return f"QuizProgress(quiz_id={self.quiz_id}, attempts={self.attempts})"
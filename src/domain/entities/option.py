@@ -1,11 +1,25 @@
 from datetime import datetime, timezone
 from typing import Optional, Dict
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from ..ids import uuid7
 
 
 class Option:
     """Domain entity representing a single question option (answer)."""
 
+    __slots__ = (
+        "id",
+        "reference_id",
+        "text",
+        "order",
+        "is_correct",
+        "image_url",
+        "metadata",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         reference_id: int,
@@ -18,7 +32,7 @@ class Option:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
-        self.id = id or uuid4()
+        self.id = id or uuid7()
         self.reference_id = reference_id
         self.text = text
         self.order = order
@@ -28,6 +42,33 @@ class Option:
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
 
+    @classmethod
+    def hydrate(
+        cls,
+        *,
+        id: UUID,
+        reference_id: int,
+        text: Optional[str],
+        order: int,
+        is_correct: bool,
+        image_url: Optional[str],
+        metadata: Optional[Dict],
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "Option":
+        """Build from complete stored values, skipping id/timestamp defaults."""
+        entity = object.__new__(cls)
+        entity.id = id
+        entity.reference_id = reference_id
+        entity.text = text
+        entity.order = order
+        entity.is_correct = is_correct
+        entity.image_url = image_url
+        entity.metadata = metadata
+        entity.created_at = created_at
+        entity.updated_at = updated_at
+        return entity
+
     def __repr__(self) -> str:
         preview = self.text[:30] + "..." if self.text and len(self.text) > 30 else self.text
         return f"Option(id={self.id}, reference_id={self.reference_id}, text={preview}, order={self.order}, is_correct={self.is_correct})"
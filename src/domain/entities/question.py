@@ -1,12 +1,15 @@
 from datetime import datetime, timezone
 from typing import Optional, List
-from uuid import UUID, uuid4
+from uuid import UUID
+from ..ids import uuid7
 from .option import Option
 
 
 class Question:
     """Domain entity representing a question with multiple choice options."""
 
+    __slots__ = ("id", "text", "quiz_id", "options", "correct_answer", "created_at", "updated_at")
+
     def __init__(
         self,
         text: str,
@@ -17,7 +20,7 @@ class Question:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
-        self.id = id or uuid4()
+        self.id = id or uuid7()
         self.text = text
         self.quiz_id = quiz_id
         self.options = options
@@ -25,6 +28,29 @@ class Question:
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
 
+    @classmethod
+    def hydrate(
+        cls,
+        *,
+        id: UUID,
+        text: str,
+        quiz_id: UUID,
+        options: List[Option],
+        correct_answer: int,
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "Question":
+        """Build from complete stored values, skipping id/timestamp defaults."""
+        entity = object.__new__(cls)
+        entity.id = id
+        entity.text = text
+        entity.quiz_id = quiz_id
+        entity.options = options
+        entity.correct_answer = correct_answer
+        entity.created_at = created_at
+        entity.updated_at = updated_at
+        return entity
+
     def __repr__(self) -> str:
         return f"Question(id={self.id}, text={self.text[:50]}...)"
 
@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+from ..ids import uuid7
 
 
 class FeedbackMode(str, Enum):
@@ -17,6 +19,23 @@ class Difficulty(str, Enum):
 
 
 class Quiz:
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "journey_id",
+        "user_id",
+        "questions",
+        "estimated_time",
+        "feedback_mode",
+        "difficulty",
+        "image_url",
+        "shuffle_questions",
+        "shuffle_options",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         title: str,
@@ -31,8 +50,10 @@ class Quiz:
         image_url: Optional[str] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
+        shuffle_questions: bool = False,
+        shuffle_options: bool = False,
     ):
-        self.id = id or uuid4()
+        self.id = id or uuid7()
         self.title = title
         self.description = description
         self.journey_id = journey_id
@@ -42,9 +63,48 @@ class Quiz:
         self.feedback_mode = feedback_mode
         self.difficulty = difficulty
         self.image_url = image_url
+        self.shuffle_questions = shuffle_questions
+        self.shuffle_options = shuffle_options
         self.created_at = created_at or datetime.now(timezone.utc)
         self.updated_at = updated_at or datetime.now(timezone.utc)
 
+    @classmethod
+    def hydrate(
+        cls,
+        *,
+        id: UUID,
+        title: str,
+        description: str,
+        journey_id: Optional[UUID],
+        user_id: Optional[UUID],
+        questions: list,
+        estimated_time: Optional[int],
+        feedback_mode: FeedbackMode,
+        difficulty: Optional[Difficulty],
+        image_url: Optional[str],
+        created_at: datetime,
+        updated_at: datetime,
+        shuffle_questions: bool = False,
+        shuffle_options: bool = False,
+    ) -> "Quiz":
+        """Build from complete stored values, skipping id/timestamp defaults."""
+        entity = object.__new__(cls)
+        entity.id = id
+        entity.title = title
+        entity.description = description
+        entity.journey_id = journey_id
+        entity.user_id = user_id
+        entity.questions = questions
+        entity.estimated_time = estimated_time
+        entity.feedback_mode = feedback_mode
+        entity.difficulty = difficulty
+        entity.image_url = image_url
+        entity.shuffle_questions = shuffle_questions
+        entity.shuffle_options = shuffle_options
+        entity.created_at = created_at
+        entity.updated_at = updated_at
+        return entity
+
     def __repr__(self) -> str:
         return f"Quiz(id={self.id}, title={self.title}, journey_id={self.journey_id}, questions={len(self.questions)})"
 
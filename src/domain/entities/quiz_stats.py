@@ -0,0 +1,69 @@
+import math
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+MAX_SCORE = 100
+
+
+class QuizStats:
+    """Aggregated results of a quiz: counters plus a per-score histogram."""
+
+    __slots__ = (
+        "quiz_id",
+        "attempts",
+        "score_sum",
+        "score_sq_sum",
+        "min_score",
+        "max_score",
+        "score_counts",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        quiz_id: UUID,
+        attempts: int = 0,
+        score_sum: int = 0,
+        score_sq_sum: int = 0,
+        min_score: Optional[int] = None,
+        max_score: Optional[int] = None,
+        score_counts: Optional[Dict[int, int]] = None,
+        updated_at: Optional[datetime] = None,
+    ):
+        self.quiz_id = quiz_id
+        self.attempts = attempts
+        self.score_sum = score_sum
+        self.score_sq_sum = score_sq_sum
+        self.min_score = min_score
+        self.max_score = max_score
+        self.score_counts = score_counts or {}
+        self.updated_at = updated_at
+
+    @property
+    def average(self) -> Optional[float]:
+        return self.score_sum / self.attempts if self.attempts else None
+
+    @property
+    def stddev(self) -> Optional[float]:
+        """Population standard deviation of the scores."""
+        if not self.attempts:
+            return None
+        mean = self.score_sum / self.attempts
+        return math.sqrt(max(self.score_sq_sum / self.attempts - mean * mean, 0.0))
+
+    def rank_of(self, score: int) -> int:
+        """Competition rank (1 = best) of a score; equal scores share a rank."""
+        return 1 + sum(count for other, count in self.score_counts.items() if other > score)
+
+    def histogram(self, bucket_size: int = 10) -> List[Tuple[int, int, int]]:
+        """(lowest score, highest score, attempts) per bucket; the last bucket includes 100."""
+        buckets = []
+        for start in range(0, MAX_SCORE, bucket_size):
+            end = MAX_SCORE if start + bucket_size >= MAX_SCORE else start + bucket_size - 1
+            count = sum(self.score_counts.get(score, 0) for score in range(start, end + 1))
+            buckets.append((start, end, count))
+        return buckets
+
+    def __repr__(self) -> str:
+        return f"QuizStats(quiz_id={self.quiz_id}, attempts={self.attempts}, average={self.average})"
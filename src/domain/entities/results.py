@@ -1,19 +1,39 @@
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime, timezone
 from typing import Optional
 
+from ..ids import uuid7
+
+
+def percent_score(correct: int, total_questions: int) -> int:
+    """Whole-number percentage of correct answers; a quiz without questions scores 0."""
+    if not total_questions:
+        return 0
+    return round(100 * correct / total_questions)
+
+
 class Result:
+    __slots__ = (
+        "id",
+        "user_id",
+        "respondent_name",
+        "quiz_id",
+        "score",
+        "total_questions",
+        "taken_at",
+    )
+
     def __init__(
         self,
         id: UUID,
-        user_id: UUID,
+        user_id: Optional[UUID],
         respondent_name: str,
         quiz_id: UUID,
-        score: float,
+        score: int,
         total_questions: int,
         taken_at: Optional[datetime] = None
     ):
-        self.id = id or uuid4()
+        self.id = id or uuid7()
         self.user_id = user_id
         self.respondent_name = respondent_name
         self.quiz_id = quiz_id
@@ -21,7 +41,30 @@ class Result:
         self.total_questions = total_questions
         self.taken_at = taken_at or datetime.now(timezone.utc)
 
-    def __repr__(self):
+    @classmethod
+    def hydrate(
+        cls,
+        *,
+        id: UUID,
+        user_id: Optional[UUID],
+        respondent_name: str,
+        quiz_id: UUID,
+        score: int,
+        total_questions: int,
+        taken_at: datetime,
+    ) -> "Result":
+        """Build from complete stored values, skipping id/timestamp defaults."""
+        entity = object.__new__(cls)
+        entity.id = id
+        entity.user_id = user_id
+        entity.respondent_name = respondent_name
+        entity.quiz_id = quiz_id
+        entity.score = score
+        entity.total_questions = total_questions
+        entity.taken_at = taken_at
+        return entity
+
+    def __repr__(self) -> str:
         return f"Result(id={self.id}, user_id={self.user_id}, quiz_id={self.quiz_id}, score={self.score}/{self.total_questions})"
     
     def __eq__(self, other: object) -> bool:
@@ -1,12 +1,24 @@
 from datetime import datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 from ..enum.user_type import UserType
+from ..ids import uuid7
 
 
 class User:
     """Domain entity representing a user."""
 
+    __slots__ = (
+        "id",
+        "username",
+        "email",
+        "hashed_password",
+        "is_active",
+        "type",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         username: str,
@@ -18,7 +30,7 @@ class User:
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None,
     ):
-        self.id = id or uuid4()
+        self.id = id or uuid7()
         self.username = username
         self.email = email
         self.hashed_password = hashed_password
@@ -27,6 +39,31 @@ class User:
         self.created_at = created_at or datetime.now()
         self.updated_at = updated_at or datetime.now()
 
+    @classmethod
+    def hydrate(
+        cls,
+        *,
+        id: UUID,
+        username: str,
+        email: str,
+        hashed_password: str,
+        is_active: bool,
+        type: Optional[UserType],
+        created_at: datetime,
+        updated_at: datetime,
+    ) -> "User":
+        """Build from complete stored values, skipping id/timestamp defaults."""
+        entity = object.__new__(cls)
+        entity.id = id
+        entity.username = username
+        entity.email = email
+        entity.hashed_password = hashed_password
+        entity.is_active = is_active
+        entity.type = type
+        entity.created_at = created_at
+        entity.updated_at = updated_at
+        return entity
+
     def __repr__(self) -> str:
         return f"User(id={self.id}, username={self.username}, email={self.email})"
 
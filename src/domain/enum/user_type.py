@@ -1,7 +1,15 @@
 from enum import Enum
+from typing import Optional
 
 
 class UserType(Enum):
     ADMIN = "admin"
     STRATEGIST = "strategist"
-    ADVENTURE = "adventurous"
\ No newline at end of file
+    ADVENTURE = "adventurous"
+
+    @classmethod
+    def _missing_(cls, value: object) -> Optional["UserType"]:
+        # Rows created before users.type was written carry the column default.
+        if value == "adventure":
+            return cls.ADVENTURE
+        return None
@@ -0,0 +1,56 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple, Type
+
+from .entities.results import Result
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ResultsRecorded:
+    """Results were committed (one for a direct submission, a batch when buffered)."""
+
+    results: Tuple[Result, ...]
+
+
+Handler = Callable[[object], None]
+
+
+class EventHub:
+    """In-process publish/subscribe for domain events.
+
+    Handlers run synchronously in the publisher's thread, so they must be quick
+    (update a cache, hand off to a queue). A failing handler is logged and does
+    not affect the publisher or the other handlers.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: Dict[Type, List[Handler]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, event_type: Type, handler: Handler) -> Callable[[], None]:
+        """Register `handler` for `event_type`; returns a function that unsubscribes it."""
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append(handler)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                handlers = self._handlers.get(event_type, [])
+                if handler in handlers:
+                    handlers.remove(handler)
+
+        return unsubscribe
+
+    def publish(self, event: object) -> None:
+        with self._lock:
+            handlers = list(self._handlers.get(type(event), ()))
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("Handler %r failed for %s", handler, type(event).__name__)
+
+
+event_hub = EventHub()
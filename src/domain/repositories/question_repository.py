@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional, List
 from uuid import UUID
 
+from ..entities.item_stats import QuestionItemStats
 from ..entities.question import Question
 
 
@@ -37,3 +38,8 @@ class QuestionRepository(ABC):
     async def delete(self, question_id: UUID) -> bool:
         """Delete a question."""
         pass
+
+    @abstractmethod
+    async def get_item_stats_by_quiz(self, quiz_id: UUID) -> List[QuestionItemStats]:
+        """Get the stored item analysis of a quiz's questions."""
+        pass
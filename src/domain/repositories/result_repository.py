@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
+from ..entities.activity import ActivityBucket
+from ..entities.attempt import Answer
+from ..entities.journey_progress import QuizProgress
+from ..entities.quiz_stats import QuizStats
 from ..entities.results import Result
 
 
@@ -12,9 +17,97 @@ class ResultRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_by_quiz_id(self, quiz_id: UUID, skip: int = 0, limit: int = 100) -> List[Result]:
+    async def create_many(self, results: List[Result], skip_existing: bool = False) -> int:
+        """Insert results in one statement; returns the number of rows written."""
         pass
 
     @abstractmethod
-    async def get_by_user_id(self, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Result]:
+    async def create_with_answers(self, result: Result, answers: List[Answer]) -> Result:
+        """Store a result and its answer_results in one transaction."""
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, result_id: UUID) -> Optional[Result]:
+        pass
+
+    @abstractmethod
+    async def get_top_by_quiz(self, quiz_id: UUID, limit: int = 10) -> List[Result]:
+        """Best results first: highest score, then earliest taken_at."""
+        pass
+
+    @abstractmethod
+    async def get_by_quiz_id(
+        self,
+        quiz_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Result]:
+        """Newest first; `before` is the (taken_at, id) of the last result of the previous page."""
+        pass
+
+    @abstractmethod
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Result]:
+        pass
+
+    @abstractmethod
+    async def count_by_quiz_id(self, quiz_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    async def count_by_user_id(self, user_id: UUID) -> int:
+        pass
+
+    @abstractmethod
+    async def get_quiz_stats(self, quiz_id: UUID) -> Optional[QuizStats]:
+        """Aggregates maintained on insert; None when the quiz has no results yet."""
+        pass
+
+    @abstractmethod
+    async def count_scores_below(self, quiz_id: UUID, score: int) -> Tuple[int, int]:
+        """(results with a lower score, all results) of a quiz, from the score histogram."""
+        pass
+
+    @abstractmethod
+    async def get_journey_progress(self, journey_id: UUID, user_id: UUID) -> List[QuizProgress]:
+        """Best score, attempts and last attempt of a user on every quiz of a journey.
+
+        One grouped query; quizzes without results are included with no attempts.
+        """
+        pass
+
+    @abstractmethod
+    async def get_activity(
+        self,
+        since: datetime,
+        granularity: str = "day",
+        quiz_id: Optional[UUID] = None,
+        journey_id: Optional[UUID] = None,
+    ) -> List[ActivityBucket]:
+        """Attempts per UTC hour or day from `since`, for a quiz or all quizzes of a journey.
+
+        Read from the activity rollups; buckets without attempts are omitted.
+        """
+        pass
+
+    @abstractmethod
+    def export_columns(self, include_answers: bool = False) -> List[str]:
+        """Names of the fields of each `stream_by_quiz` row, in order."""
+        pass
+
+    @abstractmethod
+    def stream_by_quiz(
+        self, quiz_id: UUID, include_answers: bool = False, chunk_size: int = 1000
+    ) -> Iterator[Dict]:
+        """Yield a quiz's results as flat rows (one per answer with include_answers).
+
+        Rows are fetched `chunk_size` at a time and the stream is independent of
+        the request's session, so it can be consumed after the handler returns.
+        """
         pass
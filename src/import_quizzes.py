@@ -0,0 +1,47 @@
+"""Command line bulk import of quizzes from NDJSON, one QuizCreate object per line.
+
+Lines are validated against the same schema as POST /api/quizzes/import;
+see `src.infrastructure.database.quiz_import` for how they are written.
+
+    python -m src.import_quizzes quizzes.ndjson --user-id <uuid>
+    gunzip -c quizzes.ndjson.gz | python -m src.import_quizzes -
+"""
+import argparse
+import json
+import sys
+import time
+from typing import List, Optional
+from uuid import UUID
+
+from .api.schemas.quizzes import QuizCreate
+from .infrastructure.database.connection import SessionLocal
+from .infrastructure.database.quiz_import import QUIZ_IMPORT_BATCH_SIZE, QuizImporter
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Import quizzes from an NDJSON file.")
+    parser.add_argument("file", help="NDJSON file, one quiz per line ('-' for stdin)")
+    parser.add_argument("--user-id", type=UUID, help="Owner of the imported quizzes")
+    parser.add_argument("--batch-size", type=int, default=QUIZ_IMPORT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        importer = QuizImporter(db, QuizCreate, user_id=args.user_id, batch_size=args.batch_size)
+        if args.file == "-":
+            report = importer.import_stream(sys.stdin.buffer)
+        else:
+            with open(args.file, "rb") as stream:
+                report = importer.import_stream(stream)
+    elapsed = time.perf_counter() - started
+    for error in report.errors:
+        print(json.dumps({"line": error.line, "errors": error.errors}), file=sys.stderr)
+    print(
+        f"Imported {report.imported_quizzes:,} quizzes, {report.imported_questions:,} questions "
+        f"in {elapsed:.1f}s ({report.imported_questions / max(elapsed, 1e-9):,.0f} questions/s); "
+        f"{report.failed:,} of {report.lines:,} lines failed"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Item analysis of quiz questions from answer_results.
+
+Streams answer_results joined with each answer's result score in chunks,
+folds every chunk into per-question and per-option accumulators with
+NumPy bincounts, and stores in question_item_stats, per question:
+
+- p_value: share of correct answers (item difficulty, higher is easier)
+- discrimination: point-biserial correlation between answering the item
+  correctly and the result score; None when everyone or no one got it right
+- option_counts: how often each option was chosen (distractor frequencies)
+
+Memory grows with the number of distinct questions and options, not with the
+number of answers, so tens of millions of rows are processed in one pass.
+
+    python -m src.infrastructure.analytics.item_analysis
+    python -m src.infrastructure.analytics.item_analysis --quiz-id <uuid> --chunk-size 100000
+
+Requires NumPy (the optional `analytics` dependency group).
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.engine import Engine
+
+from ..database.connection import engine as default_engine
+from ..database.models import AnswerResultModel, QuestionItemStatsModel, QuestionModel, ResultsModel
+
+ACCUMULATORS = ("responses", "correct", "score_sum", "score_sq_sum", "correct_score_sum")
+
+
+class _Index:
+    """Dense integer ids for UUIDs, remembering one attribute per id."""
+
+    def __init__(self) -> None:
+        self.ids: Dict[UUID, int] = {}
+        self.keys: List[UUID] = []
+        self.owners: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, key: UUID, owner: Any) -> int:
+        index = self.ids.get(key)
+        if index is None:
+            index = self.ids[key] = len(self.keys)
+            self.keys.append(key)
+            self.owners.append(owner)
+        return index
+
+
+class ItemAnalysis:
+    """Streaming accumulator; call `add` per chunk, then `results`."""
+
+    def __init__(self) -> None:
+        self.questions = _Index()  # owner: quiz_id
+        self.options = _Index()  # owner: question index
+        self.sums = {name: np.zeros(0) for name in ACCUMULATORS}
+        self.option_counts = np.zeros(0, dtype=np.int64)
+        self.rows = 0
+
+    @staticmethod
+    def _grown(array: np.ndarray, size: int) -> np.ndarray:
+        if size <= len(array):
+            return array
+        grown = np.zeros(max(size, 2 * len(array)), dtype=array.dtype)
+        grown[: len(array)] = array
+        return grown
+
+    def add(self, rows: Sequence[Sequence[Any]]) -> None:
+        """Fold (question_id, quiz_id, selected_option_id, is_correct, score) rows in."""
+        if not rows:
+            return
+        questions, options = self.questions, self.options
+        q_index = np.fromiter((questions.get(r[0], r[1]) for r in rows), dtype=np.int64, count=len(rows))
+        o_index = np.fromiter(
+            (options.get(r[2], questions.ids[r[0]]) if r[2] is not None else -1 for r in rows),
+            dtype=np.int64,
+            count=len(rows),
+        )
+        correct = np.fromiter((r[3] for r in rows), dtype=np.float64, count=len(rows))
+        score = np.fromiter((r[4] for r in rows), dtype=np.float64, count=len(rows))
+
+        size = len(questions)
+        weights = {
+            "responses": None,
+            "correct": correct,
+            "score_sum": score,
+            "score_sq_sum": score * score,
+            "correct_score_sum": score * correct,
+        }
+        for name, weight in weights.items():
+            self.sums[name] = self._grown(self.sums[name], size)
+            self.sums[name][:size] += np.bincount(q_index, weights=weight, minlength=size)
+
+        chosen = o_index[o_index >= 0]
+        self.option_counts = self._grown(self.option_counts, len(options))
+        self.option_counts[: len(options)] += np.bincount(chosen, minlength=len(options))
+        self.rows += len(rows)
+
+    def results(self) -> List[dict]:
+        size = len(self.questions)
+        n = self.sums["responses"][:size]
+        n_correct = self.sums["correct"][:size]
+        n_wrong = n - n_correct
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = n_correct / n
+            mean = self.sums["score_sum"][:size] / n
+            std = np.sqrt(np.maximum(self.sums["score_sq_sum"][:size] / n - mean * mean, 0.0))
+            mean_correct = self.sums["correct_score_sum"][:size] / n_correct
+            mean_wrong = (self.sums["score_sum"][:size] - self.sums["correct_score_sum"][:size]) / n_wrong
+            discrimination = (mean_correct - mean_wrong) / std * np.sqrt(p * (1 - p))
+        defined = (n_correct > 0) & (n_wrong > 0) & (std > 0)
+
+        option_counts: List[Dict[str, int]] = [{} for _ in range(size)]
+        for index, count in enumerate(self.option_counts[: len(self.options)].tolist()):
+            if count:
+                option_counts[self.options.owners[index]][str(self.options.keys[index])] = count
+
+        return [
+            {
+                "question_id": self.questions.keys[i],
+                "quiz_id": self.questions.owners[i],
+                "responses": int(n[i]),
+                "correct": int(n_correct[i]),
+                "p_value": round(float(p[i]), 4),
+                "discrimination": round(float(discrimination[i]), 4) if defined[i] else None,
+                "option_counts": option_counts[i],
+            }
+            for i in range(size)
+        ]
+
+
+def analyze(engine: Engine, quiz_id: Optional[UUID] = None, chunk_size: int = 50_000) -> ItemAnalysis:
+    stmt = (
+        select(
+            AnswerResultModel.question_id,
+            QuestionModel.quiz_id,
+            AnswerResultModel.selected_option_id,
+            AnswerResultModel.is_correct,
+            ResultsModel.score,
+        )
+        .join(ResultsModel, ResultsModel.id == AnswerResultModel.result_id)
+        .join(QuestionModel, QuestionModel.id == AnswerResultModel.question_id)
+    )
+    if quiz_id is not None:
+        stmt = stmt.where(QuestionModel.quiz_id == quiz_id)
+
+    analysis = ItemAnalysis()
+    with engine.connect() as conn:
+        result = conn.execution_options(stream_results=True, yield_per=chunk_size).execute(stmt)
+        for rows in result.partitions():
+            analysis.add(rows)
+    return analysis
+
+
+def store(engine: Engine, rows: List[dict], quiz_id: Optional[UUID] = None, batch_size: int = 5_000) -> None:
+    """Replace the stored analysis (of one quiz, or of everything) in a single transaction."""
+    computed_at = datetime.now(timezone.utc)
+    with engine.begin() as conn:
+        clear = delete(QuestionItemStatsModel)
+        if quiz_id is not None:
+            clear = clear.where(QuestionItemStatsModel.quiz_id == quiz_id)
+        conn.execute(clear)
+        for start in range(0, len(rows), batch_size):
+            conn.execute(
+                insert(QuestionItemStatsModel),
+                [{**row, "computed_at": computed_at} for row in rows[start:start + batch_size]],
+            )
+
+
+def run(engine: Engine = default_engine, quiz_id: Optional[UUID] = None, chunk_size: int = 50_000) -> int:
+    started = time.perf_counter()
+    analysis = analyze(engine, quiz_id=quiz_id, chunk_size=chunk_size)
+    rows = analysis.results()
+    store(engine, rows, quiz_id=quiz_id)
+    print(
+        f"Analyzed {analysis.rows:,} answers for {len(rows):,} questions "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+    return len(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compute question item statistics.")
+    parser.add_argument("--quiz-id", type=UUID, help="Only analyze this quiz")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="Rows fetched per chunk")
+    args = parser.parse_args(argv)
+    run(quiz_id=args.quiz_id, chunk_size=args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+"""Hourly and daily attempt rollups per quiz.
+
+Every result insert adds to its quiz's row in quiz_activity_hourly (see
+ResultRepositoryImpl._record_stats). Compaction folds the hours older than
+ROLLUP_HOURLY_RETENTION_DAYS into quiz_activity_daily, one day per
+transaction, so the hourly table stays small and time-range queries read at
+most a few thousand rollup rows instead of scanning results.
+
+The hourly rows are removed with DELETE ... RETURNING and added to the daily
+rows in the same transaction, so concurrent inserts and compactions (several
+workers) never count an hour twice or lose one.
+
+    python -m src.infrastructure.analytics.rollups compact
+    python -m src.infrastructure.analytics.rollups rebuild
+"""
+import argparse
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, DefaultDict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, delete, func, insert, literal_column, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..database.connection import engine as default_engine
+from ..database.models import QuizActivityDailyModel, QuizActivityHourlyModel, ResultsModel
+from ..database.upsert import upsert
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_HOURLY_RETENTION_DAYS = int(os.getenv("ROLLUP_HOURLY_RETENTION_DAYS", "7"))
+ROLLUP_COMPACTION_INTERVAL_SECONDS = float(os.getenv("ROLLUP_COMPACTION_INTERVAL_SECONDS", "3600"))
+
+
+def start_of_day(moment: datetime) -> datetime:
+    """Start of the UTC day of a timestamp, naive like the stored timestamps."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def compaction_cutoff(retention_days: int, now: Optional[datetime] = None) -> datetime:
+    """Hours before this moment are compacted; it is always the start of a day."""
+    return start_of_day(now or datetime.now(timezone.utc)) - timedelta(days=retention_days)
+
+
+def _compact_day(db: Session, day_start: datetime, day_end: datetime) -> int:
+    rows = db.execute(
+        delete(QuizActivityHourlyModel)
+        .where(
+            QuizActivityHourlyModel.bucket_start >= day_start,
+            QuizActivityHourlyModel.bucket_start < day_end,
+        )
+        .returning(
+            QuizActivityHourlyModel.quiz_id,
+            QuizActivityHourlyModel.attempts,
+            QuizActivityHourlyModel.score_sum,
+        )
+    ).all()
+    if not rows:
+        return 0
+    totals: DefaultDict[UUID, List[int]] = defaultdict(lambda: [0, 0])
+    for quiz_id, attempts, score_sum in rows:
+        totals[quiz_id][0] += attempts
+        totals[quiz_id][1] += score_sum
+    daily = upsert(db, QuizActivityDailyModel).values(
+        [
+            {
+                "quiz_id": quiz_id,
+                "day": day_start.date(),
+                "attempts": attempts,
+                "score_sum": score_sum,
+            }
+            for quiz_id, (attempts, score_sum) in sorted(
+                totals.items(), key=lambda item: str(item[0])
+            )
+        ]
+    )
+    db.execute(
+        daily.on_conflict_do_update(
+            index_elements=[QuizActivityDailyModel.quiz_id, QuizActivityDailyModel.day],
+            set_={
+                "attempts": QuizActivityDailyModel.attempts + daily.excluded.attempts,
+                "score_sum": QuizActivityDailyModel.score_sum + daily.excluded.score_sum,
+            },
+        )
+    )
+    return len(rows)
+
+
+def compact(
+    engine: Engine = default_engine,
+    retention_days: int = ROLLUP_HOURLY_RETENTION_DAYS,
+    now: Optional[datetime] = None,
+) -> int:
+    """Fold hourly rows older than the retention window into daily rows; returns how many."""
+    cutoff = compaction_cutoff(retention_days, now)
+    compacted = 0
+    with Session(engine) as db:
+        while True:
+            with db.begin():
+                oldest = db.execute(
+                    select(func.min(QuizActivityHourlyModel.bucket_start)).where(
+                        QuizActivityHourlyModel.bucket_start < cutoff
+                    )
+                ).scalar()
+                if oldest is None:
+                    break
+                day_start = start_of_day(oldest)
+                compacted += _compact_day(db, day_start, day_start + timedelta(days=1))
+    return compacted
+
+
+def _hour_of(engine: Engine, column: ColumnElement[datetime]) -> ColumnElement[Any]:
+    if engine.dialect.name == "postgresql":
+        return func.date_trunc("hour", column)
+    # Same text format SQLAlchemy stores SQLite datetimes in, so range filters compare correctly
+    return func.strftime(literal_column("'%Y-%m-%d %H:00:00.000000'"), column)
+
+
+def rebuild(
+    engine: Engine = default_engine, retention_days: int = ROLLUP_HOURLY_RETENTION_DAYS
+) -> None:
+    """Recompute the rollups from results (after bulk loads, which bypass them), then compact."""
+    started = time.perf_counter()
+    hour = _hour_of(engine, ResultsModel.taken_at)
+    with engine.begin() as conn:
+        conn.execute(delete(QuizActivityDailyModel))
+        conn.execute(delete(QuizActivityHourlyModel))
+        conn.execute(
+            insert(QuizActivityHourlyModel).from_select(
+                ["quiz_id", "bucket_start", "attempts", "score_sum"],
+                select(
+                    ResultsModel.quiz_id, hour, func.count(), func.sum(ResultsModel.score)
+                ).group_by(ResultsModel.quiz_id, hour),
+            )
+        )
+    compacted = compact(engine, retention_days)
+    print(
+        f"  activity rollups rebuilt in {time.perf_counter() - started:.1f}s "
+        f"({compacted:,} hourly rows compacted)"
+    )
+
+
+class RollupCompactor:
+    """Runs the compaction every `interval` seconds in a worker thread."""
+
+    def __init__(
+        self,
+        engine: Engine = default_engine,
+        interval: float = ROLLUP_COMPACTION_INTERVAL_SECONDS,
+        retention_days: int = ROLLUP_HOURLY_RETENTION_DAYS,
+    ):
+        self.engine = engine
+        self.interval = interval
+        self.retention_days = retention_days
+        self.last_run: Optional[datetime] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if self.running or self.interval <= 0:
+            return
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                compacted = await asyncio.to_thread(compact, self.engine, self.retention_days)
+                self.last_run = datetime.now(timezone.utc)
+                if compacted:
+                    logger.info("Compacted %d hourly activity rows", compacted)
+            except Exception:
+                logger.exception("Activity rollup compaction failed")
+            await asyncio.sleep(self.interval)
+
+
+rollup_compactor = RollupCompactor()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Maintain the hourly/daily activity rollups.")
+    parser.add_argument("command", choices=["compact", "rebuild"])
+    parser.add_argument(
+        "--retention-days",
+        type=int,
+        default=ROLLUP_HOURLY_RETENTION_DAYS,
+        help="Keep hourly rows for this many days",
+    )
+    args = parser.parse_args(argv)
+    if args.command == "rebuild":
+        rebuild(retention_days=args.retention_days)
+    else:
+        print(f"Compacted {compact(retention_days=args.retention_days):,} hourly rows")
+
+
+if __name__ == "__main__":
+    main()
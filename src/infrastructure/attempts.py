@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from ..domain.entities.attempt import Answer, AnswerKey, Attempt
+from .cache import TTLStore, create_store_from_env
+
+ATTEMPT_TTL_SECONDS = float(os.getenv("ATTEMPT_TTL_SECONDS", "7200"))
+# One entry per attempt plus one per answer; live entries are never evicted
+ATTEMPT_STORE_MAX_ENTRIES = int(os.getenv("ATTEMPT_STORE_MAX_ENTRIES", "1000000"))
+ANSWER_KEY_CACHE_TTL_SECONDS = float(os.getenv("ANSWER_KEY_CACHE_TTL_SECONDS", "300"))
+ANSWER_KEY_CACHE_MAX_QUIZZES = int(os.getenv("ANSWER_KEY_CACHE_MAX_QUIZZES", "1000"))
+
+
+class AnswerKeyCache:
+    """Answer keys of recently attempted quizzes, so answers are checked without the database.
+
+    Keys are dropped when the quiz's questions change in this process; the TTL
+    bounds staleness from changes made by other processes.
+    """
+
+    def __init__(
+        self, ttl: float = ANSWER_KEY_CACHE_TTL_SECONDS, max_quizzes: int = ANSWER_KEY_CACHE_MAX_QUIZZES
+    ):
+        self.ttl = ttl
+        self.max_quizzes = max_quizzes
+        self._keys: "OrderedDict[UUID, Tuple[AnswerKey, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, quiz_id: UUID) -> Optional[AnswerKey]:
+        with self._lock:
+            entry = self._keys.get(quiz_id)
+            if entry is None or time.monotonic() - entry[1] > self.ttl:
+                return None
+            self._keys.move_to_end(quiz_id)
+            return entry[0]
+
+    def put(self, key: AnswerKey) -> None:
+        with self._lock:
+            self._keys[key.quiz_id] = (key, time.monotonic())
+            self._keys.move_to_end(key.quiz_id)
+            while len(self._keys) > self.max_quizzes:
+                self._keys.popitem(last=False)
+
+    def invalidate(self, quiz_id: UUID) -> None:
+        with self._lock:
+            self._keys.pop(quiz_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+
+
+class AttemptStore:
+    """Attempts in progress, kept in the TTL store until they are finished or expire.
+
+    Each answer is stored under its own key with a set-if-absent write, so the
+    first answer to a question wins and concurrent answers to different
+    questions never overwrite each other. The store is not shared with the
+    cache, so cached responses cannot push out an attempt in progress.
+    """
+
+    def __init__(self, store: TTLStore, ttl: float = ATTEMPT_TTL_SECONDS):
+        self.store = store
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(attempt_id: UUID) -> str:
+        return f"attempt:{attempt_id}"
+
+    def _answer_key(self, attempt_id: UUID, question_id: UUID) -> str:
+        return f"{self._key(attempt_id)}:answer:{question_id}"
+
+    async def save(self, attempt: Attempt) -> None:
+        data = {
+            "quiz_id": str(attempt.quiz_id),
+            "user_id": str(attempt.user_id) if attempt.user_id else None,
+            "respondent_name": attempt.respondent_name,
+            "started_at": attempt.started_at.isoformat(),
+        }
+        await self.store.set(self._key(attempt.id), json.dumps(data).encode(), self.ttl)
+
+    async def get(self, attempt_id: UUID) -> Optional[Attempt]:
+        raw = await self.store.get(self._key(attempt_id))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return Attempt(
+            id=attempt_id,
+            quiz_id=UUID(data["quiz_id"]),
+            user_id=UUID(data["user_id"]) if data["user_id"] else None,
+            respondent_name=data["respondent_name"],
+            started_at=datetime.fromisoformat(data["started_at"]),
+        )
+
+    def expires_at(self, attempt: Attempt) -> float:
+        return attempt.started_at.timestamp() + self.ttl
+
+    async def record_answer(self, attempt: Attempt, answer: Answer) -> Answer:
+        """Store the answer unless the question was answered already; returns the stored one."""
+        key = self._answer_key(attempt.id, answer.question_id)
+        data = json.dumps(
+            {
+                "option_id": str(answer.selected_option_id),
+                "is_correct": answer.is_correct,
+                "answered_at": answer.answered_at.isoformat(),
+            }
+        ).encode()
+        ttl = max(self.expires_at(attempt) - time.time(), 1.0)
+        if await self.store.add(key, data, ttl):
+            return answer
+        existing = await self._load_answer(attempt.id, answer.question_id)
+        return existing or answer
+
+    async def _load_answer(self, attempt_id: UUID, question_id: UUID) -> Optional[Answer]:
+        raw = await self.store.get(self._answer_key(attempt_id, question_id))
+        if raw is None:
+            return None
+        data = json.loads(raw)
+        return Answer(
+            question_id=question_id,
+            selected_option_id=UUID(data["option_id"]),
+            is_correct=data["is_correct"],
+            answered_at=datetime.fromisoformat(data["answered_at"]),
+        )
+
+    async def answers(self, attempt: Attempt, question_ids: Iterable[UUID]) -> List[Answer]:
+        answers = []
+        for question_id in question_ids:
+            answer = await self._load_answer(attempt.id, question_id)
+            if answer is not None:
+                answers.append(answer)
+        return answers
+
+    async def claim(self, attempt: Attempt) -> bool:
+        """Mark the attempt as finishing; only the first caller gets True."""
+        return await self.store.add(f"{self._key(attempt.id)}:finishing", b"1", 60)
+
+    async def release(self, attempt: Attempt) -> None:
+        await self.store.delete(f"{self._key(attempt.id)}:finishing")
+
+    async def discard(self, attempt: Attempt, question_ids: Iterable[UUID]) -> None:
+        await self.store.delete(self._key(attempt.id))
+        for question_id in question_ids:
+            await self.store.delete(self._answer_key(attempt.id, question_id))
+
+
+answer_key_cache = AnswerKeyCache()
+attempt_store = AttemptStore(
+    create_store_from_env(max_entries=ATTEMPT_STORE_MAX_ENTRIES, evict=False)
+)
@@ -1,5 +1,7 @@
 from passlib.context import CryptContext
 
+from ..observability import traced
+
 # Contexto de hash usando Argon2 (recomendado)
 pwd_context = CryptContext(
     schemes=["argon2"],
@@ -7,6 +9,7 @@ pwd_context = CryptContext(
 )
 
 
+@traced("argon2.hash")
 def get_password_hash(password: str) -> str:
     """
     Gera o hash da senha usando Argon2.
@@ -15,6 +18,7 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+@traced("argon2.verify")
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verifica se a senha informada corresponde ao hash armazenado.
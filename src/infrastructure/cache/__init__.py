@@ -0,0 +1,13 @@
+from .base import StoreFullError, TTLStore
+from .factory import cache_store, create_store_from_env
+from .memory import MemoryTTLStore
+from .redis_store import RedisTTLStore
+
+__all__ = [
+    "StoreFullError",
+    "TTLStore",
+    "cache_store",
+    "create_store_from_env",
+    "MemoryTTLStore",
+    "RedisTTLStore",
+]
@@ -0,0 +1,36 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from ..health import CheckResult
+
+
+class StoreFullError(Exception):
+    """The store cannot take a new key without dropping one that has not expired."""
+
+
+class TTLStore(ABC):
+    """Byte values under string keys that expire after a per-key TTL."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        """Set `key` only if it is absent; returns whether it was set."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def health_check(self) -> CheckResult:
+        pass
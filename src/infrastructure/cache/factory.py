@@ -0,0 +1,25 @@
+import os
+
+from .base import TTLStore
+from .memory import MemoryTTLStore
+from .redis_store import RedisTTLStore
+
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def create_store_from_env(max_entries: int = CACHE_MAX_ENTRIES, evict: bool = True) -> TTLStore:
+    """Build the store selected by CACHE_BACKEND (memory or redis).
+
+    `max_entries` and `evict` only apply to the memory backend; Redis keeps
+    its server's memory limit and eviction policy.
+    """
+    if CACHE_BACKEND == "memory":
+        return MemoryTTLStore(max_entries=max_entries, evict=evict)
+    if CACHE_BACKEND == "redis":
+        return RedisTTLStore(REDIS_URL)
+    raise ValueError(f"Unknown CACHE_BACKEND '{CACHE_BACKEND}'")
+
+
+cache_store = create_store_from_env()
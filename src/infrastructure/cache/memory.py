@@ -0,0 +1,70 @@
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from ..health import CheckResult
+from .base import StoreFullError, TTLStore
+
+
+class MemoryTTLStore(TTLStore):
+    """Process-local store; the oldest keys are dropped beyond `max_entries`.
+
+    With `evict=False` live keys are never dropped: a full store first
+    purges expired keys, then refuses new ones with StoreFullError. Only
+    shared by the requests of one worker process, so with several workers
+    use the Redis store for guarantees that hold across them.
+    """
+
+    def __init__(self, max_entries: int = 10000, evict: bool = True):
+        self.max_entries = max_entries
+        self.evict = evict
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._purged_at = float("-inf")
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry[0]
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        # A full scan, so at most once a second however often the store is full
+        if now - self._purged_at < 1.0:
+            return
+        self._purged_at = now
+        for key in [key for key, (_, expires) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+
+    def _store(self, key: str, value: bytes, ttl: float) -> None:
+        if not self.evict and key not in self._entries and len(self._entries) >= self.max_entries:
+            self._purge_expired()
+            if len(self._entries) >= self.max_entries:
+                raise StoreFullError(f"Store is full ({self.max_entries} live entries)")
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._live(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._store(key, value, ttl)
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        if self._live(key) is not None:
+            return False
+        self._store(key, value, ttl)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def health_check(self) -> CheckResult:
+        return CheckResult(
+            "cache", True, details={"backend": "memory", "entries": len(self._entries)}
+        )
@@ -0,0 +1,51 @@
+import time
+from typing import Optional
+
+from ..health import CheckResult
+from .base import TTLStore
+
+
+class RedisTTLStore(TTLStore):
+    """Store shared by every worker, backed by Redis key expiry.
+
+    Requires the `redis` package (the optional `cache` dependency group).
+    """
+
+    def __init__(self, url: str, socket_timeout: float = 1.0):
+        try:
+            import redis
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the redis package (poetry install --with cache)"
+            ) from e
+        self.url = url
+        self._client = aioredis.Redis.from_url(url, socket_timeout=socket_timeout)
+        # Health checks run in a worker thread, outside the event loop
+        self._sync_client = redis.Redis.from_url(url, socket_timeout=socket_timeout)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._client.set(key, value, px=max(int(ttl * 1000), 1))
+
+    async def add(self, key: str, value: bytes, ttl: float) -> bool:
+        return bool(await self._client.set(key, value, px=max(int(ttl * 1000), 1), nx=True))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+        self._sync_client.close()
+
+    def health_check(self) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            self._sync_client.ping()
+        except Exception as e:
+            return CheckResult("cache", False, (time.perf_counter() - started) * 1000, error=str(e))
+        return CheckResult(
+            "cache", True, (time.perf_counter() - started) * 1000, details={"backend": "redis"}
+        )
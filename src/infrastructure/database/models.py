@@ -1,16 +1,16 @@
-from sqlalchemy import JSON, Column, Integer, SmallInteger, String, Boolean, DateTime, ForeignKey, Text, ARRAY
+from sqlalchemy import JSON, BigInteger, Column, Date, Float, Index, Integer, SmallInteger, String, Boolean, DateTime, ForeignKey, Text, ARRAY
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
-import uuid
 
+from ...domain.ids import uuid7
 from .connection import Base
 
 
 class UserModel(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     username = Column(String(50), unique=True, nullable=False, index=True)
     email = Column(String(100), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255), nullable=False)
@@ -25,7 +25,7 @@ class UserModel(Base):
 class JourneyModel(Base):
     __tablename__ = "journeys"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
@@ -39,7 +39,7 @@ class JourneyModel(Base):
 class QuizModel(Base):
     __tablename__ = "quizzes"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=False)
     journey_id = Column(UUID(as_uuid=True), ForeignKey("journeys.id"), nullable=True)
@@ -48,6 +48,9 @@ class QuizModel(Base):
     feedback_mode = Column(String(20), nullable=False, default="final")
     difficulty = Column(String(20), nullable=True)
     image_url = Column(String(500), nullable=True)
+    # Per-attempt order is derived from the attempt id, so it is never stored
+    shuffle_questions = Column(Boolean, nullable=False, default=False)
+    shuffle_options = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime, default=datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=datetime.now(timezone.utc), onupdate=datetime.now(timezone.utc), nullable=False)
 
@@ -59,7 +62,7 @@ class QuizModel(Base):
 class QuestionModel(Base):
     __tablename__ = "questions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     text = Column(Text, nullable=False)
     quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False)
     correct_answer = Column(SmallInteger, nullable=False) # referencia o reference_id of the correct option
@@ -79,7 +82,7 @@ class QuestionModel(Base):
 class QuestionOptionModel(Base):
     __tablename__ = "question_options"
 
-    id = Column(UUID(as_uuid=True), primary_key=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), nullable=False)
     reference_id = Column(SmallInteger, nullable=True)
     text = Column(Text, nullable=True)
@@ -95,7 +98,7 @@ class QuestionOptionModel(Base):
 class ResultsModel(Base):
     __tablename__ = "results"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True) # Allow null for anonymous users
     respondent_name = Column(String(200), nullable=False)
     quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False)
@@ -106,10 +109,66 @@ class ResultsModel(Base):
     user = relationship("UserModel")
     quiz = relationship("QuizModel")
 
+    __table_args__ = (
+        Index("ix_results_quiz_score_taken_at", "quiz_id", score.desc(), "taken_at"),
+        # Keyset paging of the newest-first listings
+        Index("ix_results_quiz_taken_at_id", "quiz_id", "taken_at", "id"),
+        Index("ix_results_user_taken_at_id", "user_id", "taken_at", "id"),
+    )
+
+class QuizStatsModel(Base):
+    """Running aggregates of a quiz's results, updated with every result insert."""
+    __tablename__ = "quiz_stats"
+
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), primary_key=True)
+    attempts = Column(BigInteger, nullable=False, default=0)
+    score_sum = Column(BigInteger, nullable=False, default=0)
+    score_sq_sum = Column(BigInteger, nullable=False, default=0)
+    min_score = Column(Integer, nullable=True)
+    max_score = Column(Integer, nullable=True)
+    updated_at = Column(DateTime, nullable=False)
+
+class QuizScoreCountModel(Base):
+    """Score histogram of a quiz: one row per distinct score (0-100)."""
+    __tablename__ = "quiz_score_counts"
+
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), primary_key=True)
+    score = Column(SmallInteger, primary_key=True)
+    attempts = Column(BigInteger, nullable=False, default=0)
+
+class UserResultCountModel(Base):
+    """Number of results of a user, updated with every result insert."""
+    __tablename__ = "user_result_counts"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True)
+    attempts = Column(BigInteger, nullable=False, default=0)
+
+class QuizActivityHourlyModel(Base):
+    """Attempts and score sum per quiz per UTC hour, updated with every result insert.
+
+    Hours older than the retention window are folded into quiz_activity_daily
+    by the rollup compaction.
+    """
+    __tablename__ = "quiz_activity_hourly"
+
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    attempts = Column(BigInteger, nullable=False, default=0)
+    score_sum = Column(BigInteger, nullable=False, default=0)
+
+class QuizActivityDailyModel(Base):
+    """Attempts and score sum per quiz per UTC day, for hours that were compacted."""
+    __tablename__ = "quiz_activity_daily"
+
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    attempts = Column(BigInteger, nullable=False, default=0)
+    score_sum = Column(BigInteger, nullable=False, default=0)
+
 class AnswerResultModel(Base):
     __tablename__ = "answer_results"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     result_id = Column(UUID(as_uuid=True), ForeignKey("results.id"), nullable=False)
     question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), nullable=False)
     selected_option_id = Column(UUID(as_uuid=True), ForeignKey("question_options.id"), nullable=True)
@@ -118,4 +177,17 @@ class AnswerResultModel(Base):
 
     result = relationship("ResultsModel")
     question = relationship("QuestionModel")
-    selected_option = relationship("QuestionOptionModel")
\ No newline at end of file
+    selected_option = relationship("QuestionOptionModel")
+
+class QuestionItemStatsModel(Base):
+    """Item analysis of a question, written by the item_analysis batch job."""
+    __tablename__ = "question_item_stats"
+
+    question_id = Column(UUID(as_uuid=True), ForeignKey("questions.id"), primary_key=True)
+    quiz_id = Column(UUID(as_uuid=True), ForeignKey("quizzes.id"), nullable=False, index=True)
+    responses = Column(BigInteger, nullable=False)
+    correct = Column(BigInteger, nullable=False)
+    p_value = Column(Float, nullable=False)  # share of correct answers, higher is easier
+    discrimination = Column(Float, nullable=True)  # point-biserial vs. the result score
+    option_counts = Column(JSON, nullable=False)  # {option_id: times selected}
+    computed_at = Column(DateTime, nullable=False)
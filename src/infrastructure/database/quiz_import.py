@@ -0,0 +1,274 @@
+"""Bulk import of quizzes from NDJSON, one quiz per line.
+
+Every line is validated against the schema the caller passes in (the API's
+QuizCreate, from the route and from `src.import_quizzes`) plus the checks
+the question use cases make, so an imported quiz is exactly what
+POST /api/quizzes/ would have created. Valid quizzes are written
+QUIZ_IMPORT_BATCH_SIZE at a time, each batch in one transaction of
+multi-row INSERTs; invalid lines are skipped and reported by line number.
+
+Input is read in chunks and split into lines incrementally, so memory only
+grows with the batch size and the longest line, not with the file.
+"""
+import os
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from ...domain.ids import uuid7
+from .models import JourneyModel, QuestionModel, QuestionOptionModel, QuizModel
+
+QUIZ_IMPORT_BATCH_SIZE = int(os.getenv("QUIZ_IMPORT_BATCH_SIZE", "500"))
+QUIZ_IMPORT_MAX_LINE_BYTES = int(os.getenv("QUIZ_IMPORT_MAX_LINE_BYTES", str(1024 * 1024)))
+QUIZ_IMPORT_MAX_ERRORS = int(os.getenv("QUIZ_IMPORT_MAX_ERRORS", "1000"))
+
+READ_CHUNK_BYTES = 64 * 1024
+
+
+class LineError:
+    __slots__ = ("line", "errors")
+
+    def __init__(self, line: int, errors: List[str]):
+        self.line = line
+        self.errors = errors
+
+
+class ImportReport:
+    """What an import did; only the first `max_errors` failed lines are kept."""
+
+    def __init__(self, max_errors: int = QUIZ_IMPORT_MAX_ERRORS):
+        self.max_errors = max_errors
+        self.lines = 0
+        self.imported_quizzes = 0
+        self.imported_questions = 0
+        self.failed = 0
+        self.errors: List[LineError] = []
+
+    @property
+    def errors_truncated(self) -> bool:
+        return self.failed > len(self.errors)
+
+    def fail(self, line: int, errors: List[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append(LineError(line, errors))
+
+
+class LineSplitter:
+    """Splits byte chunks into numbered lines as they arrive.
+
+    Lines longer than `max_bytes` are not buffered: they are yielded as None
+    once their end is reached, so one bad line cannot exhaust memory.
+    """
+
+    def __init__(self, max_bytes: int = QUIZ_IMPORT_MAX_LINE_BYTES):
+        self.max_bytes = max_bytes
+        self.number = 0
+        self._buffer = bytearray()
+        self._too_long = False
+
+    def feed(self, chunk: bytes) -> Iterator[Tuple[int, Optional[bytes]]]:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                break
+            yield self._line(chunk[start:end])
+            start = end + 1
+        self._append(chunk[start:])
+
+    def close(self) -> Iterator[Tuple[int, Optional[bytes]]]:
+        if self._buffer or self._too_long:
+            yield self._line(b"")
+
+    def _append(self, part: bytes) -> None:
+        if self._too_long:
+            return
+        self._buffer += part
+        if len(self._buffer) > self.max_bytes:
+            self._buffer.clear()
+            self._too_long = True
+
+    def _line(self, tail: bytes) -> Tuple[int, Optional[bytes]]:
+        self._append(tail)
+        self.number += 1
+        line = None if self._too_long else bytes(self._buffer)
+        self._buffer.clear()
+        self._too_long = False
+        return self.number, line
+
+
+def _validation_errors(error: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in e['loc']) or 'quiz'}: {e['msg']}" for e in error.errors()
+    ]
+
+
+def _question_errors(quiz: Any) -> List[str]:
+    errors = []
+    for index, question in enumerate(quiz.questions or []):
+        reference_ids = [opt.reference_id for opt in question.options]
+        if question.correct_answer not in reference_ids:
+            errors.append(f"questions.{index}: Correct answer must be one of the options")
+        if len(reference_ids) != len(set(reference_ids)):
+            errors.append(f"questions.{index}: Option reference_ids must be unique")
+    return errors
+
+
+class QuizImporter:
+    """Validates lines and writes the valid quizzes in batched transactions.
+
+    `schema` parses one line into a quiz with its questions and options,
+    QuizCreate in practice. Call `add` for every line, `flush` whenever
+    `full` (and once at the end); `import_stream` does both for a file object.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        schema: Type[BaseModel],
+        user_id: Optional[UUID] = None,
+        batch_size: int = QUIZ_IMPORT_BATCH_SIZE,
+        max_errors: int = QUIZ_IMPORT_MAX_ERRORS,
+    ):
+        self.db = db
+        self.schema = schema
+        self.user_id = user_id
+        self.batch_size = batch_size
+        self.report = ImportReport(max_errors)
+        self._pending: List[Tuple[int, Any]] = []
+
+    @property
+    def full(self) -> bool:
+        return len(self._pending) >= self.batch_size
+
+    def add(self, number: int, line: Optional[bytes]) -> None:
+        if line is None:
+            self.report.lines += 1
+            self.report.fail(number, ["Line is too long"])
+            return
+        if not line.strip():
+            return
+        self.report.lines += 1
+        try:
+            quiz = self.schema.model_validate_json(line)
+        except ValidationError as e:
+            self.report.fail(number, _validation_errors(e))
+            return
+        errors = _question_errors(quiz)
+        if errors:
+            self.report.fail(number, errors)
+            return
+        self._pending.append((number, quiz))
+
+    def _foreign_journeys(self, batch: List[Tuple[int, Any]]) -> set:
+        journey_ids = {quiz.journey_id for _, quiz in batch if quiz.journey_id}
+        if not journey_ids:
+            return set()
+        rows = self.db.execute(
+            select(JourneyModel.id, JourneyModel.user_id).where(JourneyModel.id.in_(journey_ids))
+        )
+        owners: Dict[UUID, UUID] = {journey_id: user_id for journey_id, user_id in rows}
+        return {
+            journey_id
+            for journey_id in journey_ids
+            if journey_id not in owners
+            or (self.user_id is not None and owners[journey_id] != self.user_id)
+        }
+
+    def flush(self) -> None:
+        """Write the pending quizzes in one transaction; a failed batch fails all its lines."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        foreign: set = set()
+        try:
+            foreign = self._foreign_journeys(batch)
+            quizzes: List[Dict] = []
+            questions: List[Dict] = []
+            options: List[Dict] = []
+            now = datetime.now(timezone.utc)
+            for number, quiz in batch:
+                if quiz.journey_id in foreign:
+                    self.report.fail(number, ["journey_id: Journey not found or not yours"])
+                    continue
+                quiz_id = uuid7()
+                quizzes.append(
+                    {
+                        "id": quiz_id,
+                        "title": quiz.title,
+                        "description": quiz.description,
+                        "journey_id": quiz.journey_id,
+                        "user_id": self.user_id,
+                        "estimated_time": quiz.estimated_time,
+                        "feedback_mode": quiz.feedback_mode.value,
+                        "difficulty": quiz.difficulty.value if quiz.difficulty else None,
+                        "image_url": quiz.image_url,
+                        "shuffle_questions": quiz.shuffle_questions,
+                        "shuffle_options": quiz.shuffle_options,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                )
+                for question in quiz.questions or []:
+                    question_id = uuid7()
+                    questions.append(
+                        {
+                            "id": question_id,
+                            "text": question.text,
+                            "quiz_id": quiz_id,
+                            "correct_answer": question.correct_answer,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                    )
+                    options.extend(
+                        {
+                            "id": uuid7(),
+                            "question_id": question_id,
+                            "reference_id": opt.reference_id,
+                            "text": opt.text,
+                            "order": opt.order,
+                            "is_correct": opt.is_correct,
+                            "image_url": opt.image_url,
+                            "metadata_json": opt.metadata,
+                            "created_at": now,
+                            "updated_at": now,
+                        }
+                        for opt in question.options
+                    )
+            if quizzes:
+                self.db.execute(insert(QuizModel), quizzes)
+            if questions:
+                self.db.execute(insert(QuestionModel), questions)
+            if options:
+                self.db.execute(insert(QuestionOptionModel), options)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            for number, quiz in batch:
+                if quiz.journey_id not in foreign:
+                    self.report.fail(number, [f"Batch failed: {type(e).__name__}"])
+            return
+        self.report.imported_quizzes += len(quizzes)
+        self.report.imported_questions += len(questions)
+
+    def import_chunks(self, chunks: Iterable[bytes]) -> ImportReport:
+        lines = LineSplitter()
+        for chunk in chunks:
+            for number, line in lines.feed(chunk):
+                self.add(number, line)
+                if self.full:
+                    self.flush()
+        for number, line in lines.close():
+            self.add(number, line)
+        self.flush()
+        return self.report
+
+    def import_stream(self, stream: BinaryIO) -> ImportReport:
+        return self.import_chunks(iter(lambda: stream.read(READ_CHUNK_BYTES), b""))
+
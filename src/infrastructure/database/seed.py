@@ -1,6 +1,30 @@
+import argparse
+import io
+import random
+import time
+import uuid
+from array import array
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
-from src.infrastructure.database.models import UserModel
-from src.infrastructure.database.connection import SessionLocal
+from src.infrastructure.database.models import (
+    AnswerResultModel,
+    JourneyModel,
+    QuestionModel,
+    QuestionOptionModel,
+    QuizModel,
+    QuizScoreCountModel,
+    QuizStatsModel,
+    ResultsModel,
+    UserModel,
+    UserResultCountModel,
+)
+from src.infrastructure.database.connection import SessionLocal, engine as default_engine
+from src.infrastructure.analytics.rollups import rebuild as rebuild_activity_rollups
 from passlib.context import CryptContext
 
 def seed_user():
@@ -30,5 +54,384 @@ def seed_user():
     finally:
         db.close()
 
+
+# --- Synthetic dataset -------------------------------------------------------------------------
+
+PRESETS = {
+    "small": dict(users=1_000, quizzes=5_000, questions=10, results=100_000),
+    "medium": dict(users=20_000, quizzes=100_000, questions=15, results=5_000_000),
+    "production": dict(users=100_000, quizzes=1_000_000, questions=20, results=100_000_000),
+}
+
+USERS, JOURNEYS, QUIZZES, QUESTIONS, OPTIONS, RESULTS, ANSWERS = range(1, 8)
+DIFFICULTIES = ["facil", "medio", "dificil", "expert"]
+Row = Tuple
+
+
+class SyntheticDataset:
+    """Generates a production-shaped dataset and bulk loads it.
+
+    Ids are derived from (table, row index) instead of being kept in memory, so a
+    result can reference its quiz by index alone; only the per-quiz question
+    counts and offsets are stored (about 10 bytes per quiz). Distributions are
+    skewed on purpose: a few authors write most quizzes, a few quizzes get most
+    attempts, recent days see more attempts than old ones and scores follow a
+    beta curve centred around 65%.
+    """
+
+    def __init__(
+        self,
+        users: int,
+        quizzes: int,
+        questions: int,
+        results: int,
+        options: int = 4,
+        answer_sample_rate: float = 0.0,
+        days: int = 365,
+        seed: int = 42,
+    ):
+        self.users = users
+        self.quizzes = quizzes
+        self.questions = questions
+        self.results = results
+        self.options = options
+        self.answer_sample_rate = answer_sample_rate
+        self.days = days
+        self.seed = seed
+        self.journeys = max(users // 10, 1)
+        self.now = datetime.utcnow().replace(microsecond=0)
+        self._prefix = random.Random(seed).getrandbits(64) << 64
+        rng = random.Random(seed)
+        self.question_counts = array("H", (self._question_count(rng) for _ in range(quizzes)))
+        self.question_offsets = array("Q", [0]) * quizzes
+        total = 0
+        for i, count in enumerate(self.question_counts):
+            self.question_offsets[i] = total
+            total += count
+        self.total_questions = total
+
+    def _question_count(self, rng: random.Random) -> int:
+        return max(1, min(200, int(rng.gauss(self.questions, self.questions / 3))))
+
+    def _id(self, kind: int, index: int) -> uuid.UUID:
+        return uuid.UUID(int=self._prefix | (kind << 56) | index)
+
+    def _timestamp(self, rng: random.Random) -> datetime:
+        # Skewed towards recent activity
+        age = self.days * 86_400 * rng.random() ** 2
+        return self.now - timedelta(seconds=int(age))
+
+    def _skewed(self, rng: random.Random, n: int, power: float) -> int:
+        return min(int(n * rng.random() ** power), n - 1)
+
+    def user_rows(self, password_hash: str) -> Iterator[Row]:
+        for i in range(self.users):
+            yield (
+                self._id(USERS, i),
+                f"seed_user_{i}",
+                f"seed_user_{i}@seed.example.com",
+                password_hash,
+                True,
+                "adventure",
+                self.now,
+                self.now,
+            )
+
+    def journey_rows(self) -> Iterator[Row]:
+        rng = random.Random(self.seed + JOURNEYS)
+        for i in range(self.journeys):
+            created = self._timestamp(rng)
+            yield (
+                self._id(JOURNEYS, i),
+                f"Journey {i}",
+                "Synthetic journey",
+                self._id(USERS, self._skewed(rng, self.users, 3)),
+                created,
+                created,
+            )
+
+    def quiz_rows(self) -> Iterator[Row]:
+        rng = random.Random(self.seed + QUIZZES)
+        for i in range(self.quizzes):
+            created = self._timestamp(rng)
+            journey = self._id(JOURNEYS, rng.randrange(self.journeys)) if rng.random() < 0.3 else None
+            yield (
+                self._id(QUIZZES, i),
+                f"Quiz {i}",
+                "Synthetic quiz",
+                journey,
+                self._id(USERS, self._skewed(rng, self.users, 3)),
+                max(1, self.question_counts[i] // 2),
+                "imediato" if rng.random() < 0.2 else "final",
+                rng.choice(DIFFICULTIES),
+                None,
+                created,
+                created,
+            )
+
+    def _correct_option(self, question_index: int) -> int:
+        return question_index % self.options
+
+    def question_rows(self) -> Iterator[Row]:
+        for quiz in range(self.quizzes):
+            offset = self.question_offsets[quiz]
+            quiz_id = self._id(QUIZZES, quiz)
+            for q in range(offset, offset + self.question_counts[quiz]):
+                yield (
+                    self._id(QUESTIONS, q),
+                    f"Synthetic question {q}?",
+                    quiz_id,
+                    self._correct_option(q) + 1,
+                    self.now,
+                    self.now,
+                )
+
+    def option_rows(self) -> Iterator[Row]:
+        for q in range(self.total_questions):
+            question_id = self._id(QUESTIONS, q)
+            correct = self._correct_option(q)
+            for o in range(self.options):
+                yield (
+                    self._id(OPTIONS, q * self.options + o),
+                    question_id,
+                    o + 1,
+                    f"Option {o + 1}",
+                    o + 1,
+                    o == correct,
+                    None,
+                    None,
+                    self.now,
+                    self.now,
+                )
+
+    def _result(self, rng: random.Random) -> Tuple[int, int, datetime, Optional[uuid.UUID]]:
+        quiz = self._skewed(rng, self.quizzes, 2)
+        score = int(rng.betavariate(5, 2.7) * 100)
+        user = self._id(USERS, rng.randrange(self.users)) if rng.random() < 0.6 else None
+        return quiz, score, self._timestamp(rng), user
+
+    def result_rows(self) -> Iterator[Row]:
+        rng = random.Random(self.seed + RESULTS)
+        for i in range(self.results):
+            quiz, score, taken_at, user = self._result(rng)
+            yield (
+                self._id(RESULTS, i),
+                user,
+                f"Respondent {i}",
+                self._id(QUIZZES, quiz),
+                score,
+                self.question_counts[quiz],
+                taken_at,
+            )
+
+    def answer_rows(self) -> Iterator[Row]:
+        """Per-question answers for a sample of the results (replays the result stream)."""
+        if self.answer_sample_rate <= 0:
+            return
+        rng = random.Random(self.seed + RESULTS)
+        pick = random.Random(self.seed + ANSWERS)
+        for i in range(self.results):
+            quiz, score, taken_at, _ = self._result(rng)
+            if pick.random() >= self.answer_sample_rate:
+                continue
+            result_id = self._id(RESULTS, i)
+            offset = self.question_offsets[quiz]
+            for q in range(offset, offset + self.question_counts[quiz]):
+                correct = self._correct_option(q)
+                if pick.random() * 100 < score:
+                    chosen = correct
+                else:
+                    chosen = (correct + 1 + pick.randrange(self.options - 1)) % self.options
+                yield (
+                    self._id(ANSWERS, i * 256 + q - offset),
+                    result_id,
+                    self._id(QUESTIONS, q),
+                    self._id(OPTIONS, q * self.options + chosen),
+                    chosen == correct,
+                    taken_at,
+                )
+
+
+def _batches(rows: Iterable[Row], size: int) -> Iterator[List[Row]]:
+    iterator = iter(rows)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _copy_value(value: object) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    return str(value)
+
+
+class BulkLoader:
+    """Loads row tuples with `COPY ... FROM STDIN` on Postgres, multi-row INSERTs elsewhere."""
+
+    def __init__(self, engine: Engine, batch_size: int = 50_000):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.use_copy = engine.dialect.name == "postgresql"
+
+    def load(self, model: type, columns: Sequence[str], rows: Iterable[Row]) -> int:
+        table = model.__table__
+        started = time.perf_counter()
+        total = 0
+        for batch in _batches(rows, self.batch_size):
+            if self.use_copy:
+                self._copy(table.name, columns, batch)
+            else:
+                with self.engine.begin() as conn:
+                    conn.execute(insert(table), [dict(zip(columns, row)) for row in batch])
+            total += len(batch)
+        elapsed = time.perf_counter() - started
+        print(f"  {table.name}: {total:,} rows in {elapsed:.1f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+        return total
+
+    def _copy(self, table: str, columns: Sequence[str], batch: List[Row]) -> None:
+        buffer = io.StringIO()
+        for row in batch:
+            buffer.write("\t".join(_copy_value(v) for v in row))
+            buffer.write("\n")
+        buffer.seek(0)
+        column_list = ", ".join(f'"{c}"' for c in columns)
+        raw = self.engine.raw_connection()
+        try:
+            with raw.cursor() as cursor:
+                cursor.copy_expert(f"COPY {table} ({column_list}) FROM STDIN", buffer)
+            raw.commit()
+        finally:
+            raw.close()
+
+
+def rebuild_quiz_stats(engine: Engine) -> None:
+    """Recompute quiz_stats, quiz_score_counts and user_result_counts, which bulk loads bypass."""
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(delete(UserResultCountModel))
+        conn.execute(delete(QuizScoreCountModel))
+        conn.execute(delete(QuizStatsModel))
+        conn.execute(
+            text(
+                "INSERT INTO quiz_stats (quiz_id, attempts, score_sum, score_sq_sum, min_score, max_score, updated_at) "
+                "SELECT quiz_id, COUNT(*), SUM(score), SUM(score * score), MIN(score), MAX(score), CURRENT_TIMESTAMP "
+                "FROM results GROUP BY quiz_id"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO quiz_score_counts (quiz_id, score, attempts) "
+                "SELECT quiz_id, score, COUNT(*) FROM results GROUP BY quiz_id, score"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO user_result_counts (user_id, attempts) "
+                "SELECT user_id, COUNT(*) FROM results WHERE user_id IS NOT NULL GROUP BY user_id"
+            )
+        )
+    print(f"  quiz_stats rebuilt in {time.perf_counter() - started:.1f}s")
+
+
+def seed_synthetic(dataset: SyntheticDataset, engine: Engine = default_engine, batch_size: int = 50_000) -> None:
+    """Bulk load a synthetic dataset. Tables must exist (run migrations first)."""
+    from src.infrastructure.auth.password import get_password_hash
+
+    loader = BulkLoader(engine, batch_size=batch_size)
+    started = time.perf_counter()
+    print(
+        f"Seeding {dataset.users:,} users, {dataset.quizzes:,} quizzes, "
+        f"{dataset.total_questions:,} questions, {dataset.results:,} results"
+    )
+    loader.load(
+        UserModel,
+        ["id", "username", "email", "hashed_password", "is_active", "type", "created_at", "updated_at"],
+        dataset.user_rows(get_password_hash("seed-password")),
+    )
+    loader.load(
+        JourneyModel,
+        ["id", "title", "description", "user_id", "created_at", "updated_at"],
+        dataset.journey_rows(),
+    )
+    loader.load(
+        QuizModel,
+        [
+            "id", "title", "description", "journey_id", "user_id", "estimated_time",
+            "feedback_mode", "difficulty", "image_url", "created_at", "updated_at",
+        ],
+        dataset.quiz_rows(),
+    )
+    loader.load(
+        QuestionModel,
+        ["id", "text", "quiz_id", "correct_answer", "created_at", "updated_at"],
+        dataset.question_rows(),
+    )
+    loader.load(
+        QuestionOptionModel,
+        [
+            "id", "question_id", "reference_id", "text", "order", "is_correct",
+            "image_url", "metadata_json", "created_at", "updated_at",
+        ],
+        dataset.option_rows(),
+    )
+    loader.load(
+        ResultsModel,
+        ["id", "user_id", "respondent_name", "quiz_id", "score", "total_questions", "taken_at"],
+        dataset.result_rows(),
+    )
+    rebuild_quiz_stats(engine)
+    rebuild_activity_rollups(engine)
+    if dataset.answer_sample_rate > 0:
+        loader.load(
+            AnswerResultModel,
+            ["id", "result_id", "question_id", "selected_option_id", "is_correct", "answered_at"],
+            dataset.answer_rows(),
+        )
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Seed the database.")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("admin", help="Create the default admin user (default)")
+    synthetic = subparsers.add_parser("synthetic", help="Bulk load a synthetic dataset")
+    synthetic.add_argument("--preset", choices=PRESETS, default="small")
+    synthetic.add_argument("--users", type=int)
+    synthetic.add_argument("--quizzes", type=int)
+    synthetic.add_argument("--questions", type=int, help="Mean questions per quiz")
+    synthetic.add_argument("--results", type=int)
+    synthetic.add_argument("--options", type=int, default=4, help="Options per question")
+    synthetic.add_argument(
+        "--answer-sample-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of results that also get per-question answer_results rows",
+    )
+    synthetic.add_argument("--days", type=int, default=365, help="Spread of timestamps")
+    synthetic.add_argument("--seed", type=int, default=42)
+    synthetic.add_argument("--batch-size", type=int, default=50_000)
+    args = parser.parse_args(argv)
+
+    if args.command != "synthetic":
+        seed_user()
+        return
+
+    volumes = dict(PRESETS[args.preset])
+    for key in volumes:
+        if getattr(args, key) is not None:
+            volumes[key] = getattr(args, key)
+    dataset = SyntheticDataset(
+        **volumes,
+        options=args.options,
+        answer_sample_rate=args.answer_sample_rate,
+        days=args.days,
+        seed=args.seed,
+    )
+    seed_synthetic(dataset, batch_size=args.batch_size)
+
+
 if __name__ == "__main__":
-    seed_user()
\ No newline at end of file
+    main()
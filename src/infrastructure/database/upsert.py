@@ -0,0 +1,46 @@
+from typing import Any, Union
+
+from sqlalchemy import ColumnElement, Engine, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+SUPPORTED_DIALECTS = ("postgresql", "sqlite")
+
+Upsert = Union[postgresql.Insert, sqlite.Insert]
+
+
+def check_upsert_dialect(engine: Engine) -> None:
+    """Fail at startup when the database cannot run the `ON CONFLICT` statements.
+
+    Every result insert updates the statistics tables with `upsert`, so an
+    unsupported database would otherwise only fail on the first write.
+    """
+    if engine.dialect.name not in SUPPORTED_DIALECTS:
+        raise RuntimeError(
+            f"Unsupported database dialect {engine.dialect.name!r}; "
+            f"expected one of {', '.join(SUPPORTED_DIALECTS)}"
+        )
+
+
+def upsert(db: Session, model: type) -> Upsert:
+    """`INSERT ... ON CONFLICT` statement for the session's dialect (PostgreSQL or SQLite)."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql.insert(model)
+    if dialect == "sqlite":
+        return sqlite.insert(model)
+    raise NotImplementedError(f"Upserts are not implemented for {dialect}")
+
+
+def least(db: Session, *values: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Smallest of several values: LEAST() on PostgreSQL, multi-argument MIN() on SQLite."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.least(*values)
+    return func.min(*values)
+
+
+def greatest(db: Session, *values: ColumnElement[Any]) -> ColumnElement[Any]:
+    """Largest of several values: GREATEST() on PostgreSQL, multi-argument MAX() on SQLite."""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.greatest(*values)
+    return func.max(*values)
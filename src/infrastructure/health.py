@@ -0,0 +1,174 @@
+import asyncio
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from starlette.concurrency import run_in_threadpool
+
+from .database.connection import engine as default_engine
+from .observability.loop_monitor import loop_monitor
+
+DB_LATENCY_THRESHOLD_MS = float(os.getenv("HEALTH_DB_LATENCY_THRESHOLD_MS", "500"))
+POOL_SATURATION_THRESHOLD = float(os.getenv("HEALTH_POOL_SATURATION_THRESHOLD", "0.9"))
+LOOP_LAG_THRESHOLD_MS = float(os.getenv("HEALTH_LOOP_LAG_THRESHOLD_MS", "500"))
+HEALTH_CACHE_TTL_SECONDS = float(os.getenv("HEALTH_CACHE_TTL_SECONDS", "2"))
+HEALTH_CHECK_TIMEOUT_SECONDS = float(os.getenv("HEALTH_CHECK_TIMEOUT_SECONDS", "2"))
+
+
+@dataclass
+class CheckResult:
+    """Outcome of one dependency probe."""
+
+    name: str
+    healthy: bool
+    latency_ms: float = 0.0
+    details: Dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        data = {
+            "status": "ok" if self.healthy else "fail",
+            "latency_ms": round(self.latency_ms, 2),
+            **self.details,
+        }
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+Check = Callable[[], CheckResult]
+
+
+def pool_usage(engine: Engine) -> Optional[Dict]:
+    """Connections in use against the pool capacity, for pools that have a fixed size."""
+    pool = engine.pool
+    if not all(hasattr(pool, attr) for attr in ("size", "checkedout", "_max_overflow")):
+        return None
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    return {
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+def database_check(engine: Engine = default_engine) -> Check:
+    def check() -> CheckResult:
+        usage = pool_usage(engine)
+        if usage and usage["saturation"] >= 1:
+            # A round trip would wait for pool_timeout; the pool check reports it.
+            return CheckResult("database", False, error="connection pool exhausted")
+        started = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except Exception as e:
+            return CheckResult("database", False, (time.perf_counter() - started) * 1000, error=str(e))
+        latency_ms = (time.perf_counter() - started) * 1000
+        healthy = latency_ms <= DB_LATENCY_THRESHOLD_MS
+        return CheckResult(
+            "database",
+            healthy,
+            latency_ms,
+            error=None if healthy else f"round trip above {DB_LATENCY_THRESHOLD_MS}ms",
+        )
+
+    return check
+
+
+def pool_check(engine: Engine = default_engine) -> Check:
+    def check() -> CheckResult:
+        usage = pool_usage(engine)
+        if usage is None:
+            return CheckResult("pool", True, details={"pool": type(engine.pool).__name__})
+        healthy = usage["saturation"] < POOL_SATURATION_THRESHOLD
+        return CheckResult(
+            "pool", healthy, details=usage, error=None if healthy else "connection pool saturated"
+        )
+
+    return check
+
+
+def directory_writable_check(name: str, directory: Path) -> Check:
+    def check() -> CheckResult:
+        started = time.perf_counter()
+        probe = directory / f".healthcheck-{uuid.uuid4().hex}"
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            probe.write_bytes(b"ok")
+            probe.unlink()
+        except OSError as e:
+            return CheckResult(name, False, (time.perf_counter() - started) * 1000, error=str(e))
+        return CheckResult(name, True, (time.perf_counter() - started) * 1000)
+
+    return check
+
+
+def event_loop_check() -> CheckResult:
+    snapshot = loop_monitor.snapshot()
+    if not snapshot["running"]:
+        return CheckResult("event_loop", True, details={"monitored": False})
+    p95 = snapshot["lag_ms"]["p95"]
+    healthy = p95 <= LOOP_LAG_THRESHOLD_MS
+    return CheckResult(
+        "event_loop",
+        healthy,
+        details={"lag_p95_ms": p95},
+        error=None if healthy else f"loop lag p95 above {LOOP_LAG_THRESHOLD_MS}ms",
+    )
+
+
+class HealthChecker:
+    """Runs readiness probes and caches the outcome for `ttl` seconds.
+
+    Concurrent probes while a run is in flight share its result, so load balancer
+    polling costs at most one round of checks per `ttl`.
+    """
+
+    def __init__(self, ttl: float = HEALTH_CACHE_TTL_SECONDS, timeout: float = HEALTH_CHECK_TIMEOUT_SECONDS):
+        self.ttl = ttl
+        self.timeout = timeout
+        self._checks: Dict[str, Check] = {}
+        self._cached: Optional[List[CheckResult]] = None
+        self._cached_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    def register(self, name: str, check: Check) -> None:
+        self._checks[name] = check
+        self._cached = None
+
+    def invalidate(self) -> None:
+        self._cached = None
+
+    async def _run_check(self, name: str, check: Check) -> CheckResult:
+        try:
+            return await asyncio.wait_for(run_in_threadpool(check), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            return CheckResult(name, False, self.timeout * 1000, error="timed out")
+        except Exception as e:
+            return CheckResult(name, False, error=str(e))
+
+    async def run(self) -> List[CheckResult]:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._cached is not None and time.monotonic() - self._cached_at < self.ttl:
+                return self._cached
+            self._cached = list(
+                await asyncio.gather(*(self._run_check(n, c) for n, c in self._checks.items()))
+            )
+            self._cached_at = time.monotonic()
+            return self._cached
+
+
+health_checker = HealthChecker()
+health_checker.register("database", database_check())
+health_checker.register("pool", pool_check())
+health_checker.register("uploads", directory_writable_check("uploads", Path("uploads")))
+health_checker.register("event_loop", event_loop_check)
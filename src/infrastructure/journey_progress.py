@@ -0,0 +1,75 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from ..domain.entities.journey_progress import QuizProgress
+from ..domain.events import ResultsRecorded, event_hub
+
+JOURNEY_PROGRESS_CACHE_TTL_SECONDS = float(os.getenv("JOURNEY_PROGRESS_CACHE_TTL_SECONDS", "60"))
+JOURNEY_PROGRESS_CACHE_MAX_ENTRIES = int(os.getenv("JOURNEY_PROGRESS_CACHE_MAX_ENTRIES", "10000"))
+
+Key = Tuple[UUID, UUID]
+
+
+class JourneyProgressCache:
+    """Journey progress per (user, journey), dropped when the user records a result.
+
+    The TTL bounds staleness from results recorded by other processes and
+    from quizzes added to or removed from the journey.
+    """
+
+    def __init__(
+        self,
+        ttl: float = JOURNEY_PROGRESS_CACHE_TTL_SECONDS,
+        max_entries: int = JOURNEY_PROGRESS_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Key, Tuple[List[QuizProgress], float]]" = OrderedDict()
+        self._by_user: Dict[UUID, Set[UUID]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: UUID, journey_id: UUID) -> Optional[List[QuizProgress]]:
+        with self._lock:
+            entry = self._entries.get((user_id, journey_id))
+            if entry is None or time.monotonic() - entry[1] > self.ttl:
+                return None
+            self._entries.move_to_end((user_id, journey_id))
+            return entry[0]
+
+    def put(self, user_id: UUID, journey_id: UUID, progress: List[QuizProgress]) -> None:
+        with self._lock:
+            self._entries[(user_id, journey_id)] = (progress, time.monotonic())
+            self._entries.move_to_end((user_id, journey_id))
+            self._by_user.setdefault(user_id, set()).add(journey_id)
+            while len(self._entries) > self.max_entries:
+                (old_user, old_journey), _ = self._entries.popitem(last=False)
+                self._forget(old_user, old_journey)
+
+    def _forget(self, user_id: UUID, journey_id: UUID) -> None:
+        journeys = self._by_user.get(user_id)
+        if journeys is not None:
+            journeys.discard(journey_id)
+            if not journeys:
+                del self._by_user[user_id]
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        with self._lock:
+            for journey_id in self._by_user.pop(user_id, ()):
+                self._entries.pop((user_id, journey_id), None)
+
+    def on_results_recorded(self, event: ResultsRecorded) -> None:
+        for user_id in {r.user_id for r in event.results if r.user_id is not None}:
+            self.invalidate_user(user_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+
+journey_progress_cache = JourneyProgressCache()
+event_hub.subscribe(ResultsRecorded, journey_progress_cache.on_results_recorded)
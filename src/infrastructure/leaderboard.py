@@ -0,0 +1,106 @@
+import bisect
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from ..domain.entities.results import Result
+from ..domain.events import ResultsRecorded, event_hub
+
+LEADERBOARD_SIZE = int(os.getenv("LEADERBOARD_SIZE", "100"))
+LEADERBOARD_CACHE_TTL_SECONDS = float(os.getenv("LEADERBOARD_CACHE_TTL_SECONDS", "10"))
+LEADERBOARD_CACHE_MAX_QUIZZES = int(os.getenv("LEADERBOARD_CACHE_MAX_QUIZZES", "1000"))
+
+SortKey = Tuple[int, datetime, str]
+
+
+def leaderboard_key(result: Result) -> SortKey:
+    """Highest score first, then the earliest attempt; the id breaks exact ties."""
+    taken_at = result.taken_at
+    if taken_at.tzinfo is not None:
+        # Stored timestamps are naive UTC; fresh entities are aware
+        taken_at = taken_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return (-int(result.score), taken_at, str(result.id))
+
+
+class _Board:
+    __slots__ = ("keys", "results", "loaded_at")
+
+    def __init__(self, results: List[Result]):
+        self.results = sorted(results, key=leaderboard_key)
+        self.keys = [leaderboard_key(r) for r in self.results]
+        self.loaded_at = time.monotonic()
+
+
+class LeaderboardCache:
+    """Top `size` results per quiz, kept sorted in memory.
+
+    Boards are loaded from the database on first read and then updated in
+    place from ResultsRecorded events, so reads during a live event do not touch
+    the database. The TTL bounds staleness from writes made by other processes;
+    the least recently read quizzes are evicted beyond `max_quizzes`.
+    """
+
+    def __init__(
+        self,
+        size: int = LEADERBOARD_SIZE,
+        ttl: float = LEADERBOARD_CACHE_TTL_SECONDS,
+        max_quizzes: int = LEADERBOARD_CACHE_MAX_QUIZZES,
+    ):
+        self.size = size
+        self.ttl = ttl
+        self.max_quizzes = max_quizzes
+        self.hits = 0
+        self.misses = 0
+        self._boards: "OrderedDict[UUID, _Board]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, quiz_id: UUID, limit: int) -> Optional[List[Result]]:
+        with self._lock:
+            board = self._boards.get(quiz_id)
+            if board is None or time.monotonic() - board.loaded_at > self.ttl:
+                self.misses += 1
+                return None
+            self._boards.move_to_end(quiz_id)
+            self.hits += 1
+            return board.results[:limit]
+
+    def put(self, quiz_id: UUID, results: List[Result]) -> None:
+        """Store the top results as loaded from the database (at most `size`)."""
+        with self._lock:
+            self._boards[quiz_id] = _Board(results[: self.size])
+            self._boards.move_to_end(quiz_id)
+            while len(self._boards) > self.max_quizzes:
+                self._boards.popitem(last=False)
+
+    def record(self, results: Tuple[Result, ...]) -> None:
+        with self._lock:
+            for result in results:
+                board = self._boards.get(result.quiz_id)
+                if board is None:
+                    continue
+                key = leaderboard_key(result)
+                if len(board.keys) >= self.size and key >= board.keys[-1]:
+                    continue
+                index = bisect.bisect_left(board.keys, key)
+                if index < len(board.keys) and board.keys[index] == key:
+                    continue
+                board.keys.insert(index, key)
+                board.results.insert(index, result)
+                if len(board.keys) > self.size:
+                    board.keys.pop()
+                    board.results.pop()
+
+    def on_results_recorded(self, event: ResultsRecorded) -> None:
+        self.record(event.results)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._boards.clear()
+
+
+leaderboard_cache = LeaderboardCache()
+event_hub.subscribe(ResultsRecorded, leaderboard_cache.on_results_recorded)
@@ -0,0 +1,380 @@
+import asyncio
+import json
+import logging
+import os
+import secrets
+import time
+from collections import Counter
+from typing import Awaitable, Callable, Dict, List, Optional
+from uuid import UUID
+
+from ..domain.entities.question import Question
+from ..domain.entities.quiz import Quiz
+from ..domain.entities.results import Result, percent_score
+from ..domain.ids import uuid7
+
+logger = logging.getLogger(__name__)
+
+LIVE_CLIENT_QUEUE_SIZE = int(os.getenv("LIVE_CLIENT_QUEUE_SIZE", "64"))
+LIVE_COUNTS_INTERVAL_MS = float(os.getenv("LIVE_COUNTS_INTERVAL_MS", "250"))
+LIVE_MAX_ROOMS = int(os.getenv("LIVE_MAX_ROOMS", "100"))
+LIVE_ROOM_TTL_SECONDS = float(os.getenv("LIVE_ROOM_TTL_SECONDS", "14400"))
+
+# WebSocket close code for clients that cannot keep up ("try again later")
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+class RoomError(Exception):
+    """A host or participant action that is not allowed in the room's current state."""
+
+
+class Connection:
+    """One socket with its own bounded outgoing queue, drained by its own task.
+
+    The room only ever enqueues; a client that lets `queue_size` messages pile
+    up is disconnected instead of slowing down the others.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        close: Callable[[int], Awaitable[None]],
+        queue_size: int = LIVE_CLIENT_QUEUE_SIZE,
+    ):
+        self._send = send
+        self._close = close
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._task = asyncio.get_running_loop().create_task(self._pump())
+        self.closed = False
+
+    async def _pump(self) -> None:
+        while True:
+            message = await self._queue.get()
+            try:
+                await self._send(message)
+            except Exception:
+                self.closed = True
+                return
+
+    def offer(self, message: str) -> bool:
+        """Queue a serialized message; False when the client is gone or too far behind."""
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.drop(SLOW_CLIENT_CLOSE_CODE)
+            return False
+
+    def close(self) -> None:
+        """Stop the sending task once the socket is gone; nothing more is sent."""
+        self.closed = True
+        self._task.cancel()
+
+    def drop(self, code: int = 1000) -> None:
+        """Stop sending and close the socket with `code`."""
+        if self.closed:
+            return
+        self.close()
+        asyncio.get_running_loop().create_task(self._close_quietly(code))
+
+    async def _close_quietly(self, code: int) -> None:
+        try:
+            await self._close(code)
+        except Exception:
+            pass
+
+    async def drain(self, timeout: float = 1.0) -> None:
+        """Wait until the queued messages are sent, e.g. before a normal close."""
+        deadline = time.monotonic() + timeout
+        while not self.closed and not self._queue.empty() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+
+
+class Participant:
+    __slots__ = ("id", "name", "user_id", "connection", "correct", "answered")
+
+    def __init__(self, name: str, user_id: Optional[UUID], connection: Optional[Connection]):
+        self.id = uuid7()
+        self.name = name
+        self.user_id = user_id
+        self.connection = connection
+        self.correct = 0
+        self.answered = 0
+
+
+class LiveRoom:
+    """A host-driven run of a quiz: one question at a time for every participant.
+
+    Every broadcast is serialized once and handed to each connection's queue
+    by the room's fan-out task. Answer counts are broadcast at most once per
+    `counts_interval` while a question is open.
+    """
+
+    def __init__(
+        self,
+        code: str,
+        quiz: Quiz,
+        host_id: UUID,
+        counts_interval: float = LIVE_COUNTS_INTERVAL_MS / 1000,
+    ):
+        self.code = code
+        self.quiz = quiz
+        self.host_id = host_id
+        self.counts_interval = counts_interval
+        self.created_at = time.monotonic()
+        self.participants: Dict[UUID, Participant] = {}
+        self.hosts: List[Connection] = []
+        self.question_index = -1
+        self.question_open = False
+        self.finished = False
+        self._answers: Dict[UUID, UUID] = {}
+        self._counts: Counter = Counter()
+        self._counts_dirty = False
+        self._outbox: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def current_question(self) -> Optional[Question]:
+        if 0 <= self.question_index < len(self.quiz.questions):
+            question: Question = self.quiz.questions[self.question_index]
+            return question
+        return None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def close(self) -> None:
+        """Stop the fan-out task and disconnect every host and participant."""
+        self.stop()
+        for connection in self.connections():
+            connection.drop()
+        self.hosts.clear()
+        for participant in self.participants.values():
+            participant.connection = None
+
+    def connections(self) -> List[Connection]:
+        connections = [c for c in self.hosts if not c.closed]
+        connections += [
+            p.connection
+            for p in self.participants.values()
+            if p.connection and not p.connection.closed
+        ]
+        return connections
+
+    def broadcast(self, message: dict) -> None:
+        self._outbox.put_nowait(message)
+
+    async def flush(self, timeout: float = 2.0) -> None:
+        """Wait until pending broadcasts reached every connection (or `timeout` passed)."""
+        deadline = time.monotonic() + timeout
+        while not self._outbox.empty() and time.monotonic() < deadline:
+            await asyncio.sleep(0.01)
+        # Let the fan-out task hand the last message to the connections
+        await asyncio.sleep(0)
+        for connection in self.connections():
+            await connection.drain(max(deadline - time.monotonic(), 0.0))
+
+    async def _run(self) -> None:
+        last_counts = 0.0
+        while True:
+            timeout = None
+            if self._counts_dirty:
+                timeout = max(last_counts + self.counts_interval - time.monotonic(), 0.0)
+            try:
+                message = await asyncio.wait_for(self._outbox.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                message = None
+            if message is not None:
+                self._fan_out(message)
+            if self._counts_dirty and time.monotonic() - last_counts >= self.counts_interval:
+                self._counts_dirty = False
+                last_counts = time.monotonic()
+                self._fan_out(self._counts_message())
+
+    def _fan_out(self, message: dict) -> None:
+        data = json.dumps(message, default=str)
+        dropped = sum(1 for connection in self.connections() if not connection.offer(data))
+        if dropped:
+            logger.info("Room %s: %d connections dropped or behind", self.code, dropped)
+
+    def _counts_message(self) -> dict:
+        question = self.current_question
+        return {
+            "type": "counts",
+            "question_id": question.id if question else None,
+            "answered": len(self._answers),
+            "counts": {str(option_id): n for option_id, n in self._counts.items()},
+        }
+
+    def _question_message(self) -> dict:
+        # Only sent while a question is open, so the index is in range
+        question: Question = self.quiz.questions[self.question_index]
+        return {
+            "type": "question",
+            "index": self.question_index,
+            "total": len(self.quiz.questions),
+            "question_id": question.id,
+            "text": question.text,
+            "options": [
+                {"id": opt.id, "text": opt.text, "image_url": opt.image_url}
+                for opt in question.options
+            ],
+        }
+
+    def join(self, name: str, user_id: Optional[UUID], connection: Connection) -> Participant:
+        if self.finished:
+            raise RoomError("The quiz is over")
+        participant = Participant(name, user_id, connection)
+        self.participants[participant.id] = participant
+        connection.offer(
+            json.dumps(
+                {"type": "welcome", "participant_id": participant.id, "quiz_id": self.quiz.id},
+                default=str,
+            )
+        )
+        if self.question_open:
+            connection.offer(json.dumps(self._question_message(), default=str))
+        return participant
+
+    def leave(self, participant: Participant) -> None:
+        """Detach the socket; the participant's answers still count for the final scores."""
+        participant.connection = None
+
+    def next_question(self) -> None:
+        if self.finished:
+            raise RoomError("The quiz is over")
+        if self.question_index + 1 >= len(self.quiz.questions):
+            raise RoomError("No more questions")
+        self.question_index += 1
+        self.question_open = True
+        self._answers = {}
+        self._counts = Counter()
+        self._counts_dirty = False
+        self.broadcast(self._question_message())
+
+    def answer(self, participant: Participant, question_id: UUID, option_id: UUID) -> bool:
+        """Record the first answer to the open question; False when it is not accepted."""
+        question = self.current_question
+        if not self.question_open or question is None or question.id != question_id:
+            return False
+        if participant.id in self._answers:
+            return False
+        option = next((opt for opt in question.options if opt.id == option_id), None)
+        if option is None:
+            return False
+        self._answers[participant.id] = option_id
+        self._counts[option_id] += 1
+        if not self._counts_dirty:
+            self._counts_dirty = True
+            # Wake the fan-out task so it schedules the next counts broadcast
+            self._outbox.put_nowait(None)
+        participant.answered += 1
+        if option.reference_id == question.correct_answer:
+            participant.correct += 1
+        return True
+
+    def reveal(self) -> None:
+        question = self.current_question
+        if not self.question_open or question is None:
+            raise RoomError("No open question")
+        self.question_open = False
+        self._counts_dirty = False
+        self.broadcast(
+            {
+                **self._counts_message(),
+                "type": "reveal",
+                "correct_option_id": next(
+                    (
+                        opt.id
+                        for opt in question.options
+                        if opt.reference_id == question.correct_answer
+                    ),
+                    None,
+                ),
+            }
+        )
+
+    def final_results(self) -> List[Result]:
+        """One result per participant, for storing in bulk before `finish`.
+
+        The open question is revealed first, so no answer changes the scores
+        while they are being stored. A retry builds results with the same ids.
+        """
+        if self.finished:
+            raise RoomError("The quiz is over")
+        if self.question_open:
+            self.reveal()
+        total = len(self.quiz.questions)
+        return [
+            Result(
+                id=p.id,
+                user_id=p.user_id,
+                respondent_name=p.name,
+                quiz_id=self.quiz.id,
+                score=percent_score(p.correct, total),
+                total_questions=total,
+            )
+            for p in self.participants.values()
+        ]
+
+    def finish(self, results: List[Result]) -> None:
+        """Mark the room over once `results` are stored and send the leaderboard."""
+        if self.finished:
+            raise RoomError("The quiz is over")
+        self.finished = True
+        ranking = sorted(results, key=lambda r: -r.score)
+        self.broadcast(
+            {
+                "type": "finished",
+                "leaderboard": [
+                    {"participant_id": r.id, "name": r.respondent_name, "score": r.score}
+                    for r in ranking[:10]
+                ],
+            }
+        )
+
+
+class LiveRoomRegistry:
+    """Rooms of this process, by join code."""
+
+    def __init__(self, max_rooms: int = LIVE_MAX_ROOMS, ttl: float = LIVE_ROOM_TTL_SECONDS):
+        self.max_rooms = max_rooms
+        self.ttl = ttl
+        self._rooms: Dict[str, LiveRoom] = {}
+
+    def _purge(self) -> None:
+        now = time.monotonic()
+        for code, room in list(self._rooms.items()):
+            if now - room.created_at > self.ttl:
+                self.close(code)
+
+    def create(self, quiz: Quiz, host_id: UUID) -> LiveRoom:
+        self._purge()
+        if len(self._rooms) >= self.max_rooms:
+            raise RoomError("Too many live rooms")
+        code = secrets.token_hex(3).upper()
+        while code in self._rooms:
+            code = secrets.token_hex(3).upper()
+        room = LiveRoom(code, quiz, host_id)
+        self._rooms[code] = room
+        room.start()
+        return room
+
+    def get(self, code: str) -> Optional[LiveRoom]:
+        return self._rooms.get(code)
+
+    def close(self, code: str) -> None:
+        room = self._rooms.pop(code, None)
+        if room is not None:
+            room.close()
+
+
+live_rooms = LiveRoomRegistry()
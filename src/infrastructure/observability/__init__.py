@@ -0,0 +1,26 @@
+from .query_stats import QueryStats, current_query_stats, install_query_hooks, track_queries
+from .tracing import (
+    Span,
+    Tracer,
+    configure_tracing_from_env,
+    current_span,
+    install_sql_tracing,
+    traced,
+    traced_class,
+    tracer,
+)
+
+__all__ = [
+    "QueryStats",
+    "current_query_stats",
+    "install_query_hooks",
+    "track_queries",
+    "Span",
+    "Tracer",
+    "configure_tracing_from_env",
+    "current_span",
+    "install_sql_tracing",
+    "traced",
+    "traced_class",
+    "tracer",
+]
@@ -0,0 +1,197 @@
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+import urllib.request
+from typing import List, Optional, TextIO
+
+from .tracing import Span
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ConsoleSpanExporter:
+    """Log one line per finished span; meant for local runs.
+
+    The app does not configure logging, so unless the `logger_name` logger
+    already has handlers, the exporter gives it its own one on `stream`
+    (stderr by default).
+    """
+
+    def __init__(self, logger_name: str = "tracing", stream: Optional[TextIO] = None):
+        self.logger = logging.getLogger(logger_name)
+        if not self.logger.handlers:
+            handler = logging.StreamHandler(stream or sys.stderr)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+            self.logger.addHandler(handler)
+            # Printed once by this handler, not again by a root handler set up later
+            self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+
+    def export(self, span: Span) -> None:
+        attributes = " ".join(f"{k}={v}" for k, v in span.attributes.items())
+        self.logger.info(
+            "%s %s %.2fms trace=%s span=%s parent=%s %s",
+            span.status.upper(),
+            span.name,
+            span.duration_ms,
+            span.trace_id,
+            span.span_id,
+            span.parent_id or "-",
+            attributes,
+        )
+
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonFileSpanExporter:
+    """Append finished spans as JSON lines to a file.
+
+    Spans are queued and written from a background thread, which flushes the
+    file whenever the queue runs empty, so request handling never waits on
+    disk. When the queue is full spans are dropped.
+    """
+
+    def __init__(self, path: str, max_queue_size: int = 10_000):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="json-span-exporter", daemon=True)
+        self._worker.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            pass
+
+    def shutdown(self) -> None:
+        self._queue.put(_STOP)
+        self._worker.join()
+        self._file.close()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._file.flush()
+                return
+            if isinstance(item, Span):
+                self._file.write(json.dumps(item.to_dict(), default=str) + "\n")
+            if self._queue.empty():
+                self._file.flush()
+
+
+class OTLPHttpSpanExporter:
+    """Ship spans to an OpenTelemetry collector using OTLP/HTTP with JSON encoding.
+
+    Spans are queued and sent in batches from a background thread so request
+    handling never waits on the collector. When the queue is full spans are dropped.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        batch_size: int = 256,
+        flush_interval: float = 2.0,
+        max_queue_size: int = 10_000,
+        timeout: float = 5.0,
+    ):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.timeout = timeout
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue_size)
+        self._worker = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+        self._worker.start()
+
+    def export(self, span: Span) -> None:
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            pass
+
+    def shutdown(self) -> None:
+        self._queue.put(_STOP)
+        self._worker.join(timeout=self.timeout)
+
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+            if item is _STOP:
+                self._send(batch)
+                return
+            if isinstance(item, Span):
+                batch.append(item)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._send(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _send(self, spans: List[Span]) -> None:
+        if not spans:
+            return
+        body = json.dumps(self._encode(spans)).encode()
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        try:
+            urllib.request.urlopen(request, timeout=self.timeout).close()
+        except OSError as e:
+            logger.warning("Dropping %d spans, OTLP export failed: %s", len(spans), e)
+
+    def _encode(self, spans: List[Span]) -> dict:
+        kinds = {"internal": 1, "server": 2, "client": 3}
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "fast-quizz-app"},
+                            "spans": [
+                                {
+                                    "traceId": span.trace_id,
+                                    "spanId": span.span_id,
+                                    "parentSpanId": span.parent_id or "",
+                                    "name": span.name,
+                                    "kind": kinds.get(span.kind, 1),
+                                    "startTimeUnixNano": str(span.start_ns),
+                                    "endTimeUnixNano": str(span.end_ns),
+                                    "attributes": [
+                                        _otlp_attribute(k, v) for k, v in span.attributes.items()
+                                    ],
+                                    "status": {
+                                        "code": 2 if span.status == "error" else 1,
+                                        "message": span.error or "",
+                                    },
+                                }
+                                for span in spans
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_attribute(key: str, value: object) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
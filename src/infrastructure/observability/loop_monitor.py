@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+class EventLoopMonitor:
+    """Measure event loop lag and report the code that blocks the loop.
+
+    A heartbeat task sleeps for `interval` seconds and records how late it wakes up.
+    A watchdog thread notices when the heartbeat stalls for longer than `threshold`
+    and captures the stack of the loop thread while it is still blocked, which
+    points straight at the synchronous call (DB query, password hash...) holding it.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.1,
+        window: int = 2048,
+        max_reports: int = 50,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self._lags: Deque[float] = deque(maxlen=window)
+        self.blocking_reports: Deque[Dict] = deque(maxlen=max_reports)
+        self.blocked_count = 0
+        self._last_beat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop. Must be called from inside it."""
+        if self.running:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self._lags.append(max(time.perf_counter() - started - self.interval, 0.0))
+            self._last_beat = time.monotonic()
+
+    def _watch(self) -> None:
+        reported_beat = None
+        while not self._stop.wait(self.interval / 2):
+            last_beat = self._last_beat
+            stalled = time.monotonic() - last_beat - self.interval
+            if stalled < self.threshold or last_beat == reported_beat:
+                continue
+            thread_id = self._loop_thread_id
+            frame = sys._current_frames().get(thread_id) if thread_id is not None else None
+            if frame is None:
+                continue
+            reported_beat = last_beat
+            self._report(stalled, "".join(traceback.format_stack(frame)))
+
+    def _report(self, stalled: float, stack: str) -> None:
+        self.blocked_count += 1
+        self.blocking_reports.append(
+            {"detected_at": time.time(), "blocked_ms": round(stalled * 1000, 2), "stack": stack}
+        )
+        logger.warning(
+            "Event loop blocked for at least %.0fms, loop thread stack:\n%s", stalled * 1000, stack
+        )
+
+    def snapshot(self, include_stacks: bool = False) -> dict:
+        lags = sorted(self._lags)
+        data = {
+            "running": self.running,
+            "samples": len(lags),
+            "lag_ms": {
+                "p50": round(percentile(lags, 0.50) * 1000, 3),
+                "p95": round(percentile(lags, 0.95) * 1000, 3),
+                "p99": round(percentile(lags, 0.99) * 1000, 3),
+                "max": round((lags[-1] if lags else 0.0) * 1000, 3),
+            },
+            "blocked_count": self.blocked_count,
+            "threshold_ms": self.threshold * 1000,
+        }
+        if include_stacks:
+            data["recent_blocking"] = list(self.blocking_reports)
+        return data
+
+
+loop_monitor = EventLoopMonitor(
+    interval=float(os.getenv("LOOP_MONITOR_INTERVAL_MS", "50")) / 1000,
+    threshold=float(os.getenv("LOOP_MONITOR_THRESHOLD_MS", "100")) / 1000,
+)
@@ -0,0 +1,156 @@
+import hmac
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+FrameKey = Tuple[str, str, int]
+
+_PROFILE_ID = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+
+class SamplingProfiler:
+    """Statistical profiler that samples the stack of one thread from a helper thread.
+
+    Inside the event loop this samples whatever coroutine is running on the loop
+    thread, so concurrent requests can show up in a profile; it is meant for
+    targeted investigation rather than always-on use.
+    """
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.001, max_depth: int = 128):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.max_depth = max_depth
+        self._frames: Dict[FrameKey, int] = {}
+        self._samples: List[List[int]] = []
+        self._weights: List[float] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.started_at = 0.0
+        self.stopped_at = 0.0
+
+    def start(self) -> None:
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.stopped_at = time.perf_counter()
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._samples)
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            now = time.perf_counter()
+            if frame is not None:
+                self._record(frame, now - last)
+            last = now
+
+    def _record(self, frame: Optional[FrameType], weight: float) -> None:
+        stack: List[int] = []
+        while frame is not None and len(stack) < self.max_depth:
+            code = frame.f_code
+            key = (code.co_name, code.co_filename, code.co_firstlineno)
+            index = self._frames.get(key)
+            if index is None:
+                index = self._frames[key] = len(self._frames)
+            stack.append(index)
+            frame = frame.f_back
+        stack.reverse()
+        self._samples.append(stack)
+        self._weights.append(weight)
+
+    def to_speedscope(self, name: str) -> dict:
+        """Export the samples in speedscope's file format (https://www.speedscope.app)."""
+        frames = [
+            {"name": func, "file": filename, "line": line}
+            for (func, filename, line), _ in sorted(self._frames.items(), key=lambda item: item[1])
+        ]
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "fast-quizz-app",
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": self.stopped_at - self.started_at,
+                    "samples": self._samples,
+                    "weights": self._weights,
+                }
+            ],
+        }
+
+
+class ProfileStore:
+    """Keeps the most recent speedscope profiles on disk, keyed by request id."""
+
+    def __init__(self, directory: str, max_files: int = 100):
+        self.directory = Path(directory)
+        self.max_files = max_files
+
+    def _path(self, profile_id: str) -> Path:
+        if not _PROFILE_ID.match(profile_id):
+            raise ValueError(f"Invalid profile id '{profile_id}'")
+        return self.directory / f"{profile_id}.speedscope.json"
+
+    def save(self, profile_id: str, profile: dict) -> Path:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(profile_id)
+        path.write_text(json.dumps(profile), encoding="utf-8")
+        self._prune()
+        return path
+
+    def load(self, profile_id: str) -> Optional[dict]:
+        try:
+            path = self._path(profile_id)
+        except ValueError:
+            return None
+        if not path.exists():
+            return None
+        profile: dict = json.loads(path.read_text(encoding="utf-8"))
+        return profile
+
+    def _prune(self) -> None:
+        files = sorted(self.directory.glob("*.speedscope.json"), key=lambda p: p.stat().st_mtime)
+        for stale in files[: max(len(files) - self.max_files, 0)]:
+            stale.unlink(missing_ok=True)
+
+
+PROFILING_TOKEN = os.getenv("PROFILING_TOKEN", "")
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "1"))
+
+profile_store = ProfileStore(
+    os.getenv("PROFILING_DIR", "profiles"),
+    max_files=int(os.getenv("PROFILING_MAX_FILES", "100")),
+)
+
+
+def is_profiling_token(value: Optional[str]) -> bool:
+    """Whether `value` matches the configured PROFILING_TOKEN (never true when unset)."""
+    if not PROFILING_TOKEN or not value:
+        return False
+    return hmac.compare_digest(value, PROFILING_TOKEN)
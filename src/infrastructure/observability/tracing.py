@@ -0,0 +1,292 @@
+import functools
+import inspect
+import os
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Protocol, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext, ExecutionContext
+
+T = TypeVar("T")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    """A timed operation, nested under the span that was current when it started."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    kind: str = "internal"
+    start_ns: int = 0
+    end_ns: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None:
+        ...
+
+    def shutdown(self) -> None:
+        ...
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the configured exporter.
+
+    Without an exporter spans are not recorded at all, so instrumented code
+    only pays for a context variable lookup.
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(self, exporter: Optional[SpanExporter]) -> None:
+        if self.exporter is not None:
+            self.exporter.shutdown()
+        self.exporter = exporter
+
+    def begin(self, name: str, kind: str = "internal", **attributes: Any) -> Optional[Span]:
+        """Start a span without activating it; pair with `end`."""
+        if self.exporter is None:
+            return None
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+            start_ns=time.time_ns(),
+            attributes={k: _attribute_value(v) for k, v in attributes.items() if v is not None},
+        )
+
+    def end(self, span: Optional[Span], error: Optional[BaseException] = None) -> None:
+        if span is None:
+            return
+        span.end_ns = time.time_ns()
+        if error is not None:
+            span.status = "error"
+            span.error = f"{type(error).__name__}: {error}"
+        if self.exporter is not None:
+            self.exporter.export(span)
+
+    @contextmanager
+    def start_span(self, name: str, kind: str = "internal", **attributes: Any) -> Iterator[Optional[Span]]:
+        """Run the block inside a new span that becomes the current one."""
+        span = self.begin(name, kind=kind, **attributes)
+        if span is None:
+            yield None
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end(span, error=e)
+            raise
+        else:
+            self.end(span)
+        finally:
+            _current_span.reset(token)
+
+
+tracer = Tracer()
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def _attribute_value(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _call_attributes(signature: inspect.Signature, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Pick identifier-like arguments (quiz_id, user_id, skip, limit...) as span attributes."""
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return {}
+    attributes = {}
+    for name, value in bound.arguments.items():
+        if name.endswith("_id") and isinstance(value, (UUID, str, int)):
+            attributes[name] = value
+        elif name in ("skip", "limit") and isinstance(value, int):
+            attributes[name] = value
+    return attributes
+
+
+def _result_attributes(span: Optional[Span], result: Any) -> None:
+    if span is None:
+        return
+    if isinstance(result, list):
+        span.set_attribute("result.count", len(result))
+    elif result is None:
+        span.set_attribute("result.found", False)
+
+
+def traced(name: Optional[str] = None, kind: str = "internal") -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorate a function (sync or async) so each call runs inside a span."""
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        span_name = name or func.__qualname__
+        signature = inspect.signature(func)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not tracer.enabled:
+                    return await func(*args, **kwargs)
+                attributes = _call_attributes(signature, args, kwargs)
+                with tracer.start_span(span_name, kind=kind, **attributes) as span:
+                    result = await func(*args, **kwargs)
+                    _result_attributes(span, result)
+                    return result
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            attributes = _call_attributes(signature, args, kwargs)
+            with tracer.start_span(span_name, kind=kind, **attributes) as span:
+                result = func(*args, **kwargs)
+                _result_attributes(span, result)
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+def traced_class(kind: str = "internal") -> Callable[[type], type]:
+    """Wrap every public coroutine method of a class in a `Class.method` span."""
+
+    def decorator(cls: type) -> type:
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.iscoroutinefunction(value):
+                continue
+            setattr(cls, attr, traced(f"{cls.__name__}.{attr}", kind=kind)(value))
+        return cls
+
+    return decorator
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    span = tracer.begin(
+        "db.query",
+        kind="client",
+        **{"db.system": conn.dialect.name, "db.statement": " ".join(statement.split())[:500]},
+    )
+    if span is not None:
+        conn.info.setdefault("trace_spans", []).append(span)
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Optional[ExecutionContext],
+    executemany: bool,
+) -> None:
+    spans: List[Span] = conn.info.get("trace_spans") or []
+    if not spans:
+        return
+    span = spans.pop()
+    if cursor.rowcount is not None and cursor.rowcount >= 0:
+        span.set_attribute("db.rowcount", cursor.rowcount)
+    tracer.end(span)
+
+
+def _handle_error(exception_context: ExceptionContext) -> None:
+    conn = exception_context.connection
+    spans: Optional[List[Span]] = conn.info.get("trace_spans") if conn is not None else None
+    if spans:
+        tracer.end(spans.pop(), error=exception_context.original_exception)
+
+
+_sql_hooks_installed = False
+
+
+def install_sql_tracing() -> None:
+    """Emit a `db.query` span for every statement executed on any engine."""
+    global _sql_hooks_installed
+    if _sql_hooks_installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _sql_hooks_installed = True
+
+
+def configure_tracing_from_env() -> None:
+    """Set up the global tracer from TRACING_EXPORTER (none, console, json, otlp)."""
+    from .exporters import ConsoleSpanExporter, JsonFileSpanExporter, OTLPHttpSpanExporter
+
+    exporter_name = os.getenv("TRACING_EXPORTER", "none").lower()
+    if exporter_name == "console":
+        exporter: Optional[SpanExporter] = ConsoleSpanExporter()
+    elif exporter_name == "json":
+        exporter = JsonFileSpanExporter(os.getenv("TRACING_JSON_PATH", "traces.jsonl"))
+    elif exporter_name == "otlp":
+        exporter = OTLPHttpSpanExporter(
+            endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318"),
+            service_name=os.getenv("OTEL_SERVICE_NAME", "fast-quizz-app"),
+        )
+    elif exporter_name in ("", "none"):
+        exporter = None
+    else:
+        raise ValueError(f"Unknown TRACING_EXPORTER '{exporter_name}'")
+
+    tracer.configure(exporter)
+    if exporter is not None:
+        install_sql_tracing()
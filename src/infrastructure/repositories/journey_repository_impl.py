@@ -4,12 +4,14 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.connection import get_db
+from src.infrastructure.observability import traced_class
 
 from ...domain.entities.journey import Journey
 from ...domain.repositories.journey_repository import JourneyRepository
 from ..database.models import JourneyModel
 
 
+@traced_class()
 class JourneyRepositoryImpl(JourneyRepository):
     """SQLAlchemy implementation of JourneyRepository."""
 
@@ -18,7 +20,7 @@ class JourneyRepositoryImpl(JourneyRepository):
 
     def _to_entity(self, model: JourneyModel) -> Journey:
         """Convert database model to domain entity."""
-        return Journey(
+        return Journey.hydrate(
             id=model.id,
             title=model.title,
             description=model.description,
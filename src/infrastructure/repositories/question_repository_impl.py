@@ -1,17 +1,20 @@
 from typing import Annotated, Optional, List
-from uuid import UUID, uuid4
+from uuid import UUID
 from datetime import datetime
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.connection import get_db
+from src.infrastructure.observability import traced_class
 
+from ...domain.entities.item_stats import QuestionItemStats
 from ...domain.entities.question import Question
 from ...domain.entities.option import Option
 from ...domain.repositories.question_repository import QuestionRepository
-from ..database.models import QuestionModel, QuestionOptionModel
+from ..database.models import QuestionItemStatsModel, QuestionModel, QuestionOptionModel
 
 
+@traced_class()
 class QuestionRepositoryImpl(QuestionRepository):
     """SQLAlchemy implementation of QuestionRepository."""
 
@@ -21,20 +24,20 @@ class QuestionRepositoryImpl(QuestionRepository):
     def _to_entity(self, model: QuestionModel) -> Question:
         """Convert database model to domain entity."""
         options = [
-            Option(
+            Option.hydrate(
                 id=opt.id,
                 reference_id=opt.reference_id,
                 text=opt.text,
                 order=opt.order,
                 is_correct=opt.is_correct,
                 image_url=opt.image_url,
-                metadata=opt.metadata_json,
+                metadata=opt.metadata_json or {},
                 created_at=opt.created_at,
                 updated_at=opt.updated_at,
             )
             for opt in getattr(model, "options", []) or []
         ]
-        return Question(
+        return Question.hydrate(
             id=model.id,
             text=model.text,
             quiz_id=model.quiz_id,
@@ -152,6 +155,26 @@ class QuestionRepositoryImpl(QuestionRepository):
             return True
         return False
 
+    async def get_item_stats_by_quiz(self, quiz_id: UUID) -> List[QuestionItemStats]:
+        db_stats = (
+            self.db.query(QuestionItemStatsModel)
+            .filter(QuestionItemStatsModel.quiz_id == quiz_id)
+            .all()
+        )
+        return [
+            QuestionItemStats(
+                question_id=s.question_id,
+                quiz_id=s.quiz_id,
+                responses=s.responses,
+                correct=s.correct,
+                p_value=s.p_value,
+                discrimination=s.discrimination,
+                option_counts=s.option_counts,
+                computed_at=s.computed_at,
+            )
+            for s in db_stats
+        ]
+
 
 def get_question_repository(db: Annotated[Session, Depends(get_db)]) -> QuestionRepository:
     return QuestionRepositoryImpl(db)
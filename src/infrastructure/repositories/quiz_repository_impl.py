@@ -4,39 +4,41 @@ from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
 
 from src.infrastructure.database.connection import get_db
+from src.infrastructure.observability import traced_class
 
 from ...domain.entities.quiz import Quiz, FeedbackMode, Difficulty
 from ...domain.repositories.quiz_repository import QuizRepository
 from ..database.models import QuizModel
 
 
+@traced_class()
 class QuizRepositoryImpl(QuizRepository):
     def __init__(self, db: Session):
         self.db = db
 
     def _to_entity(self, model: QuizModel, include_questions: bool = False) -> Quiz:
-        quizz = Quiz(
+        questions = []
+        if include_questions:
+            from .question_repository_impl import QuestionRepositoryImpl
+
+            question_repo = QuestionRepositoryImpl(self.db)
+            questions = [question_repo._to_entity(q_model) for q_model in model.questions]
+        return Quiz.hydrate(
             id=model.id,
             title=model.title,
             description=model.description,
             journey_id=model.journey_id,
             user_id=model.user_id,
+            questions=questions,
             estimated_time=model.estimated_time,
             feedback_mode=FeedbackMode(model.feedback_mode) if model.feedback_mode else FeedbackMode.FINAL,
             difficulty=Difficulty(model.difficulty) if model.difficulty else None,
             image_url=model.image_url,
+            shuffle_questions=model.shuffle_questions,
+            shuffle_options=model.shuffle_options,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
-        if include_questions:
-            from .question_repository_impl import QuestionRepositoryImpl
-
-            question_repo = QuestionRepositoryImpl(self.db)
-            questions = [
-                question_repo._to_entity(q_model) for q_model in model.questions
-            ]
-            quizz.questions = questions  # type: ignore
-        return quizz
 
     def _to_model(self, entity: Quiz) -> QuizModel:
         return QuizModel(
@@ -49,6 +51,8 @@ class QuizRepositoryImpl(QuizRepository):
             feedback_mode=entity.feedback_mode.value if entity.feedback_mode else "final",
             difficulty=entity.difficulty.value if entity.difficulty else None,
             image_url=entity.image_url,
+            shuffle_questions=entity.shuffle_questions,
+            shuffle_options=entity.shuffle_options,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -105,6 +109,8 @@ class QuizRepositoryImpl(QuizRepository):
             db_quiz.feedback_mode = quiz.feedback_mode.value if quiz.feedback_mode else "final"
             db_quiz.difficulty = quiz.difficulty.value if quiz.difficulty else None
             db_quiz.image_url = quiz.image_url
+            db_quiz.shuffle_questions = quiz.shuffle_questions
+            db_quiz.shuffle_options = quiz.shuffle_options
             db_quiz.updated_at = quiz.updated_at
             self.db.commit()
             self.db.refresh(db_quiz)
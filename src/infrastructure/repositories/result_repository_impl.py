@@ -1,22 +1,50 @@
-from typing import Annotated, List
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Annotated, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 from uuid import UUID
 from fastapi import Depends
+from sqlalchemy import ColumnElement, Select, case, func, insert, select, tuple_
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.connection import get_db
+from src.infrastructure.observability import traced_class
 
+from ...domain.entities.activity import ActivityBucket
+from ...domain.entities.attempt import Answer
+from ...domain.entities.journey_progress import QuizProgress
+from ...domain.entities.quiz_stats import QuizStats
 from ...domain.entities.results import Result
+from ...domain.events import ResultsRecorded, event_hub
+from ...domain.ids import uuid7
 from ...domain.repositories.result_repository import ResultRepository
-from ..database.models import ResultsModel
+from ..database.models import (
+    AnswerResultModel,
+    QuizActivityDailyModel,
+    QuizActivityHourlyModel,
+    QuizModel,
+    QuizScoreCountModel,
+    QuizStatsModel,
+    ResultsModel,
+    UserResultCountModel,
+)
+from ..database.upsert import greatest, least, upsert
 
 
+def hour_bucket(taken_at: datetime) -> datetime:
+    """Start of the UTC hour of a timestamp, naive like the stored timestamps."""
+    if taken_at.tzinfo is not None:
+        taken_at = taken_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return taken_at.replace(minute=0, second=0, microsecond=0)
+
+
+@traced_class()
 class ResultRepositoryImpl(ResultRepository):
 
     def __init__(self, db: Session):
         self.db = db
 
     def _to_entity(self, model: ResultsModel) -> Result:
-        return Result(
+        return Result.hydrate(
             id=model.id,
             user_id=model.user_id,
             respondent_name=model.respondent_name,
@@ -37,32 +65,400 @@ class ResultRepositoryImpl(ResultRepository):
             taken_at=result.taken_at,
         )
         self.db.add(db_result)
+        self._record_stats([result])
         self.db.commit()
         self.db.refresh(db_result)
-        return self._to_entity(db_result)
+        created = self._to_entity(db_result)
+        event_hub.publish(ResultsRecorded((created,)))
+        return created
+
+    async def create_with_answers(self, result: Result, answers: List[Answer]) -> Result:
+        db_result = ResultsModel(
+            id=result.id,
+            user_id=result.user_id,
+            respondent_name=result.respondent_name,
+            quiz_id=result.quiz_id,
+            score=result.score,
+            total_questions=result.total_questions,
+            taken_at=result.taken_at,
+        )
+        self.db.add(db_result)
+        self.db.flush()
+        if answers:
+            self.db.execute(
+                insert(AnswerResultModel),
+                [
+                    {
+                        "id": uuid7(),
+                        "result_id": result.id,
+                        "question_id": a.question_id,
+                        "selected_option_id": a.selected_option_id,
+                        "is_correct": a.is_correct,
+                        "answered_at": a.answered_at,
+                    }
+                    for a in answers
+                ],
+            )
+        self._record_stats([result])
+        self.db.commit()
+        self.db.refresh(db_result)
+        created = self._to_entity(db_result)
+        event_hub.publish(ResultsRecorded((created,)))
+        return created
+
+    async def create_many(self, results: List[Result], skip_existing: bool = False) -> int:
+        return self.insert_many(results, skip_existing=skip_existing)
+
+    def insert_many(self, results: List[Result], skip_existing: bool = False) -> int:
+        """Synchronous `create_many`, for callers that run it in a worker thread."""
+        if skip_existing and results:
+            existing = set(
+                self.db.execute(
+                    select(ResultsModel.id).where(ResultsModel.id.in_([r.id for r in results]))
+                ).scalars()
+            )
+            results = [r for r in results if r.id not in existing]
+        if not results:
+            return 0
+        try:
+            self.db.execute(
+                insert(ResultsModel),
+                [
+                    {
+                        "id": r.id,
+                        "user_id": r.user_id,
+                        "respondent_name": r.respondent_name,
+                        "quiz_id": r.quiz_id,
+                        "score": r.score,
+                        "total_questions": r.total_questions,
+                        "taken_at": r.taken_at,
+                    }
+                    for r in results
+                ],
+            )
+            self._record_stats(results)
+            self.db.commit()
+        except Exception:
+            # Leave the session usable, so the caller can retry the batch
+            self.db.rollback()
+            raise
+        event_hub.publish(ResultsRecorded(tuple(results)))
+        return len(results)
+
+    def _record_stats(self, results: Iterable[Result]) -> None:
+        """Fold results into quiz_stats, quiz_score_counts, user_result_counts and
+        quiz_activity_hourly, in the caller's transaction.
+
+        Deltas are combined per quiz first, so a batch costs one upsert per
+        table however many results it holds.
+        """
+        # attempts, score_sum, score_sq_sum, min_score, max_score
+        totals: Dict[UUID, List[int]] = {}
+        score_counts: Counter = Counter()
+        user_counts: Counter = Counter()
+        hours: DefaultDict[Tuple[UUID, datetime], List[int]] = defaultdict(lambda: [0, 0])
+        for r in results:
+            score = int(r.score)
+            total = totals.setdefault(r.quiz_id, [0, 0, 0, score, score])
+            total[0] += 1
+            total[1] += score
+            total[2] += score * score
+            total[3] = min(total[3], score)
+            total[4] = max(total[4], score)
+            score_counts[(r.quiz_id, score)] += 1
+            hour = hours[(r.quiz_id, hour_bucket(r.taken_at))]
+            hour[0] += 1
+            hour[1] += score
+            if r.user_id is not None:
+                user_counts[r.user_id] += 1
+        if not totals:
+            return
+
+        now = datetime.now(timezone.utc)
+        # Sorted keys keep the row lock order stable between concurrent writers
+        stats = upsert(self.db, QuizStatsModel).values(
+            [
+                {
+                    "quiz_id": quiz_id,
+                    "attempts": attempts,
+                    "score_sum": score_sum,
+                    "score_sq_sum": score_sq_sum,
+                    "min_score": min_score,
+                    "max_score": max_score,
+                    "updated_at": now,
+                }
+                for quiz_id, (attempts, score_sum, score_sq_sum, min_score, max_score) in sorted(
+                    totals.items(), key=lambda item: str(item[0])
+                )
+            ]
+        )
+        self.db.execute(
+            stats.on_conflict_do_update(
+                index_elements=[QuizStatsModel.quiz_id],
+                set_={
+                    "attempts": QuizStatsModel.attempts + stats.excluded.attempts,
+                    "score_sum": QuizStatsModel.score_sum + stats.excluded.score_sum,
+                    "score_sq_sum": QuizStatsModel.score_sq_sum + stats.excluded.score_sq_sum,
+                    "min_score": least(self.db, QuizStatsModel.min_score, stats.excluded.min_score),
+                    "max_score": greatest(self.db, QuizStatsModel.max_score, stats.excluded.max_score),
+                    "updated_at": stats.excluded.updated_at,
+                },
+            )
+        )
+        counts = upsert(self.db, QuizScoreCountModel).values(
+            [
+                {"quiz_id": quiz_id, "score": score, "attempts": attempts}
+                for (quiz_id, score), attempts in sorted(
+                    score_counts.items(), key=lambda item: (str(item[0][0]), item[0][1])
+                )
+            ]
+        )
+        self.db.execute(
+            counts.on_conflict_do_update(
+                index_elements=[QuizScoreCountModel.quiz_id, QuizScoreCountModel.score],
+                set_={"attempts": QuizScoreCountModel.attempts + counts.excluded.attempts},
+            )
+        )
+        activity = upsert(self.db, QuizActivityHourlyModel).values(
+            [
+                {
+                    "quiz_id": quiz_id,
+                    "bucket_start": bucket_start,
+                    "attempts": attempts,
+                    "score_sum": score_sum,
+                }
+                for (quiz_id, bucket_start), (attempts, score_sum) in sorted(
+                    hours.items(), key=lambda item: (str(item[0][0]), item[0][1])
+                )
+            ]
+        )
+        self.db.execute(
+            activity.on_conflict_do_update(
+                index_elements=[
+                    QuizActivityHourlyModel.quiz_id,
+                    QuizActivityHourlyModel.bucket_start,
+                ],
+                set_={
+                    "attempts": QuizActivityHourlyModel.attempts + activity.excluded.attempts,
+                    "score_sum": QuizActivityHourlyModel.score_sum + activity.excluded.score_sum,
+                },
+            )
+        )
+        if not user_counts:
+            return
+        users = upsert(self.db, UserResultCountModel).values(
+            [
+                {"user_id": user_id, "attempts": attempts}
+                for user_id, attempts in sorted(user_counts.items(), key=lambda item: str(item[0]))
+            ]
+        )
+        self.db.execute(
+            users.on_conflict_do_update(
+                index_elements=[UserResultCountModel.user_id],
+                set_={"attempts": UserResultCountModel.attempts + users.excluded.attempts},
+            )
+        )
+
+    async def get_quiz_stats(self, quiz_id: UUID) -> Optional[QuizStats]:
+        db_stats = self.db.get(QuizStatsModel, quiz_id)
+        if db_stats is None:
+            return None
+        score_counts = dict(
+            self.db.execute(
+                select(QuizScoreCountModel.score, QuizScoreCountModel.attempts).where(
+                    QuizScoreCountModel.quiz_id == quiz_id
+                )
+            ).all()
+        )
+        return QuizStats(
+            quiz_id=db_stats.quiz_id,
+            attempts=db_stats.attempts,
+            score_sum=db_stats.score_sum,
+            score_sq_sum=db_stats.score_sq_sum,
+            min_score=db_stats.min_score,
+            max_score=db_stats.max_score,
+            score_counts=score_counts,
+            updated_at=db_stats.updated_at,
+        )
+
+    async def count_scores_below(self, quiz_id: UUID, score: int) -> Tuple[int, int]:
+        # At most 101 rows per quiz, read by primary key
+        below, total = self.db.execute(
+            select(
+                func.sum(
+                    case((QuizScoreCountModel.score < score, QuizScoreCountModel.attempts), else_=0)
+                ),
+                func.sum(QuizScoreCountModel.attempts),
+            ).where(QuizScoreCountModel.quiz_id == quiz_id)
+        ).one()
+        return int(below or 0), int(total or 0)
 
-    async def get_by_quiz_id(self, quiz_id: UUID, skip: int = 0, limit: int = 100) -> List[Result]:
+    async def get_by_id(self, result_id: UUID) -> Optional[Result]:
+        db_result = self.db.get(ResultsModel, result_id)
+        return self._to_entity(db_result) if db_result else None
+
+    async def get_top_by_quiz(self, quiz_id: UUID, limit: int = 10) -> List[Result]:
+        # Served by ix_results_quiz_score_taken_at
         db_results = (
             self.db.query(ResultsModel)
             .filter(ResultsModel.quiz_id == quiz_id)
-            .order_by(ResultsModel.taken_at.desc())
-            .offset(skip)
+            .order_by(ResultsModel.score.desc(), ResultsModel.taken_at, ResultsModel.id)
             .limit(limit)
             .all()
         )
         return [self._to_entity(r) for r in db_results]
 
-    async def get_by_user_id(self, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Result]:
+    def _newest_first(
+        self, criterion, skip: int, limit: int, before: Optional[Tuple[datetime, UUID]]
+    ) -> List[Result]:
+        query = self.db.query(ResultsModel).filter(criterion)
+        if before is not None:
+            query = query.filter(tuple_(ResultsModel.taken_at, ResultsModel.id) < tuple_(*before))
         db_results = (
-            self.db.query(ResultsModel)
-            .filter(ResultsModel.user_id == user_id)
-            .order_by(ResultsModel.taken_at.desc())
+            query.order_by(ResultsModel.taken_at.desc(), ResultsModel.id.desc())
             .offset(skip)
             .limit(limit)
             .all()
         )
         return [self._to_entity(r) for r in db_results]
 
+    async def get_by_quiz_id(
+        self,
+        quiz_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Result]:
+        return self._newest_first(ResultsModel.quiz_id == quiz_id, skip, limit, before)
+
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Result]:
+        return self._newest_first(ResultsModel.user_id == user_id, skip, limit, before)
+
+    async def count_by_quiz_id(self, quiz_id: UUID) -> int:
+        attempts = self.db.execute(
+            select(QuizStatsModel.attempts).where(QuizStatsModel.quiz_id == quiz_id)
+        ).scalar()
+        return attempts or 0
+
+    async def count_by_user_id(self, user_id: UUID) -> int:
+        attempts = self.db.execute(
+            select(UserResultCountModel.attempts).where(UserResultCountModel.user_id == user_id)
+        ).scalar()
+        return attempts or 0
+
+    async def get_journey_progress(self, journey_id: UUID, user_id: UUID) -> List[QuizProgress]:
+        # The user filter is part of the join so quizzes without results keep a row
+        rows = self.db.execute(
+            select(
+                QuizModel.id,
+                QuizModel.title,
+                func.max(ResultsModel.score),
+                func.count(ResultsModel.id),
+                func.max(ResultsModel.taken_at),
+            )
+            .outerjoin(
+                ResultsModel,
+                (ResultsModel.quiz_id == QuizModel.id) & (ResultsModel.user_id == user_id),
+            )
+            .where(QuizModel.journey_id == journey_id)
+            .group_by(QuizModel.id, QuizModel.title)
+            .order_by(QuizModel.id)
+        ).all()
+        return [
+            QuizProgress(quiz_id, title, best_score, attempts, last_taken_at)
+            for quiz_id, title, best_score, attempts, last_taken_at in rows
+        ]
+
+    async def get_activity(
+        self,
+        since: datetime,
+        granularity: str = "day",
+        quiz_id: Optional[UUID] = None,
+        journey_id: Optional[UUID] = None,
+    ) -> List[ActivityBucket]:
+        def in_scope(
+            model: Union[Type[QuizActivityHourlyModel], Type[QuizActivityDailyModel]],
+        ) -> ColumnElement[bool]:
+            if quiz_id is not None:
+                return model.quiz_id == quiz_id
+            return model.quiz_id.in_(select(QuizModel.id).where(QuizModel.journey_id == journey_id))
+
+        hourly = self.db.execute(
+            select(
+                QuizActivityHourlyModel.bucket_start,
+                func.sum(QuizActivityHourlyModel.attempts),
+                func.sum(QuizActivityHourlyModel.score_sum),
+            )
+            .where(in_scope(QuizActivityHourlyModel), QuizActivityHourlyModel.bucket_start >= since)
+            .group_by(QuizActivityHourlyModel.bucket_start)
+        ).all()
+        if granularity == "hour":
+            return [
+                ActivityBucket(start, int(attempts), int(score_sum))
+                for start, attempts, score_sum in sorted(hourly)
+            ]
+
+        # Recent hours are not compacted yet: fold them into their days here
+        days: Dict[datetime, ActivityBucket] = {}
+        daily = self.db.execute(
+            select(
+                QuizActivityDailyModel.day,
+                func.sum(QuizActivityDailyModel.attempts),
+                func.sum(QuizActivityDailyModel.score_sum),
+            )
+            .where(in_scope(QuizActivityDailyModel), QuizActivityDailyModel.day >= since.date())
+            .group_by(QuizActivityDailyModel.day)
+        ).all()
+        for day, attempts, score_sum in daily:
+            start = datetime(day.year, day.month, day.day)
+            days.setdefault(start, ActivityBucket(start)).add(int(attempts), int(score_sum))
+        for bucket_start, attempts, score_sum in hourly:
+            start = bucket_start.replace(hour=0)
+            days.setdefault(start, ActivityBucket(start)).add(int(attempts), int(score_sum))
+        return [days[start] for start in sorted(days)]
+
+    @staticmethod
+    def _export_statement(include_answers: bool) -> Select:
+        stmt = select(
+            ResultsModel.id.label("result_id"),
+            ResultsModel.user_id,
+            ResultsModel.respondent_name,
+            ResultsModel.score,
+            ResultsModel.total_questions,
+            ResultsModel.taken_at,
+        ).order_by(ResultsModel.taken_at, ResultsModel.id)
+        if include_answers:
+            stmt = (
+                stmt.add_columns(
+                    AnswerResultModel.question_id,
+                    AnswerResultModel.selected_option_id,
+                    AnswerResultModel.is_correct,
+                    AnswerResultModel.answered_at,
+                )
+                .outerjoin(AnswerResultModel, AnswerResultModel.result_id == ResultsModel.id)
+                .order_by(AnswerResultModel.answered_at)
+            )
+        return stmt
+
+    def export_columns(self, include_answers: bool = False) -> List[str]:
+        return list(self._export_statement(include_answers).selected_columns.keys())
+
+    def stream_by_quiz(
+        self, quiz_id: UUID, include_answers: bool = False, chunk_size: int = 1000
+    ) -> Iterator[Dict]:
+        stmt = self._export_statement(include_answers).where(ResultsModel.quiz_id == quiz_id)
+        # The request-scoped session is closed before a streamed body is sent
+        with Session(bind=self.db.get_bind()) as session:
+            rows = session.execute(stmt, execution_options={"yield_per": chunk_size})
+            for row in rows:
+                yield row._asdict()
+
 
 def get_result_repository(db: Annotated[Session, Depends(get_db)]) -> ResultRepository:
     return ResultRepositoryImpl(db)
@@ -4,12 +4,15 @@ from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from src.infrastructure.database.connection import get_db
+from src.infrastructure.observability import traced_class
 
 from ...domain.entities.user import User
+from ...domain.enum.user_type import UserType
 from ...domain.repositories.user_repository import UserRepository
 from ..database.models import UserModel
 
 
+@traced_class()
 class UserRepositoryImpl(UserRepository):
     """SQLAlchemy implementation of UserRepository."""
 
@@ -18,12 +21,13 @@ class UserRepositoryImpl(UserRepository):
 
     def _to_entity(self, model: UserModel) -> User:
         """Convert database model to domain entity."""
-        return User(
+        return User.hydrate(
             id=model.id,
             username=model.username,
             email=model.email,
             hashed_password=model.hashed_password,
             is_active=model.is_active,
+            type=UserType(model.type) if model.type is not None else None,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -36,6 +40,7 @@ class UserRepositoryImpl(UserRepository):
             email=entity.email,
             hashed_password=entity.hashed_password,
             is_active=entity.is_active,
+            type=entity.type.value if entity.type is not None else None,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
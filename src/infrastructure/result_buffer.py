@@ -0,0 +1,536 @@
+import asyncio
+import fcntl
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from ..domain.entities.results import Result
+from ..domain.ids import uuid7
+from .database.connection import SessionLocal
+from .health import CheckResult
+from .repositories.result_repository_impl import ResultRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+RESULTS_INGESTION_MODE = os.getenv("RESULTS_INGESTION_MODE", "direct").lower()
+RESULTS_FLUSH_INTERVAL_MS = float(os.getenv("RESULTS_FLUSH_INTERVAL_MS", "200"))
+RESULTS_FLUSH_MAX_ROWS = int(os.getenv("RESULTS_FLUSH_MAX_ROWS", "500"))
+RESULTS_FLUSH_MAX_RETRIES = int(os.getenv("RESULTS_FLUSH_MAX_RETRIES", "5"))
+RESULTS_QUEUE_MAX = int(os.getenv("RESULTS_QUEUE_MAX", "10000"))
+RESULTS_SPOOL_DIR = os.getenv("RESULTS_SPOOL_DIR", "spool/results")
+RESULTS_SPOOL_FSYNC = os.getenv("RESULTS_SPOOL_FSYNC", "False").lower() in ("1", "true", "yes")
+
+Entry = Tuple[int, Result]
+Failure = Tuple[Result, str]
+
+
+class BufferFullError(Exception):
+    """The ingestion queue is at capacity or shutting down; the client should retry."""
+
+
+def _record(result: Result) -> Dict[str, Any]:
+    return {
+        "id": str(result.id),
+        "user_id": str(result.user_id) if result.user_id else None,
+        "respondent_name": result.respondent_name,
+        "quiz_id": str(result.quiz_id),
+        "score": result.score,
+        "total_questions": result.total_questions,
+        "taken_at": result.taken_at.isoformat(),
+    }
+
+
+def _load(line: str) -> Result:
+    data = json.loads(line)
+    return Result.hydrate(
+        id=UUID(data["id"]),
+        user_id=UUID(data["user_id"]) if data["user_id"] else None,
+        respondent_name=data["respondent_name"],
+        quiz_id=UUID(data["quiz_id"]),
+        score=data["score"],
+        total_questions=data["total_questions"],
+        taken_at=datetime.fromisoformat(data["taken_at"]),
+    )
+
+
+def _try_lock(path: Path) -> Optional[int]:
+    """Lock `path` without waiting; None when it is gone or another process holds it."""
+    try:
+        fd = os.open(path, os.O_RDWR)
+    except FileNotFoundError:
+        return None
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        # Another process may have claimed and unlinked it before we got the lock
+        if os.path.samestat(os.fstat(fd), os.stat(path)):
+            return fd
+    except (BlockingIOError, FileNotFoundError):
+        pass
+    os.close(fd)
+    return None
+
+
+class ResultSpool:
+    """Append-only NDJSON segments with the results that are queued but not yet stored.
+
+    Each process writes its segments to a directory of its own under `root` and
+    holds an exclusive lock on `root/<name>.lock` while it runs. A segment is
+    deleted once every result in it has been flushed, so after a crash the
+    directory holds exactly the results that may be missing from the database.
+    The next process to start claims directories whose lock is free and replays
+    them; directories of live processes are never touched.
+
+    Results that cannot be stored at all are appended to
+    `root/dead-letter/<name>.ndjson` with the error. The spool is not
+    thread-safe; `ResultWriteBuffer` drives it from a single writer thread.
+    """
+
+    def __init__(self, root: Path, segment_rows: int = 2000, fsync: bool = RESULTS_SPOOL_FSYNC):
+        self.root = root
+        self.segment_rows = segment_rows
+        self.fsync = fsync
+        self.name = uuid7().hex
+        self.directory = root / self.name
+        self._lock_path = root / f"{self.name}.lock"
+        self._lock_fd: Optional[int] = None
+        self._closed: List[Tuple[Path, int]] = []
+        self._current: Optional[TextIO] = None
+        self._current_path: Optional[Path] = None
+        self._current_rows = 0
+        self._last_seq = 0
+
+    def open(self) -> None:
+        """Create and lock this process's segment directory."""
+        if self._lock_fd is not None:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.root, prefix=".", suffix=".locking")
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        # Published only once locked, so no other process can see it unlocked
+        os.rename(temp_path, self._lock_path)
+        self.directory.mkdir(exist_ok=True)
+        self._lock_fd = fd
+
+    def leftover_segments(self) -> List[Path]:
+        if not self.directory.exists():
+            return []
+        return sorted(self.directory.glob("*.ndjson"))
+
+    def claim_orphans(self) -> Iterator[Path]:
+        """Yield the segments of processes that no longer hold their lock.
+
+        The caller deletes each segment once it is replayed. A directory, and
+        then its lock file, is removed when no segment is left in it.
+        """
+        if not self.root.exists():
+            return
+        for lock_path in sorted(self.root.glob("*.lock")):
+            if lock_path == self._lock_path:
+                continue
+            fd = _try_lock(lock_path)
+            if fd is None:
+                continue
+            try:
+                directory = self.root / lock_path.stem
+                yield from sorted(directory.glob("*.ndjson"))
+                if directory.exists() and not any(directory.iterdir()):
+                    directory.rmdir()
+                if not directory.exists():
+                    lock_path.unlink(missing_ok=True)
+            finally:
+                os.close(fd)
+
+    def read(self, path: Path) -> List[Result]:
+        results = []
+        with open(path, encoding="utf-8") as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    results.append(_load(line))
+                except (ValueError, KeyError) as e:
+                    # A torn final write from a crash; everything before it is intact.
+                    logger.warning("Skipping unreadable spool line %s:%d: %s", path, number, e)
+        return results
+
+    def append(self, entries: Sequence[Entry]) -> None:
+        """Write `(sequence, result)` entries, then flush (and fsync) once."""
+        for seq, result in entries:
+            current = self._current
+            if current is None or self._current_rows >= self.segment_rows:
+                current = self._rotate()
+            current.write(json.dumps(_record(result)) + "\n")
+            self._current_rows += 1
+            self._last_seq = seq
+        self._sync()
+
+    def dead_letter(self, failures: Sequence[Failure]) -> None:
+        """Keep results the database refused, with the error, for manual repair."""
+        directory = self.root / "dead-letter"
+        directory.mkdir(parents=True, exist_ok=True)
+        with open(directory / f"{self.name}.ndjson", "a", encoding="utf-8") as f:
+            for result, error in failures:
+                f.write(json.dumps({**_record(result), "error": error}) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def _sync(self) -> None:
+        if self._current is None:
+            return
+        self._current.flush()
+        if self.fsync:
+            os.fsync(self._current.fileno())
+
+    def _rotate(self) -> TextIO:
+        self._close_current()
+        self.open()
+        self._current_path = self.directory / f"{time.time_ns()}.ndjson"
+        self._current = open(self._current_path, "a", encoding="utf-8")
+        self._current_rows = 0
+        return self._current
+
+    def _close_current(self) -> None:
+        if self._current is not None and self._current_path is not None:
+            self._sync()
+            self._current.close()
+            self._closed.append((self._current_path, self._last_seq))
+            self._current = None
+
+    def release(self, seq: int) -> None:
+        """Drop the segments whose results are all stored (up to sequence `seq`)."""
+        if self._current is not None and seq >= self._last_seq:
+            self._close_current()
+        while self._closed and self._closed[0][1] <= seq:
+            path, _ = self._closed.pop(0)
+            path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the open segment and give up the lock.
+
+        The directory is removed when it is empty; otherwise it is left for the
+        next process to replay.
+        """
+        self._close_current()
+        if self._lock_fd is None:
+            return
+        if self.directory.exists() and not any(self.directory.iterdir()):
+            self.directory.rmdir()
+        if not self.directory.exists():
+            self._lock_path.unlink(missing_ok=True)
+        os.close(self._lock_fd)
+        self._lock_fd = None
+
+
+_Command = Tuple[str, Any, Optional["asyncio.Future[None]"]]
+
+
+def _set_future(future: "asyncio.Future[None]", error: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(None)
+
+
+class SpoolWriter:
+    """Run a ResultSpool on its own thread so file writes stay off the event loop.
+
+    Commands are applied in the order they were sent, so a segment is never
+    released before the results in it are written. Appends that are waiting
+    together are written with a single flush (and fsync).
+    """
+
+    def __init__(self, spool: ResultSpool):
+        self.spool = spool
+        self._commands: "queue.Queue[Optional[_Command]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="result-spool", daemon=True)
+        self._thread.start()
+
+    def append(self, seq: int, result: Result) -> "asyncio.Future[None]":
+        """Queue a result for the spool; the future resolves once it is written."""
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._commands.put(("append", (seq, result), future))
+        return future
+
+    def release(self, seq: int) -> None:
+        self._commands.put(("release", seq, None))
+
+    def dead_letter(self, failures: List[Failure]) -> None:
+        self._commands.put(("dead_letter", failures, None))
+
+    def stop(self) -> None:
+        """Apply the queued commands, close the spool and wait for the thread (blocking)."""
+        if self._thread is None:
+            return
+        self._commands.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            commands = [self._commands.get()]
+            while True:
+                try:
+                    commands.append(self._commands.get_nowait())
+                except queue.Empty:
+                    break
+            pending: List[Tuple[Entry, asyncio.Future[None]]] = []
+            for command in commands:
+                if command is None:
+                    self._append(pending)
+                    self.spool.close()
+                    return
+                kind, argument, future = command
+                if kind == "append" and future is not None:
+                    pending.append((argument, future))
+                    continue
+                self._append(pending)
+                pending = []
+                try:
+                    if kind == "release":
+                        self.spool.release(argument)
+                    else:
+                        self.spool.dead_letter(argument)
+                except OSError:
+                    logger.exception("Result spool %s failed", kind)
+            self._append(pending)
+
+    def _append(self, pending: List[Tuple[Entry, "asyncio.Future[None]"]]) -> None:
+        if not pending:
+            return
+        error: Optional[BaseException] = None
+        try:
+            self.spool.append([entry for entry, _ in pending])
+        except OSError as e:
+            logger.exception("Could not spool %d results", len(pending))
+            error = e
+        for _, future in pending:
+            try:
+                future.get_loop().call_soon_threadsafe(_set_future, future, error)
+            except RuntimeError:
+                # The loop that is waiting for it is closed
+                pass
+
+
+class ResultWriteBuffer:
+    """Accept results into a bounded queue and store them with batched inserts.
+
+    A batch is written when `max_rows` results are waiting or `flush_interval`
+    seconds after the first one arrived, whichever comes first. Inserts run in
+    the threadpool and the spool is written by its own thread, so neither
+    blocks the event loop. A failed flush is retried `max_retries` times with
+    backoff; after that the batch is bisected to find the rows the database
+    refuses, those are dead-lettered and the rest of the queue moves on.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        flush_interval: float = RESULTS_FLUSH_INTERVAL_MS / 1000,
+        max_rows: int = RESULTS_FLUSH_MAX_ROWS,
+        max_queue: int = RESULTS_QUEUE_MAX,
+        spool: Optional[ResultSpool] = None,
+        shutdown_timeout: float = 10.0,
+        max_retries: int = RESULTS_FLUSH_MAX_RETRIES,
+        retry_delay: float = 0.1,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.max_rows = max_rows
+        self.max_queue = max_queue
+        self.spool = spool
+        self.shutdown_timeout = shutdown_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.flushed = 0
+        self.failed_flushes = 0
+        self.dead_lettered = 0
+        self._seq = 0
+        self._queue: asyncio.Queue[Entry] = asyncio.Queue(maxsize=max_queue)
+        self._batch_ready = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._spool_writer: Optional[SpoolWriter] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        """Replay spooled results left by exited processes, then start flushing."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._batch_ready = asyncio.Event()
+        self._stopping = False
+        if self.spool is not None:
+            await run_in_threadpool(self.spool.open)
+            await run_in_threadpool(self._replay, self.spool)
+            self._spool_writer = SpoolWriter(self.spool)
+            self._spool_writer.start()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(self, result: Result) -> None:
+        """Enqueue a result and wait until it is spooled.
+
+        Raises BufferFullError when it cannot be accepted.
+        """
+        if not self.running or self._stopping or self._queue.full():
+            raise BufferFullError("result ingestion queue is full")
+        self._seq += 1
+        # Sent to the spool first, so its segment cannot be released before it is written
+        spooled = self._spool_writer.append(self._seq, result) if self._spool_writer else None
+        self._queue.put_nowait((self._seq, result))
+        if self._queue.qsize() >= self.max_rows:
+            self._batch_ready.set()
+        if spooled is not None:
+            try:
+                await spooled
+            except OSError:
+                # Logged by the writer; the result is still queued, just not crash-safe
+                pass
+
+    async def stop(self) -> None:
+        """Flush everything that is queued, then stop the flusher and the spool."""
+        task = self._task
+        if task is None:
+            return
+        self._stopping = True
+        self._batch_ready.set()
+        if not task.done():
+            try:
+                await asyncio.wait_for(self._queue.join(), timeout=self.shutdown_timeout)
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Result buffer shutdown timed out with %d results queued; "
+                    "they remain in the spool",
+                    self._queue.qsize(),
+                )
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._spool_writer is not None:
+            await run_in_threadpool(self._spool_writer.stop)
+            self._spool_writer = None
+
+    def _replay(self, spool: ResultSpool) -> None:
+        for path in spool.claim_orphans():
+            results = spool.read(path)
+            try:
+                for start in range(0, len(results), self.max_rows):
+                    self._write_sync(results[start:start + self.max_rows], skip_existing=True)
+            except Exception:
+                logger.exception("Could not replay spooled results from %s; keeping the file", path)
+                continue
+            logger.info("Replayed %d spooled results from %s", len(results), path)
+            path.unlink(missing_ok=True)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() + 1 < self.max_rows and not self._stopping:
+                self._batch_ready.clear()
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            while len(batch) < self.max_rows and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Entry]) -> None:
+        results = [result for _, result in batch]
+        delay = self.retry_delay
+        failures: List[Failure] = []
+        for attempt in range(self.max_retries + 1):
+            try:
+                # A failed attempt may have committed before raising
+                await self._write(results, skip_existing=attempt > 0)
+                break
+            except Exception:
+                self.failed_flushes += 1
+                logger.exception(
+                    "Flushing %d results failed (attempt %d)", len(results), attempt + 1
+                )
+                if attempt < self.max_retries:
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 5.0)
+        else:
+            failures = await run_in_threadpool(self._isolate, results)
+        self.flushed += len(results) - len(failures)
+        if failures:
+            self.dead_lettered += len(failures)
+            for result, error in failures:
+                logger.error(
+                    "Dead-lettering result %s of quiz %s: %s", result.id, result.quiz_id, error
+                )
+            if self._spool_writer is not None:
+                self._spool_writer.dead_letter(failures)
+        if self._spool_writer is not None:
+            self._spool_writer.release(batch[-1][0])
+
+    def _isolate(self, results: List[Result]) -> List[Failure]:
+        """Store what can be stored by bisecting; return the rows that fail on their own."""
+        try:
+            self._write_sync(results, skip_existing=True)
+            return []
+        except Exception as e:
+            if len(results) == 1:
+                return [(results[0], f"{type(e).__name__}: {e}")]
+        middle = len(results) // 2
+        return self._isolate(results[:middle]) + self._isolate(results[middle:])
+
+    async def _write(self, results: List[Result], skip_existing: bool = False) -> int:
+        return await run_in_threadpool(self._write_sync, results, skip_existing)
+
+    def _write_sync(self, results: List[Result], skip_existing: bool = False) -> int:
+        db = self.session_factory()
+        try:
+            return ResultRepositoryImpl(db).insert_many(results, skip_existing=skip_existing)
+        finally:
+            db.close()
+
+    def health_check(self) -> CheckResult:
+        saturation = self.queued / self.max_queue if self.max_queue else 0.0
+        healthy = self.running and saturation < 0.9
+        return CheckResult(
+            "result_buffer",
+            healthy,
+            details={
+                "queued": self.queued,
+                "flushed": self.flushed,
+                "failed_flushes": self.failed_flushes,
+                "dead_lettered": self.dead_lettered,
+            },
+            error=None if healthy else "result buffer stopped or nearly full",
+        )
+
+
+result_buffer = ResultWriteBuffer(spool=ResultSpool(Path(RESULTS_SPOOL_DIR)))
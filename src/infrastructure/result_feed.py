@@ -0,0 +1,254 @@
+import asyncio
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from ..domain.entities.results import Result
+from ..domain.events import ResultsRecorded, event_hub
+from .leaderboard import leaderboard_key
+
+logger = logging.getLogger(__name__)
+
+RESULTS_STREAM_INTERVAL_MS = float(os.getenv("RESULTS_STREAM_INTERVAL_MS", "1000"))
+RESULTS_STREAM_QUEUE_SIZE = int(os.getenv("RESULTS_STREAM_QUEUE_SIZE", "16"))
+RESULTS_STREAM_LEADERBOARD_SIZE = int(os.getenv("RESULTS_STREAM_LEADERBOARD_SIZE", "10"))
+RESULTS_STREAM_KEEPALIVE_SECONDS = float(os.getenv("RESULTS_STREAM_KEEPALIVE_SECONDS", "15"))
+
+
+def _sse(event: str, data: dict, event_id: Optional[int] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+def _result_data(result: Result) -> dict:
+    return {
+        "id": result.id,
+        "user_id": result.user_id,
+        "respondent_name": result.respondent_name,
+        "quiz_id": result.quiz_id,
+        "score": result.score,
+        "total_questions": result.total_questions,
+        "taken_at": result.taken_at,
+    }
+
+
+def _ranked(results: List[Result]) -> List[dict]:
+    """Leaderboard entries with competition ranks (equal scores share a rank)."""
+    entries: List[dict] = []
+    for position, r in enumerate(results, 1):
+        rank = entries[-1]["rank"] if entries and entries[-1]["score"] == r.score else position
+        entries.append(
+            {
+                "rank": rank,
+                "result_id": r.id,
+                "user_id": r.user_id,
+                "respondent_name": r.respondent_name,
+                "score": r.score,
+                "taken_at": r.taken_at,
+            }
+        )
+    return entries
+
+
+class Subscription:
+    """One stream's queue of serialized events.
+
+    A subscriber that lets `queue_size` events pile up is dropped: its queue is
+    emptied and ends with None, and the client reconnects for a fresh snapshot.
+    """
+
+    def __init__(self, quiz_id: UUID, queue_size: int = RESULTS_STREAM_QUEUE_SIZE):
+        self.quiz_id = quiz_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+    def offer(self, data: str) -> bool:
+        if self.dropped:
+            return False
+        try:
+            self.queue.put_nowait(data)
+            return True
+        except asyncio.QueueFull:
+            self.dropped = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return False
+
+    async def get(self) -> Optional[str]:
+        return await self.queue.get()
+
+
+class _Channel:
+    """Subscribers of one quiz plus the state needed to describe what changed."""
+
+    def __init__(self, quiz_id: UUID, loop: asyncio.AbstractEventLoop):
+        self.quiz_id = quiz_id
+        self.loop = loop
+        self.subscribers: Set[Subscription] = set()
+        self.seeded = False
+        self.top: List[Result] = []
+        self.ranks: Dict[UUID, int] = {}
+        self.attempts = 0
+        self.sequence = 0
+        self.pending: List[Result] = []
+        self.last_sent = float("-inf")
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.snapshot: Optional[str] = None
+
+
+class ResultFeed:
+    """Pushes new results and leaderboard changes of a quiz to its open streams.
+
+    Results arrive through ResultsRecorded events and are coalesced per quiz:
+    at most one `update` per `interval`, serialized once and queued for every
+    subscriber. The leaderboard is kept in memory from a snapshot loaded by the
+    first subscriber, so further subscribers and updates do not query the
+    database. Channels exist only while a quiz has subscribers.
+    """
+
+    def __init__(
+        self,
+        interval: float = RESULTS_STREAM_INTERVAL_MS / 1000,
+        queue_size: int = RESULTS_STREAM_QUEUE_SIZE,
+        leaderboard_size: int = RESULTS_STREAM_LEADERBOARD_SIZE,
+    ):
+        self.interval = interval
+        self.queue_size = queue_size
+        self.leaderboard_size = leaderboard_size
+        self._channels: Dict[UUID, _Channel] = {}
+
+    def subscribe(self, quiz_id: UUID) -> Subscription:
+        channel = self._channels.get(quiz_id)
+        if channel is None:
+            channel = self._channels[quiz_id] = _Channel(quiz_id, asyncio.get_running_loop())
+        subscription = Subscription(quiz_id, self.queue_size)
+        channel.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        channel = self._channels.get(subscription.quiz_id)
+        if channel is None:
+            return
+        channel.subscribers.discard(subscription)
+        if not channel.subscribers:
+            if channel.handle is not None:
+                channel.handle.cancel()
+            del self._channels[subscription.quiz_id]
+
+    def is_seeded(self, quiz_id: UUID) -> bool:
+        channel = self._channels.get(quiz_id)
+        return channel is not None and channel.seeded
+
+    def seed(self, quiz_id: UUID, top: List[Result], attempts: int) -> None:
+        """Set the leaderboard and attempt count loaded from the database, once per channel."""
+        channel = self._channels.get(quiz_id)
+        if channel is None or channel.seeded:
+            return
+        channel.seeded = True
+        channel.attempts = attempts
+        channel.top = self._merge([], top)
+        channel.ranks = {e["result_id"]: e["rank"] for e in _ranked(channel.top)}
+        if channel.pending:
+            self._schedule(channel)
+
+    def snapshot(self, quiz_id: UUID) -> Optional[str]:
+        """The `snapshot` event a new subscriber starts with."""
+        channel = self._channels.get(quiz_id)
+        if channel is None or not channel.seeded:
+            return None
+        if channel.snapshot is None:
+            channel.snapshot = _sse(
+                "snapshot",
+                {
+                    "quiz_id": quiz_id,
+                    "total_attempts": channel.attempts,
+                    "leaderboard": _ranked(channel.top),
+                },
+                channel.sequence,
+            )
+        return channel.snapshot
+
+    def _merge(self, top: List[Result], results: Iterable[Result]) -> List[Result]:
+        merged = {r.id: r for r in top}
+        for result in results:
+            merged[result.id] = result
+        return sorted(merged.values(), key=leaderboard_key)[: self.leaderboard_size]
+
+    def on_results_recorded(self, event: ResultsRecorded) -> None:
+        """Hand the results to the channels' event loops; may be called from any thread."""
+        if not self._channels:
+            return
+        by_quiz: Dict[UUID, List[Result]] = {}
+        for result in event.results:
+            by_quiz.setdefault(result.quiz_id, []).append(result)
+        for quiz_id, results in by_quiz.items():
+            channel = self._channels.get(quiz_id)
+            if channel is None:
+                continue
+            try:
+                channel.loop.call_soon_threadsafe(self._add, channel, results)
+            except RuntimeError:
+                # The loop that owned the channel is gone
+                self._channels.pop(quiz_id, None)
+
+    def _add(self, channel: _Channel, results: List[Result]) -> None:
+        if self._channels.get(channel.quiz_id) is not channel:
+            return
+        channel.pending.extend(results)
+        if channel.seeded:
+            self._schedule(channel)
+
+    def _schedule(self, channel: _Channel) -> None:
+        if channel.handle is not None:
+            return
+        delay = max(channel.last_sent + self.interval - channel.loop.time(), 0.0)
+        channel.handle = channel.loop.call_later(delay, self._flush, channel)
+
+    def _flush(self, channel: _Channel) -> None:
+        channel.handle = None
+        results, channel.pending = channel.pending, []
+        if not results:
+            return
+        channel.last_sent = channel.loop.time()
+        channel.sequence += 1
+        channel.attempts += len(results)
+        channel.top = self._merge(channel.top, results)
+        entries = _ranked(channel.top)
+        ranks = {e["result_id"]: e["rank"] for e in entries}
+        data = _sse(
+            "update",
+            {
+                "quiz_id": channel.quiz_id,
+                "total_attempts": channel.attempts,
+                "results": [_result_data(r) for r in results],
+                "leaderboard": [
+                    e for e in entries if channel.ranks.get(e["result_id"]) != e["rank"]
+                ],
+                "removed": [result_id for result_id in channel.ranks if result_id not in ranks],
+            },
+            channel.sequence,
+        )
+        channel.ranks = ranks
+        channel.snapshot = None
+
+        for subscription in list(channel.subscribers):
+            if not subscription.offer(data):
+                channel.subscribers.discard(subscription)
+        if not channel.subscribers:
+            del self._channels[channel.quiz_id]
+        logger.debug(
+            "Quiz %s: %d results to %d streams",
+            channel.quiz_id,
+            len(results),
+            len(channel.subscribers),
+        )
+
+
+result_feed = ResultFeed()
+event_hub.subscribe(ResultsRecorded, result_feed.on_results_recorded)
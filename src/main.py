@@ -1,4 +1,7 @@
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,18 +14,62 @@ from .api.routes import (
     quizzes_router,
     questions_router,
     results_router,
+    attempts_router,
+    live_router,
+    debug_router,
+    health_router,
 )
+from .api.middleware import (
+    IdempotencyMiddleware,
+    ProfilingMiddleware,
+    QueryStatsMiddleware,
+    TracingMiddleware,
+)
+from .infrastructure.analytics.rollups import rollup_compactor
+from .infrastructure.attempts import attempt_store
+from .infrastructure.cache import cache_store
 from .infrastructure.database import Base, engine
+from .infrastructure.database.upsert import check_upsert_dialect
+from .infrastructure.health import health_checker
+from .infrastructure.observability import configure_tracing_from_env, install_query_hooks
+from .infrastructure.observability.loop_monitor import loop_monitor
+from .infrastructure.result_buffer import RESULTS_INGESTION_MODE, result_buffer
+
+check_upsert_dialect(engine)
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start and stop background services."""
+    if os.getenv("LOOP_MONITOR_ENABLED", "True").lower() in ("1", "true", "yes"):
+        loop_monitor.start()
+    if RESULTS_INGESTION_MODE == "buffered":
+        await result_buffer.start()
+        health_checker.register("result_buffer", result_buffer.health_check)
+    rollup_compactor.start()
+    yield
+    await rollup_compactor.stop()
+    await result_buffer.stop()
+    await loop_monitor.stop()
+    await cache_store.close()
+    await attempt_store.store.close()
+
+
 app = FastAPI(
     title="FastAPI Quiz App",
     description="A quiz application with Clean Architecture, OAuth2, and CRUD operations",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
+# Replay responses of write requests retried with the same Idempotency-Key
+if os.getenv("IDEMPOTENCY_ENABLED", "True").lower() in ("1", "true", "yes"):
+    app.add_middleware(IdempotencyMiddleware)
+health_checker.register("cache", cache_store.health_check)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -32,6 +79,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL statement counting
+if os.getenv("QUERY_STATS_ENABLED", "True").lower() in ("1", "true", "yes"):
+    install_query_hooks()
+    app.add_middleware(QueryStatsMiddleware)
+
+# Request/use case/repository/SQL spans, exported according to TRACING_EXPORTER
+configure_tracing_from_env()
+app.add_middleware(TracingMiddleware)
+
+# On-demand sampling profiles (X-Profile header or PROFILING_SAMPLE_RATE)
+app.add_middleware(ProfilingMiddleware)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(users_router)
@@ -39,6 +98,10 @@ app.include_router(journeys_router)
 app.include_router(quizzes_router)
 app.include_router(questions_router)
 app.include_router(results_router)
+app.include_router(attempts_router)
+app.include_router(live_router)
+app.include_router(debug_router)
+app.include_router(health_router)
 
 # Serve uploaded files
 uploads_dir = Path("uploads")
@@ -58,5 +121,5 @@ async def root() -> dict:
 
 @app.get("/health")
 async def health_check() -> dict:
-    """Health check endpoint."""
+    """Basic health check endpoint; see /health/live and /health/ready for probes."""
     return {"status": "healthy"}
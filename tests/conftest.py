@@ -1,8 +1,9 @@
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from typing import Generator
+from typing import Callable, Generator
 
 from src.main import app
 from src.infrastructure.database import Base, get_db
@@ -41,3 +42,17 @@ def client(db_session: Generator) -> TestClient:
     app.dependency_overrides[get_db] = override_get_db
     yield TestClient(app)
     app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def query_budget() -> Callable[[Response, int], None]:
+    """Assert that a request executed at most `max_queries` SQL statements."""
+
+    def check(response: Response, max_queries: int) -> None:
+        count = int(response.headers["X-DB-Query-Count"])
+        assert count <= max_queries, (
+            f"{response.request.method} {response.request.url.path} executed {count} "
+            f"queries, budget is {max_queries}"
+        )
+
+    return check
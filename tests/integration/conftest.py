@@ -1,11 +1,11 @@
 import pytest
+from typing import Callable
 
 from fastapi.testclient import TestClient
 
-@pytest.fixture(scope="function")
-def token(client: TestClient, username: str = "testuser") -> str:
-    """Helper function to get authentication token."""
-    # Register user
+
+def _login(client: TestClient, username: str) -> str:
+    """Register a user and return its access token."""
     client.post(
         "/api/auth/register",
         json={
@@ -14,10 +14,51 @@ def token(client: TestClient, username: str = "testuser") -> str:
             "password": "testpassword123",
         },
     )
-
-    # Login
     response = client.post(
         "/api/auth/login",
         json={"email": f"{username}@example.com", "password": "testpassword123"},
     )
-    return response.json()["access_token"]
\ No newline at end of file
+    return response.json()["access_token"]
+
+
+@pytest.fixture(scope="function")
+def token(client: TestClient) -> str:
+    """Helper function to get authentication token."""
+    return _login(client, "testuser")
+
+
+@pytest.fixture(scope="function")
+def other_token(client: TestClient) -> str:
+    """Token of a second user who does not own the test quizzes."""
+    return _login(client, "other")
+
+
+@pytest.fixture(scope="function")
+def quiz_factory(client: TestClient, token: str) -> Callable[..., dict]:
+    """Create a quiz owned by the `token` user and return it as `GET /api/quizzes/{id}` does.
+
+    `questions` adds that many two-option questions ("What is n + n?", option 1
+    correct); other keyword arguments are passed through as quiz fields.
+    """
+
+    def create(title: str = "Test quiz", questions: int = 0, **fields: object) -> dict:
+        payload = {"title": title, "description": f"{title} for tests", **fields}
+        if questions:
+            payload["questions"] = [
+                {
+                    "text": f"What is {n} + {n}?",
+                    "options": [
+                        {"reference_id": 1, "text": str(2 * n)},
+                        {"reference_id": 2, "text": str(2 * n + 1)},
+                    ],
+                    "correct_answer": 1,
+                }
+                for n in range(1, questions + 1)
+            ]
+        response = client.post(
+            "/api/quizzes/", json=payload, headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 201, response.text
+        return client.get(f"/api/quizzes/{response.json()['id']}").json()
+
+    return create
@@ -0,0 +1,190 @@
+import asyncio
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from tests.conftest import TestingSessionLocal
+from src.domain.entities.attempt import Attempt
+from src.infrastructure.attempts import attempt_store
+from src.infrastructure.cache import MemoryTTLStore
+from src.infrastructure.database.models import AnswerResultModel
+
+
+def _options(question: dict) -> dict:
+    return {opt["text"]: opt["id"] for opt in question["options"]}
+
+
+def test_attempt_checks_answers_and_stores_once(
+    client: TestClient, quiz_factory, query_budget
+) -> None:
+    """Test starting, answering and finishing an attempt in immediate feedback mode."""
+    quiz = quiz_factory(questions=4, feedback_mode="imediato")
+    questions = quiz["questions"]
+    response = client.post(
+        "/api/attempts/", json={"quiz_id": quiz["id"], "respondent_name": "Student"}
+    )
+    assert response.status_code == 201
+    attempt = response.json()
+    assert attempt["total_questions"] == 4
+
+    right = _options(questions[0])["2"]
+    check = client.post(
+        f"/api/attempts/{attempt['id']}/answers",
+        json={"question_id": questions[0]["id"], "option_id": right},
+    )
+    assert check.status_code == 200
+    query_budget(check, 0)
+    assert check.json()["is_correct"] is True
+    assert check.json()["correct_option_id"] == right
+
+    wrong = _options(questions[1])["5"]
+    check = client.post(
+        f"/api/attempts/{attempt['id']}/answers",
+        json={"question_id": questions[1]["id"], "option_id": wrong},
+    )
+    assert check.json()["is_correct"] is False
+    assert check.json()["correct_option_id"] == _options(questions[1])["4"]
+
+    again = client.post(
+        f"/api/attempts/{attempt['id']}/answers",
+        json={"question_id": questions[1]["id"], "option_id": _options(questions[1])["4"]},
+    )
+    assert again.json()["already_answered"] is True
+    assert again.json()["is_correct"] is False
+
+    finished = client.post(f"/api/attempts/{attempt['id']}/finish")
+    assert finished.status_code == 200
+    assert finished.json()["id"] == attempt["id"]
+    assert finished.json()["score"] == 25
+    assert finished.json()["total_questions"] == 4
+    assert finished.json()["percentile_rank"] == 0.0
+
+    retried = client.post(f"/api/attempts/{attempt['id']}/finish")
+    assert retried.json() == finished.json()
+    assert client.get(f"/api/results/quiz/{quiz['id']}").json()["total"] == 1
+    with TestingSessionLocal() as db:
+        assert db.query(AnswerResultModel).filter_by(result_id=UUID(attempt["id"])).count() == 2
+
+
+def test_final_mode_hides_correctness(client: TestClient, quiz_factory) -> None:
+    """Test that answers are recorded but not revealed in final feedback mode."""
+    quiz = quiz_factory(questions=4, feedback_mode="final")
+    question = quiz["questions"][0]
+    attempt = client.post(
+        "/api/attempts/", json={"quiz_id": quiz["id"], "respondent_name": "Student"}
+    ).json()
+
+    check = client.post(
+        f"/api/attempts/{attempt['id']}/answers",
+        json={"question_id": question["id"], "option_id": _options(question)["2"]},
+    ).json()
+    assert check["is_correct"] is None
+    assert check["correct_option_id"] is None
+
+
+def test_attempt_rejects_foreign_answers(client: TestClient, quiz_factory) -> None:
+    """Test that options of other questions and unknown attempts are rejected."""
+    quiz = quiz_factory(questions=4, feedback_mode="imediato")
+    first, second = quiz["questions"][:2]
+    attempt = client.post(
+        "/api/attempts/", json={"quiz_id": quiz["id"], "respondent_name": "Student"}
+    ).json()
+
+    response = client.post(
+        f"/api/attempts/{attempt['id']}/answers",
+        json={"question_id": first["id"], "option_id": second["options"][0]["id"]},
+    )
+    assert response.status_code == 400
+
+    response = client.post(
+        f"/api/attempts/{quiz['id']}/answers",
+        json={"question_id": first["id"], "option_id": first["options"][0]["id"]},
+    )
+    assert response.status_code == 404
+
+
+def _order(attempt: dict) -> list:
+    return [(q["id"], [opt["id"] for opt in q["options"]]) for q in attempt["questions"]]
+
+
+def test_shuffled_attempts_keep_their_order(client: TestClient, quiz_factory, query_budget) -> None:
+    """Test that each attempt gets its own stable order and is graded by ids."""
+    quiz = quiz_factory(
+        questions=4, feedback_mode="imediato", shuffle_questions=True, shuffle_options=True
+    )
+    assert quiz["shuffle_questions"] is True
+    attempts = [
+        client.post(
+            "/api/attempts/", json={"quiz_id": quiz["id"], "respondent_name": f"Student {n}"}
+        ).json()
+        for n in range(5)
+    ]
+    orders = [_order(attempt) for attempt in attempts]
+    assert len({repr(order) for order in orders}) > 1
+    for order in orders:
+        assert sorted(question_id for question_id, _ in order) == sorted(
+            q["id"] for q in quiz["questions"]
+        )
+
+    attempt = attempts[0]
+    resumed = client.get(f"/api/attempts/{attempt['id']}")
+    assert resumed.status_code == 200
+    query_budget(resumed, 0)
+    assert _order(resumed.json()) == orders[0]
+    assert "is_correct" not in resumed.json()["questions"][0]["options"][0]
+
+    for question in attempt["questions"]:
+        right = next(opt["id"] for opt in question["options"] if int(opt["text"]) % 2 == 0)
+        client.post(
+            f"/api/attempts/{attempt['id']}/answers",
+            json={"question_id": question["id"], "option_id": right},
+        )
+    assert client.post(f"/api/attempts/{attempt['id']}/finish").json()["score"] == 100
+
+
+def test_unshuffled_attempts_share_the_quiz_order(client: TestClient, quiz_factory) -> None:
+    """Test that attempts of a quiz without shuffling see the questions as created."""
+    quiz = quiz_factory(questions=4, feedback_mode="imediato")
+    attempt = client.post(
+        "/api/attempts/", json={"quiz_id": quiz["id"], "respondent_name": "Student"}
+    ).json()
+
+    assert [q["text"] for q in attempt["questions"]] == [
+        f"What is {n} + {n}?" for n in range(1, 5)
+    ]
+    assert [opt["text"] for opt in attempt["questions"][0]["options"]] == ["2", "3"]
+
+
+def test_concurrent_finish_returns_the_stored_result(
+    client: TestClient, quiz_factory, monkeypatch
+) -> None:
+    """Test that a finish which read the attempt before another one stored it does not fail."""
+    quiz = quiz_factory(questions=2)
+    attempt = client.post(
+        "/api/attempts/", json={"quiz_id": quiz["id"], "respondent_name": "Student"}
+    ).json()
+    stale = asyncio.run(attempt_store.get(UUID(attempt["id"])))
+    finished = client.post(f"/api/attempts/{attempt['id']}/finish").json()
+
+    async def read_before_discard(attempt_id: UUID) -> Attempt:
+        return stale
+
+    monkeypatch.setattr(attempt_store, "get", read_before_discard)
+    response = client.post(f"/api/attempts/{attempt['id']}/finish")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == finished["id"]
+    assert response.json()["score"] == finished["score"]
+
+
+def test_full_attempt_store_answers_503(client: TestClient, quiz_factory, monkeypatch) -> None:
+    """Test that a full attempt store refuses new attempts instead of evicting others."""
+    quiz = quiz_factory(questions=1)
+    monkeypatch.setattr(attempt_store, "store", MemoryTTLStore(max_entries=0, evict=False))
+
+    response = client.post(
+        "/api/attempts/", json={"quiz_id": quiz["id"], "respondent_name": "Student"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "5"
@@ -0,0 +1,63 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure.observability import profiling
+from src.infrastructure.observability.profiling import ProfileStore
+
+
+@pytest.fixture
+def profile_store(monkeypatch, tmp_path) -> ProfileStore:
+    store = ProfileStore(str(tmp_path))
+    monkeypatch.setattr(profiling, "PROFILING_TOKEN", "s3cret")
+    monkeypatch.setattr(profiling, "profile_store", store)
+    return store
+
+
+def test_request_is_not_profiled_by_default(client: TestClient, profile_store) -> None:
+    """Test that requests without the profiling header run unprofiled."""
+    response = client.get("/api/quizzes/latest", headers={"X-Profile": "wrong"})
+    assert response.status_code == 200
+    assert "X-Profile-Id" not in response.headers
+    assert list(profile_store.directory.iterdir()) == []
+
+
+def test_profile_request_with_header(client: TestClient, profile_store) -> None:
+    """Test that a privileged header stores a speedscope profile keyed by request id."""
+    response = client.get(
+        "/api/quizzes/latest", headers={"X-Profile": "s3cret", "X-Request-Id": "req-123"}
+    )
+    assert response.status_code == 200
+    assert response.headers["X-Profile-Id"] == "req-123"
+
+    profile = client.get("/api/debug/profiles/req-123", headers={"X-Profile": "s3cret"})
+    assert profile.status_code == 200
+    data = profile.json()
+    assert data["profiles"][0]["type"] == "sampled"
+    assert data["profiles"][0]["name"] == "GET /api/quizzes/latest"
+
+
+def test_profile_request_with_query_flag(client: TestClient, profile_store) -> None:
+    """Test that the query flag works as an alternative to the header."""
+    response = client.get("/api/quizzes/latest?profile=s3cret")
+    assert response.status_code == 200
+    assert profile_store.load(response.headers["X-Profile-Id"]) is not None
+
+
+def test_download_profile_requires_token(client: TestClient, profile_store) -> None:
+    """Test that stored profiles are only served to holders of the token."""
+    response = client.get("/api/debug/profiles/req-123")
+    assert response.status_code == 403
+
+    response = client.get("/api/debug/profiles/missing", headers={"X-Profile": "s3cret"})
+    assert response.status_code == 404
+
+
+def test_event_loop_stats(client: TestClient, profile_store) -> None:
+    """Test that loop lag percentiles are public and blocking stacks need the token."""
+    response = client.get("/api/debug/event-loop")
+    assert response.status_code == 200
+    assert set(response.json()["lag_ms"]) == {"p50", "p95", "p99", "max"}
+    assert "recent_blocking" not in response.json()
+
+    response = client.get("/api/debug/event-loop", headers={"X-Profile": "s3cret"})
+    assert response.json()["recent_blocking"] == []
@@ -0,0 +1,68 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.infrastructure import health
+from src.infrastructure.health import CheckResult, HealthChecker
+
+
+@pytest.fixture
+def checker(monkeypatch) -> HealthChecker:
+    fresh = HealthChecker(ttl=60)
+    monkeypatch.setattr("src.api.routes.health.health_checker", fresh)
+    return fresh
+
+
+def test_liveness(client: TestClient) -> None:
+    """Test that the liveness probe always answers."""
+    response = client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "alive"}
+
+
+def test_readiness_reports_default_checks(client: TestClient) -> None:
+    """Test that readiness covers the database, pool, uploads and event loop."""
+    health.health_checker.invalidate()
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert set(data["checks"]) == {"database", "pool", "uploads", "event_loop", "cache"}
+    assert data["checks"]["database"]["status"] == "ok"
+
+
+def test_readiness_fails_when_a_check_fails(client: TestClient, checker) -> None:
+    """Test that a failing dependency makes the node unavailable."""
+    checker.register("database", lambda: CheckResult("database", False, error="down"))
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"] == {
+        "status": "fail",
+        "latency_ms": 0.0,
+        "error": "down",
+    }
+
+
+def test_readiness_results_are_cached(client: TestClient, checker) -> None:
+    """Test that frequent probes reuse the cached result."""
+    calls = []
+
+    def counting_check() -> CheckResult:
+        calls.append(1)
+        return CheckResult("counting", True)
+
+    checker.register("counting", counting_check)
+    for _ in range(3):
+        assert client.get("/health/ready").status_code == 200
+    assert len(calls) == 1
+
+
+def test_readiness_reports_raising_check(client: TestClient, checker) -> None:
+    """Test that an exception inside a probe is reported as a failure."""
+
+    def broken() -> CheckResult:
+        raise RuntimeError("cache unreachable")
+
+    checker.register("cache", broken)
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["cache"]["error"] == "cache unreachable"
@@ -0,0 +1,95 @@
+import asyncio
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api.middleware import IdempotencyMiddleware
+from src.infrastructure.cache import MemoryTTLStore
+
+
+def test_retried_result_is_stored_once(client: TestClient, quiz_factory) -> None:
+    """Test that a retry with the same key replays the first response."""
+    quiz_id = quiz_factory()["id"]
+    payload = {"respondent_name": "Student", "quiz_id": quiz_id, "score": 80, "total_questions": 10}
+    headers = {"Idempotency-Key": str(uuid4())}
+
+    first = client.post("/api/results/", json=payload, headers=headers)
+    retry = client.post("/api/results/", json=payload, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    assert client.get(f"/api/results/quiz/{quiz_id}").json()["total"] == 1
+
+    changed = client.post("/api/results/", json={**payload, "score": 90}, headers=headers)
+    assert changed.status_code == 422
+
+
+def test_key_is_scoped_to_the_caller(client: TestClient, token: str) -> None:
+    """Test that the same key from another caller runs the handler again."""
+    headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": str(uuid4())}
+    payload = {"title": "Quiz", "description": "Description"}
+
+    first = client.post("/api/quizzes/", json=payload, headers=headers)
+    retry = client.post("/api/quizzes/", json=payload, headers=headers)
+    anonymous = client.post(
+        "/api/quizzes/", json=payload, headers={"Idempotency-Key": headers["Idempotency-Key"]}
+    )
+
+    assert retry.json()["id"] == first.json()["id"]
+    assert anonymous.status_code == 401
+
+
+def test_failed_requests_are_not_stored(client: TestClient) -> None:
+    """Test that only successful responses are replayed."""
+    headers = {"Idempotency-Key": str(uuid4())}
+    payload = {"respondent_name": "Student", "quiz_id": str(uuid4()), "score": 80, "total_questions": 10}
+
+    assert client.post("/api/results/", json=payload, headers=headers).status_code == 404
+    retry = client.post("/api/results/", json=payload, headers=headers)
+    assert retry.status_code == 404
+    assert "idempotent-replayed" not in retry.headers
+
+
+async def test_concurrent_duplicates_run_the_handler_once() -> None:
+    """Test that duplicates arriving while the first is in flight get its response."""
+    calls = []
+    app = FastAPI()
+
+    @app.post("/slow")
+    async def slow() -> dict:
+        calls.append(1)
+        await asyncio.sleep(0.2)
+        return {"call": len(calls)}
+
+    app.add_middleware(IdempotencyMiddleware, store=MemoryTTLStore(), wait=5)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = await asyncio.gather(
+            *(client.post("/slow", headers={"Idempotency-Key": "same"}) for _ in range(3))
+        )
+
+    assert calls == [1]
+    assert [r.json() for r in responses] == [{"call": 1}] * 3
+    assert sorted(r.headers.get("idempotent-replayed", "") for r in responses) == ["", "true", "true"]
+
+
+def test_streamed_import_rejects_the_key(client: TestClient, token: str) -> None:
+    """Test that the streamed quiz import refuses a key instead of buffering its body."""
+    response = client.post(
+        "/api/quizzes/import",
+        content=b'{"title": "Quiz", "description": "Description"}\n',
+        headers={
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/x-ndjson",
+            "Idempotency-Key": str(uuid4()),
+        },
+    )
+
+    assert response.status_code == 400
+    assert client.get(
+        "/api/quizzes/me/created", headers={"Authorization": f"Bearer {token}"}
+    ).json()["total_items"] == 0
@@ -0,0 +1,71 @@
+from fastapi.testclient import TestClient
+
+from src.infrastructure.journey_progress import journey_progress_cache
+
+
+def test_journey_progress(client: TestClient, token: str, query_budget) -> None:
+    """Test that progress covers every quiz of the journey and follows new results."""
+    journey_progress_cache.clear()
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = client.get("/api/users/me", headers=headers).json()["id"]
+    journey_id = client.post(
+        "/api/journeys/",
+        json={"title": "Journey", "description": "Journey with progress"},
+        headers=headers,
+    ).json()["id"]
+    quiz_ids = [
+        client.post(
+            "/api/quizzes/",
+            json={"title": f"Quiz {n}", "description": "Progress quiz", "journey_id": journey_id},
+            headers=headers,
+        ).json()["id"]
+        for n in range(3)
+    ]
+
+    def submit(quiz_id: str, score: int, user_id=user_id) -> None:
+        client.post(
+            "/api/results/",
+            json={
+                "user_id": user_id,
+                "respondent_name": "Student",
+                "quiz_id": quiz_id,
+                "score": score,
+                "total_questions": 10,
+            },
+        )
+
+    submit(quiz_ids[0], 40)
+    submit(quiz_ids[0], 90)
+    submit(quiz_ids[1], 100, user_id=None)
+
+    response = client.get(f"/api/journeys/{journey_id}/progress", headers=headers)
+    assert response.status_code == 200
+    query_budget(response, 3)
+    data = response.json()
+    assert (data["total_quizzes"], data["completed_quizzes"]) == (3, 1)
+    progress = [
+        (q["quiz_id"], q["best_score"], q["attempts"], q["completed"]) for q in data["quizzes"]
+    ]
+    assert progress == [
+        (quiz_ids[0], 90, 2, True),
+        (quiz_ids[1], None, 0, False),
+        (quiz_ids[2], None, 0, False),
+    ]
+
+    cached = client.get(f"/api/journeys/{journey_id}/progress", headers=headers)
+    assert cached.json() == data
+    query_budget(cached, 2)
+
+    submit(quiz_ids[2], 70)
+    data = client.get(f"/api/journeys/{journey_id}/progress", headers=headers).json()
+    assert data["completed_quizzes"] == 2
+    assert data["quizzes"][2]["best_score"] == 70
+
+
+def test_journey_progress_unknown_journey(client: TestClient, token: str) -> None:
+    """Test that progress of an unknown journey is a 404."""
+    response = client.get(
+        "/api/journeys/00000000-0000-0000-0000-000000000000/progress",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 404
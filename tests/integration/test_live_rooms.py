@@ -0,0 +1,180 @@
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from src.application.use_cases import ResultUseCases
+
+
+def _receive_until(ws, message_type: str) -> dict:
+    while True:
+        message = ws.receive_json()
+        if message["type"] == message_type:
+            return message
+
+
+def test_live_room_round_trip(client: TestClient, quiz_factory, token: str) -> None:
+    """Test that the host drives questions, counts are broadcast and scores are stored."""
+    quiz = quiz_factory(questions=2)
+    with client:
+        room = client.post(
+            "/api/live/rooms",
+            json={"quiz_id": quiz["id"]},
+            headers={"Authorization": f"Bearer {token}"},
+        ).json()
+        assert room["total_questions"] == 2
+
+        with client.websocket_connect(f"{room['host_url']}?token={token}") as host, \
+                client.websocket_connect(f"{room['play_url']}?name=Ana") as ana, \
+                client.websocket_connect(f"{room['play_url']}?name=Bruno") as bruno:
+            assert ana.receive_json()["type"] == "welcome"
+            assert bruno.receive_json()["type"] == "welcome"
+
+            for index in range(2):
+                host.send_json({"action": "next"})
+                question = _receive_until(ana, "question")
+                _receive_until(bruno, "question")
+                assert question["index"] == index
+                right, wrong = (opt["id"] for opt in question["options"])
+
+                ana.send_json({"question_id": question["question_id"], "option_id": right})
+                assert _receive_until(ana, "answered")["accepted"] is True
+                bruno.send_json(
+                    {"question_id": question["question_id"], "option_id": wrong if index else right}
+                )
+                assert _receive_until(bruno, "answered")["accepted"] is True
+
+                counts = _receive_until(host, "counts")
+                while counts["answered"] < 2:
+                    counts = _receive_until(host, "counts")
+                host.send_json({"action": "reveal"})
+                reveal = _receive_until(ana, "reveal")
+                assert reveal["correct_option_id"] == right
+                assert sum(reveal["counts"].values()) == 2
+
+            host.send_json({"action": "next"})
+            assert _receive_until(host, "error")["detail"] == "No more questions"
+
+            host.send_json({"action": "finish"})
+            finished = _receive_until(bruno, "finished")
+            leaderboard = [(e["name"], e["score"]) for e in finished["leaderboard"]]
+            assert leaderboard == [("Ana", 100), ("Bruno", 50)]
+
+    listing = client.get(f"/api/results/quiz/{quiz['id']}").json()
+    assert listing["total"] == 2
+
+
+def test_live_room_requires_host(client: TestClient, quiz_factory, other_token) -> None:
+    """Test that only the quiz author can create and drive a room."""
+    quiz = quiz_factory(questions=2)
+
+    response = client.post(
+        "/api/live/rooms",
+        json={"quiz_id": quiz["id"]},
+        headers={"Authorization": f"Bearer {other_token}"},
+    )
+    assert response.status_code == 403
+
+
+def _create_room(client: TestClient, quiz: dict, token: str) -> dict:
+    return client.post(
+        "/api/live/rooms",
+        json={"quiz_id": quiz["id"]},
+        headers={"Authorization": f"Bearer {token}"},
+    ).json()
+
+
+def test_live_room_finish_can_be_retried(
+    client: TestClient, quiz_factory, token: str, monkeypatch
+) -> None:
+    """Test that a failed insert keeps the room open and a second finish stores the scores."""
+    quiz = quiz_factory(questions=1)
+    create_results = ResultUseCases.create_results
+    calls = []
+
+    async def flaky(self, results, skip_existing=False):
+        calls.append(len(results))
+        if len(calls) == 1:
+            raise RuntimeError("database is down")
+        return await create_results(self, results, skip_existing=skip_existing)
+
+    monkeypatch.setattr(ResultUseCases, "create_results", flaky)
+    with client:
+        room = _create_room(client, quiz, token)
+        with client.websocket_connect(f"{room['host_url']}?token={token}") as host, \
+                client.websocket_connect(f"{room['play_url']}?name=Ana") as ana:
+            assert ana.receive_json()["type"] == "welcome"
+            host.send_json({"action": "next"})
+            question = _receive_until(ana, "question")
+            ana.send_json(
+                {"question_id": question["question_id"], "option_id": question["options"][0]["id"]}
+            )
+            assert _receive_until(ana, "answered")["accepted"] is True
+
+            host.send_json({"action": "finish"})
+            assert "retry" in _receive_until(host, "error")["detail"]
+            host.send_json({"action": "finish"})
+            finished = _receive_until(ana, "finished")
+            assert [(e["name"], e["score"]) for e in finished["leaderboard"]] == [("Ana", 100)]
+
+    assert calls == [1, 1]
+    assert client.get(f"/api/results/quiz/{quiz['id']}").json()["total"] == 1
+
+
+def test_host_leaving_stores_scores(client: TestClient, quiz_factory, token: str) -> None:
+    """Test that the last host leaving without finish stores the results and closes the room."""
+    quiz = quiz_factory(questions=2)
+    with client:
+        room = _create_room(client, quiz, token)
+        with client.websocket_connect(f"{room['play_url']}?name=Ana") as ana:
+            assert ana.receive_json()["type"] == "welcome"
+            with client.websocket_connect(f"{room['host_url']}?token={token}") as host:
+                host.send_json({"action": "next"})
+                question = _receive_until(ana, "question")
+                ana.send_json(
+                    {
+                        "question_id": question["question_id"],
+                        "option_id": question["options"][0]["id"],
+                    }
+                )
+                assert _receive_until(ana, "answered")["accepted"] is True
+            finished = _receive_until(ana, "finished")
+            assert [(e["name"], e["score"]) for e in finished["leaderboard"]] == [("Ana", 50)]
+
+        with client.websocket_connect(f"{room['play_url']}?name=Late") as late:
+            with pytest.raises(WebSocketDisconnect) as closed:
+                late.receive_json()
+            assert closed.value.code == 4404
+
+    assert client.get(f"/api/results/quiz/{quiz['id']}").json()["total"] == 1
+
+
+def test_participant_user_comes_from_the_token(
+    client: TestClient, quiz_factory, token: str, other_token: str
+) -> None:
+    """Test that results are only linked to authenticated users, never to a query user_id."""
+    quiz = quiz_factory(questions=1)
+    other = client.get("/api/auth/me", headers={"Authorization": f"Bearer {other_token}"}).json()
+    with client:
+        room = _create_room(client, quiz, token)
+        with client.websocket_connect(f"{room['play_url']}?name=Bad&token=nonsense") as bad:
+            with pytest.raises(WebSocketDisconnect) as closed:
+                bad.receive_json()
+            assert closed.value.code == 4403
+
+        with client.websocket_connect(f"{room['host_url']}?token={token}") as host, \
+                client.websocket_connect(
+                    f"{room['play_url']}?name=Guest&user_id={uuid4()}"
+                ) as guest, \
+                client.websocket_connect(
+                    f"{room['play_url']}?name=Member&token={other_token}"
+                ) as member:
+            assert guest.receive_json()["type"] == "welcome"
+            assert member.receive_json()["type"] == "welcome"
+            host.send_json({"action": "finish"})
+            _receive_until(guest, "finished")
+
+    items = client.get(f"/api/results/quiz/{quiz['id']}").json()["items"]
+    users = {r["respondent_name"]: r["user_id"] for r in items}
+    assert users == {"Guest": None, "Member": other["id"]}
@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+
+from .test_question_endpoints import create_quiz, make_options
+
+
+def create_question(client: TestClient, token: str, quiz_id: str) -> str:
+    """Helper function to create a question, return question ID."""
+    response = client.post(
+        "/api/questions/",
+        json={
+            "text": "What is 2 + 2?",
+            "quiz_id": quiz_id,
+            "options": make_options(["3", "4", "5"]),
+            "correct_answer": 2,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return response.json()["id"]
+
+
+def test_query_stats_headers(client: TestClient) -> None:
+    """Test that every response reports its SQL statement count and DB time."""
+    response = client.get("/api/quizzes/latest")
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Query-Count"]) >= 1
+    assert float(response.headers["X-DB-Query-Time-Ms"]) >= 0
+
+
+def test_latest_quizzes_budget(client: TestClient, token, query_budget) -> None:
+    """Test that listing latest quizzes does not grow with the number of quizzes."""
+    for _ in range(3):
+        create_quiz(client, token)
+
+    response = client.get("/api/quizzes/latest")
+    assert response.status_code == 200
+    query_budget(response, 2)
+
+
+def test_get_quiz_budget(client: TestClient, token, query_budget) -> None:
+    """Test that loading a quiz with questions and options is not N+1."""
+    quiz_id = create_quiz(client, token)
+    for _ in range(5):
+        create_question(client, token, quiz_id)
+
+    response = client.get(f"/api/quizzes/{quiz_id}")
+    assert response.status_code == 200
+    assert len(response.json()["questions"]) == 5
+    query_budget(response, 2)
+
+
+def test_question_endpoints_budget(client: TestClient, token, query_budget) -> None:
+    """Test query budgets of the question read endpoints."""
+    headers = {"Authorization": f"Bearer {token}"}
+    quiz_id = create_quiz(client, token)
+    question_ids = [create_question(client, token, quiz_id) for _ in range(3)]
+
+    response = client.get(f"/api/questions/quiz?quiz_id={quiz_id}", headers=headers)
+    assert response.status_code == 200
+    query_budget(response, 3)
+
+    response = client.get(f"/api/questions/{question_ids[0]}", headers=headers)
+    assert response.status_code == 200
+    query_budget(response, 4)
+
+
+def test_my_results_budget(client: TestClient, token, query_budget) -> None:
+    """Test query budget of the current user's results listing."""
+    response = client.get("/api/results/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    query_budget(response, 3)
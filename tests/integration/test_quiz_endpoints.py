@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -95,3 +97,150 @@ def test_delete_quiz(client: TestClient, token) -> None:
         headers={"Authorization": f"Bearer {token}"},
     )
     assert get_response.status_code == 404
+
+
+def test_get_quiz_includes_questions(client: TestClient, token) -> None:
+    """Test getting a quiz returns its questions and options without answers."""
+    create_response = client.post(
+        "/api/quizzes/",
+        json={
+            "title": "Quiz With Questions",
+            "description": "Description",
+            "questions": [
+                {
+                    "text": "What is 2 + 2?",
+                    "options": [
+                        {"reference_id": 1, "text": "3"},
+                        {"reference_id": 2, "text": "4"},
+                    ],
+                    "correct_answer": 2,
+                }
+            ],
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    quiz_id = create_response.json()["id"]
+
+    response = client.get(f"/api/quizzes/{quiz_id}")
+    assert response.status_code == 200
+    questions = response.json()["questions"]
+    assert len(questions) == 1
+    assert [opt["text"] for opt in questions[0]["options"]] == ["3", "4"]
+    assert "correct_answer" not in questions[0]
+
+
+def test_item_analysis_is_author_only(client: TestClient, token, other_token) -> None:
+    """Test that only the quiz author can read its item analysis."""
+    response = client.post(
+        "/api/quizzes/",
+        json={"title": "Analyzed quiz", "description": "Item analysis"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    quiz_id = response.json()["id"]
+
+    response = client.get(
+        f"/api/quizzes/{quiz_id}/item-analysis",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = client.get(
+        f"/api/quizzes/{quiz_id}/item-analysis",
+        headers={"Authorization": f"Bearer {other_token}"},
+    )
+    assert response.status_code == 403
+
+
+def test_activity_from_rollups(client: TestClient, token, query_budget) -> None:
+    """Test that quiz and journey activity count recorded results per day and hour."""
+    headers = {"Authorization": f"Bearer {token}"}
+    journey_id = client.post(
+        "/api/journeys/",
+        json={"title": "Journey", "description": "Journey with activity"},
+        headers=headers,
+    ).json()["id"]
+    quiz_ids = [
+        client.post(
+            "/api/quizzes/",
+            json={"title": f"Quiz {n}", "description": "Activity quiz", "journey_id": journey_id},
+            headers=headers,
+        ).json()["id"]
+        for n in range(2)
+    ]
+    for quiz_id, score in [(quiz_ids[0], 60), (quiz_ids[0], 80), (quiz_ids[1], 100)]:
+        client.post(
+            "/api/results/",
+            json={
+                "respondent_name": "Student",
+                "quiz_id": quiz_id,
+                "score": score,
+                "total_questions": 5,
+            },
+        )
+
+    response = client.get(f"/api/quizzes/{quiz_ids[0]}/activity", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["granularity"] == "day"
+    assert len(data["buckets"]) == 30
+    assert data["attempts"] == 2
+    assert data["average_score"] == 70.0
+    assert sum(b["attempts"] for b in data["buckets"]) == 2
+
+    response = client.get(
+        f"/api/journeys/{journey_id}/activity?days=2&granularity=hour", headers=headers
+    )
+    query_budget(response, 4)
+    data = response.json()
+    assert len(data["buckets"]) == 48
+    assert data["attempts"] == 3
+    assert data["average_score"] == 80.0
+
+    response = client.get(
+        f"/api/quizzes/{quiz_ids[0]}/activity?days=90&granularity=hour", headers=headers
+    )
+    assert response.status_code == 400
+
+
+def test_import_quizzes_from_ndjson(client: TestClient, token, query_budget) -> None:
+    """Test that an NDJSON import writes valid quizzes in batches and reports bad lines."""
+    headers = {"Authorization": f"Bearer {token}"}
+    journey_id = client.post(
+        "/api/journeys/",
+        json={"title": "Imported journey", "description": "Imported quizzes"},
+        headers=headers,
+    ).json()["id"]
+    question = {
+        "text": "2 + 2?",
+        "options": [{"reference_id": 1, "text": "4"}, {"reference_id": 2, "text": "5"}],
+        "correct_answer": 1,
+    }
+    lines = [
+        {"title": f"Imported {n}", "description": "Import", "journey_id": journey_id,
+         "questions": [question, question]}
+        for n in range(5)
+    ]
+    lines.insert(2, {"title": "Foreign", "description": "Import",
+                     "journey_id": "00000000-0000-0000-0000-000000000000"})
+    body = "\n".join(json.dumps(line) for line in lines) + "\n{oops\n"
+
+    response = client.post(
+        "/api/quizzes/import?batch_size=2",
+        content=body,
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    # One user lookup, then per batch one journey check and three multi-row inserts
+    query_budget(response, 13)
+    report = response.json()
+    assert report["lines"] == 7
+    assert report["imported_quizzes"] == 5
+    assert report["imported_questions"] == 10
+    assert [e["line"] for e in report["errors"]] == [3, 7]
+    assert report["errors"][0]["errors"] == ["journey_id: Journey not found or not yours"]
+    created = client.get("/api/quizzes/me/created", headers=headers).json()
+    assert created["total_items"] == 5
+    quiz = client.get(f"/api/quizzes/{created['items'][0]['id']}").json()
+    assert len(quiz["questions"]) == 2
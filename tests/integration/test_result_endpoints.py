@@ -0,0 +1,314 @@
+import asyncio
+import csv
+import io
+import json
+from uuid import UUID, uuid4
+
+from fastapi.testclient import TestClient
+
+from src.infrastructure.database.models import AnswerResultModel
+from src.infrastructure.result_feed import result_feed
+from src.main import app
+from src.infrastructure.result_buffer import ResultWriteBuffer
+from tests.conftest import TestingSessionLocal
+
+
+def _result_payload(quiz_id: str, score: int = 70) -> dict:
+    return {
+        "respondent_name": "Student",
+        "quiz_id": quiz_id,
+        "score": score,
+        "total_questions": 10,
+    }
+
+
+def test_create_result(client: TestClient, quiz_factory) -> None:
+    """Test that a result is stored immediately in the default mode."""
+    quiz_id = quiz_factory()["id"]
+    response = client.post("/api/results/", json=_result_payload(quiz_id))
+    assert response.status_code == 201
+
+    listing = client.get(f"/api/results/quiz/{quiz_id}")
+    assert [r["id"] for r in listing.json()["items"]] == [response.json()["id"]]
+
+
+def test_create_result_buffered(client: TestClient, quiz_factory, monkeypatch, tmp_path) -> None:
+    """Test that buffered ingestion acknowledges with 202 and stores on flush."""
+    quiz_id = quiz_factory()["id"]
+    buffer = ResultWriteBuffer(TestingSessionLocal, flush_interval=60)
+    monkeypatch.setattr("src.api.routes.results.result_buffer", buffer)
+
+    with client:
+        client.portal.call(buffer.start)
+        response = client.post("/api/results/", json=_result_payload(quiz_id))
+        assert response.status_code == 202
+        assert client.get(f"/api/results/quiz/{quiz_id}").json()["total"] == 0
+        client.portal.call(buffer.stop)
+
+    items = client.get(f"/api/results/quiz/{quiz_id}").json()["items"]
+    assert [r["id"] for r in items] == [response.json()["id"]]
+
+
+def test_quiz_stats(client: TestClient, quiz_factory) -> None:
+    """Test that quiz statistics follow every submitted result."""
+    quiz_id = quiz_factory()["id"]
+    empty = client.get(f"/api/results/quiz/{quiz_id}/stats").json()
+    assert empty["attempts"] == 0
+    assert empty["average_score"] is None
+
+    for score in (40, 80, 90, 100):
+        client.post("/api/results/", json=_result_payload(quiz_id, score))
+
+    response = client.get(f"/api/results/quiz/{quiz_id}/stats", params={"bucket_size": 50})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["attempts"] == 4
+    assert data["average_score"] == 77.5
+    assert data["stddev_score"] == 22.78
+    assert (data["min_score"], data["max_score"]) == (40, 100)
+    assert data["histogram"] == [
+        {"min_score": 0, "max_score": 49, "count": 1},
+        {"min_score": 50, "max_score": 100, "count": 3},
+    ]
+
+
+def test_results_keyset_paging(client: TestClient, quiz_factory) -> None:
+    """Test that cursors walk through all results newest first with the full total."""
+    quiz_id = quiz_factory()["id"]
+    ids = [client.post("/api/results/", json=_result_payload(quiz_id)).json()["id"] for _ in range(5)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get(f"/api/results/quiz/{quiz_id}", params=params).json()
+        assert page["total"] == 5
+        seen += [r["id"] for r in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == ids[::-1]
+
+    response = client.get(f"/api/results/quiz/{quiz_id}", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_my_results_total(client: TestClient, quiz_factory, token: str) -> None:
+    """Test that the user's total counts every result, not just the page."""
+    quiz_id = quiz_factory()["id"]
+    user_id = client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"}).json()["id"]
+    for _ in range(3):
+        client.post("/api/results/", json={**_result_payload(quiz_id), "user_id": user_id})
+
+    page = client.get(
+        "/api/results/me", params={"limit": 1}, headers={"Authorization": f"Bearer {token}"}
+    ).json()
+    assert page["total"] == 3
+    assert len(page["items"]) == 1
+    assert page["next_cursor"] is not None
+
+
+def test_quiz_stats_unknown_quiz(client: TestClient) -> None:
+    """Test that stats for a missing quiz are a 404."""
+    response = client.get("/api/results/quiz/00000000-0000-0000-0000-000000000000/stats")
+    assert response.status_code == 404
+
+
+def test_leaderboard_with_rank(client: TestClient, quiz_factory, query_budget) -> None:
+    """Test top-K ordering, shared ranks for ties and the rank of one result."""
+    quiz_id = quiz_factory()["id"]
+    ids = {}
+    for name, score in (("Ana", 60), ("Bia", 90), ("Caio", 75), ("Duda", 90), ("Eva", 40)):
+        payload = {**_result_payload(quiz_id, score), "respondent_name": name}
+        ids[name] = client.post("/api/results/", json=payload).json()["id"]
+
+    response = client.get(
+        f"/api/results/quiz/{quiz_id}/leaderboard",
+        params={"limit": 3, "result_id": ids["Ana"]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_attempts"] == 5
+    assert [(e["respondent_name"], e["rank"]) for e in data["entries"]] == [
+        ("Bia", 1),
+        ("Duda", 1),
+        ("Caio", 3),
+    ]
+    assert data["result_rank"] == {
+        "result_id": ids["Ana"],
+        "score": 60,
+        "rank": 4,
+        "tied_with": 0,
+    }
+
+    # Warm board: a new result is folded in without reloading the top-K
+    payload = {**_result_payload(quiz_id, 95), "respondent_name": "Fabi"}
+    client.post("/api/results/", json=payload)
+    response = client.get(f"/api/results/quiz/{quiz_id}/leaderboard", params={"limit": 2})
+    assert [e["respondent_name"] for e in response.json()["entries"]] == ["Fabi", "Bia"]
+    # Quiz lookup and stats only; the board comes from memory
+    query_budget(response, 3)
+
+
+def test_leaderboard_rejects_result_of_other_quiz(client: TestClient, quiz_factory) -> None:
+    """Test that ranking a result from another quiz is a 404."""
+    quiz_id = quiz_factory()["id"]
+    other_quiz_id = quiz_factory()["id"]
+    result_id = client.post("/api/results/", json=_result_payload(other_quiz_id)).json()["id"]
+
+    response = client.get(
+        f"/api/results/quiz/{quiz_id}/leaderboard", params={"result_id": result_id}
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Result not found"
+
+
+def test_export_results(client: TestClient, quiz_factory, token: str) -> None:
+    """Test that the quiz author can stream all results as CSV and NDJSON."""
+    quiz_id = quiz_factory()["id"]
+    ids = [client.post("/api/results/", json=_result_payload(quiz_id, score)).json()["id"] for score in (50, 90)]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get(f"/api/results/quiz/{quiz_id}/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert f'filename="results-{quiz_id}.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [r["result_id"] for r in rows] == ids
+    assert [r["score"] for r in rows] == ["50", "90"]
+
+    with TestingSessionLocal() as db:
+        for question in range(2):
+            db.add(AnswerResultModel(result_id=UUID(ids[0]), question_id=uuid4(), is_correct=bool(question)))
+        db.commit()
+
+    response = client.get(
+        f"/api/results/quiz/{quiz_id}/export",
+        params={"format": "ndjson", "include_answers": True},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["result_id"] for line in lines] == [ids[0], ids[0], ids[1]]
+    assert lines[2]["question_id"] is None
+
+
+def test_export_results_without_results_has_a_header(client: TestClient, quiz_factory, token: str) -> None:
+    """Test that an empty CSV export still carries its header row."""
+    quiz_id = quiz_factory()["id"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get(f"/api/results/quiz/{quiz_id}/export", headers=headers)
+    assert response.status_code == 200
+    assert response.text.splitlines() == [
+        "result_id,user_id,respondent_name,score,total_questions,taken_at"
+    ]
+
+    response = client.get(
+        f"/api/results/quiz/{quiz_id}/export", params={"include_answers": True}, headers=headers
+    )
+    assert response.text.splitlines()[0].endswith(
+        "taken_at,question_id,selected_option_id,is_correct,answered_at"
+    )
+
+
+def test_export_results_is_author_only(client: TestClient, quiz_factory, other_token) -> None:
+    """Test that other users cannot export a quiz's results."""
+    quiz_id = quiz_factory()["id"]
+
+    response = client.get(
+        f"/api/results/quiz/{quiz_id}/export", headers={"Authorization": f"Bearer {other_token}"}
+    )
+    assert response.status_code == 403
+
+
+def test_create_result_returns_percentile_rank(client: TestClient, quiz_factory) -> None:
+    """Test that a submitted result reports the share of the quiz's results it beat."""
+    quiz_id = quiz_factory()["id"]
+    ranks = []
+    for score in (50, 90, 70, 70):
+        response = client.post("/api/results/", json=_result_payload(quiz_id, score=score))
+        ranks.append(response.json()["percentile_rank"])
+
+    assert ranks == [0.0, 50.0, 33.3, 25.0]
+    listing = client.get(f"/api/results/quiz/{quiz_id}").json()
+    assert all(item["percentile_rank"] is None for item in listing["items"])
+
+
+class _EventStream:
+    """Drives the ASGI app directly: TestClient only returns once a response is complete."""
+
+    def __init__(self, path: str):
+        self.scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"testserver")],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+        }
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.disconnected = asyncio.Event()
+        self.requested = False
+
+    async def _receive(self) -> dict:
+        if not self.requested:
+            self.requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await self.disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def __aenter__(self) -> "_EventStream":
+        self.task = asyncio.create_task(app(self.scope, self._receive, self.messages.put))
+        self.start = await asyncio.wait_for(self.messages.get(), timeout=5)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.disconnected.set()
+        await asyncio.wait_for(self.task, timeout=5)
+
+    async def event(self) -> dict:
+        message = await asyncio.wait_for(self.messages.get(), timeout=5)
+        fields = dict(
+            line.split(": ", 1) for line in message["body"].decode().strip().splitlines()
+        )
+        return {"event": fields["event"], **json.loads(fields["data"])}
+
+
+async def test_stream_results(client: TestClient, quiz_factory, monkeypatch) -> None:
+    """Test that watchers get a snapshot, then coalesced updates as results are recorded."""
+    monkeypatch.setattr(result_feed, "interval", 0.2)
+    quiz_id = quiz_factory()["id"]
+    first = client.post("/api/results/", json=_result_payload(quiz_id, score=50)).json()
+
+    async with _EventStream(f"/api/results/quiz/{quiz_id}/stream") as stream:
+        assert stream.start["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in stream.start["headers"]
+        snapshot = await stream.event()
+        assert snapshot["event"] == "snapshot"
+        assert snapshot["total_attempts"] == 1
+        assert [e["result_id"] for e in snapshot["leaderboard"]] == [first["id"]]
+
+        created = [
+            client.post("/api/results/", json=_result_payload(quiz_id, score=score)).json()
+            for score in (90, 40)
+        ]
+        update = await stream.event()
+        assert update["event"] == "update"
+        assert update["total_attempts"] == 3
+        assert [r["id"] for r in update["results"]] == [r["id"] for r in created]
+        leaderboard = [(e["rank"], e["score"]) for e in update["leaderboard"]]
+        assert leaderboard == [(1, 90), (2, 50), (3, 40)]
+        assert update["removed"] == []
+
+    assert not result_feed.is_seeded(UUID(quiz_id))
+
+
+def test_stream_results_unknown_quiz(client: TestClient) -> None:
+    """Test that streaming an unknown quiz is a 404."""
+    assert client.get(f"/api/results/quiz/{uuid4()}/stream").status_code == 404
@@ -0,0 +1,31 @@
+from fastapi.testclient import TestClient
+
+from src.infrastructure.observability import install_sql_tracing, tracer
+
+from ..unit.infrastructure.test_tracing import MemoryExporter
+
+
+def test_request_spans_cover_use_cases_repositories_and_sql(client: TestClient, token) -> None:
+    """Test that a request produces a nested trace down to SQL statements."""
+    exporter = MemoryExporter()
+    tracer.configure(exporter)
+    install_sql_tracing()
+    try:
+        response = client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"})
+    finally:
+        tracer.configure(None)
+
+    assert response.status_code == 200
+    spans = {span.name: span for span in exporter.spans}
+    root = spans["GET /api/users/me"]
+    assert response.headers["X-Trace-Id"] == root.trace_id
+    assert root.kind == "server"
+    assert root.attributes["http.status_code"] == 200
+
+    use_case = spans["UserUseCases.get_user_by_username"]
+    repository = spans["UserRepositoryImpl.get_by_username"]
+    query = spans["db.query"]
+    assert use_case.parent_id == root.span_id
+    assert repository.parent_id == use_case.span_id
+    assert query.parent_id == repository.span_id
+    assert all(span.trace_id == root.trace_id for span in exporter.spans)
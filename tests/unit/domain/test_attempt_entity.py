@@ -0,0 +1,118 @@
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.attempt import Answer, AnswerKey, Attempt
+from src.domain.entities.option import Option
+from src.domain.entities.question import Question
+from src.domain.entities.quiz import FeedbackMode, Quiz
+
+
+def _quiz() -> Quiz:
+    quiz = Quiz(title="Quiz", description="Description", feedback_mode=FeedbackMode.IMEDIATO)
+    quiz.questions = [
+        Question(
+            text=f"Question {n}",
+            quiz_id=quiz.id,
+            options=[Option(reference_id=1), Option(reference_id=2)],
+            correct_answer=2,
+        )
+        for n in range(3)
+    ]
+    return quiz
+
+
+def test_answer_key_checks_options() -> None:
+    """Test that the key knows the correct option of each question and rejects foreign ids."""
+    quiz = _quiz()
+    key = AnswerKey.from_quiz(quiz)
+    first, second = quiz.questions[:2]
+
+    assert key.total_questions == 3
+    assert key.check(first.id, first.options[1].id) is True
+    assert key.check(first.id, first.options[0].id) is False
+    with pytest.raises(ValueError):
+        key.check(first.id, second.options[1].id)
+    with pytest.raises(ValueError):
+        key.check(uuid4(), first.options[1].id)
+
+
+def test_attempt_scores_unanswered_as_wrong() -> None:
+    """Test that the score is the percentage of correct answers over all questions."""
+    attempt = Attempt(quiz_id=uuid4(), respondent_name="Student")
+    answers = [Answer(uuid4(), uuid4(), True), Answer(uuid4(), uuid4(), False)]
+
+    result = attempt.to_result(answers, total_questions=3)
+
+    assert result.id == attempt.id
+    assert result.score == 33
+    assert result.total_questions == 3
+
+
+def test_paper_order_comes_from_the_attempt_id() -> None:
+    """Test that a shuffled paper is stable per attempt and leaves the shared key untouched."""
+    quiz = _quiz()
+    quiz.shuffle_questions = quiz.shuffle_options = True
+    key = AnswerKey.from_quiz(quiz)
+    shared = [(q.id, [opt.id for opt in q.options]) for q in key.questions]
+
+    def order(attempt_id):
+        return [(q.id, [opt.id for opt in options]) for q, options in key.paper(attempt_id)]
+
+    attempt_id = uuid4()
+    assert order(attempt_id) == order(attempt_id)
+    assert len({repr(order(uuid4())) for _ in range(20)}) > 1
+    assert [(q.id, [opt.id for opt in q.options]) for q in key.questions] == shared
+    assert {id(q) for q, _ in key.paper(attempt_id)} == {id(q) for q in key.questions}
+
+
+def test_paper_keeps_quiz_order_without_shuffling() -> None:
+    """Test that quizzes without shuffling give every attempt the creation order."""
+    quiz = _quiz()
+    key = AnswerKey.from_quiz(quiz)
+
+    paper = key.paper(uuid4())
+
+    assert [q.id for q, _ in paper] == [q.id for q in quiz.questions]
+    assert all(options == tuple(q.options) for q, options in paper)
+
+
+def test_paper_order_ignores_legacy_ids() -> None:
+    """Test that random (pre-v7) question ids do not reorder an unshuffled quiz."""
+    quiz = _quiz()
+    for question in quiz.questions:
+        question.id = uuid4()
+
+    paper = AnswerKey.from_quiz(quiz).paper(uuid4())
+
+    assert [q.text for q, _ in paper] == ["Question 0", "Question 1", "Question 2"]
+
+
+def test_shuffled_paper_does_not_depend_on_load_order() -> None:
+    """Test that a shuffled paper is the same whatever order the questions were loaded in."""
+    quiz = _quiz()
+    quiz.shuffle_questions = True
+    attempt_id = uuid4()
+    first = [q.id for q, _ in AnswerKey.from_quiz(quiz).paper(attempt_id)]
+
+    quiz.questions.reverse()
+
+    assert [q.id for q, _ in AnswerKey.from_quiz(quiz).paper(attempt_id)] == first
+
+
+def test_shuffled_options_do_not_depend_on_load_order() -> None:
+    """Test that options sharing the same order are shuffled from a fixed starting order."""
+    quiz = _quiz()
+    quiz.shuffle_options = True
+    for question in quiz.questions:
+        question.options = [Option(reference_id=n) for n in range(1, 5)]
+    attempt_id = uuid4()
+
+    def options(key: AnswerKey) -> list:
+        return [[opt.id for opt in opts] for _, opts in key.paper(attempt_id)]
+
+    first = options(AnswerKey.from_quiz(quiz))
+    for question in quiz.questions:
+        question.options.reverse()
+
+    assert options(AnswerKey.from_quiz(quiz)) == first
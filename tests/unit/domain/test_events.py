@@ -0,0 +1,15 @@
+from src.domain.events import EventHub, ResultsRecorded
+
+
+def test_event_hub_isolates_failing_handlers() -> None:
+    """Test that one broken subscriber does not stop the others."""
+    hub = EventHub()
+    seen = []
+    hub.subscribe(ResultsRecorded, lambda event: 1 / 0)
+    unsubscribe = hub.subscribe(ResultsRecorded, seen.append)
+
+    event = ResultsRecorded(())
+    hub.publish(event)
+    unsubscribe()
+    hub.publish(event)
+    assert seen == [event]
@@ -0,0 +1,35 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.results import Result
+from src.domain.ids import uuid7, uuid7_datetime
+
+
+def test_uuid7_layout() -> None:
+    """Test that generated ids carry the version 7 and RFC variant bits."""
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_is_monotonic_within_process() -> None:
+    """Test that ids sort in creation order, even within one millisecond."""
+    values = [uuid7() for _ in range(10_000)]
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_uuid7_embeds_creation_time() -> None:
+    """Test that the creation time can be read back from the id."""
+    created = uuid7_datetime(uuid7())
+    assert abs(datetime.now(timezone.utc) - created) < timedelta(seconds=5)
+    with pytest.raises(ValueError):
+        uuid7_datetime(uuid4())
+
+
+def test_entities_default_to_uuid7() -> None:
+    """Test that new entities get time-ordered ids."""
+    result = Result(None, None, "Ana", uuid4(), 80, 10)
+    assert result.id.version == 7
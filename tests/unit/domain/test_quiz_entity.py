@@ -1,7 +1,7 @@
 from uuid import uuid4
 from datetime import datetime
 
-from src.domain.entities.quiz import Quiz
+from src.domain.entities.quiz import FeedbackMode, Quiz
 
 
 def test_create_quiz() -> None:
@@ -59,3 +59,29 @@ def test_quiz_repr() -> None:
     repr_str = repr(quiz)
     assert "Quiz" in repr_str
     assert "Test Quiz" in repr_str
+
+
+def test_hydrate_quiz_keeps_stored_values() -> None:
+    """Test that hydrating a quiz uses the given values without defaults."""
+    quiz_id = uuid4()
+    stored_at = datetime(2024, 1, 1, 12, 0)
+    quiz = Quiz.hydrate(
+        id=quiz_id,
+        title="Stored quiz",
+        description="Loaded from the database",
+        journey_id=None,
+        user_id=None,
+        questions=[],
+        estimated_time=5,
+        feedback_mode=FeedbackMode.IMEDIATO,
+        difficulty=None,
+        image_url=None,
+        created_at=stored_at,
+        updated_at=stored_at,
+    )
+
+    assert quiz.id == quiz_id
+    assert quiz.created_at == stored_at
+    assert quiz.difficulty is None
+    assert quiz == Quiz(id=quiz_id, title="Stored quiz", description="Other")
+    assert not hasattr(quiz, "__dict__")
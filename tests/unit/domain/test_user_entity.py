@@ -2,6 +2,7 @@ from uuid import uuid4
 from datetime import datetime
 
 from src.domain.entities.user import User
+from src.domain.enum.user_type import UserType
 
 
 def test_create_user() -> None:
@@ -58,3 +59,9 @@ def test_user_repr() -> None:
     assert "User" in repr_str
     assert "testuser" in repr_str
     assert "test@example.com" in repr_str
+
+
+def test_user_type_reads_legacy_column_default() -> None:
+    """Test that the old "adventure" column default maps to UserType.ADVENTURE."""
+    assert UserType("adventure") is UserType.ADVENTURE
+    assert UserType("strategist") is UserType.STRATEGIST
@@ -0,0 +1,22 @@
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+from uuid import UUID
+
+import pytest
+
+from src.domain.entities.results import Result
+
+START = datetime(2024, 5, 1, 12, 0)
+
+
+@pytest.fixture
+def make_result() -> Callable[..., Result]:
+    """Build an unsaved Result taken `minutes` after a fixed start time."""
+
+    def make(quiz_id: UUID, score: int = 70, minutes: int = 0, aware: bool = False) -> Result:
+        taken_at = START + timedelta(minutes=minutes)
+        if aware:
+            taken_at = taken_at.replace(tzinfo=timezone.utc)
+        return Result(None, None, f"Student {score}", quiz_id, score, 10, taken_at)
+
+    return make
@@ -0,0 +1,61 @@
+import pytest
+
+from src.infrastructure.cache import MemoryTTLStore, RedisTTLStore, StoreFullError
+
+
+async def test_memory_store_expires_entries() -> None:
+    """Test that values are returned until their TTL passes."""
+    store = MemoryTTLStore()
+    await store.set("live", b"1", ttl=60)
+    await store.set("expired", b"2", ttl=0)
+
+    assert await store.get("live") == b"1"
+    assert await store.get("expired") is None
+    await store.delete("live")
+    assert await store.get("live") is None
+
+
+async def test_memory_store_add_is_set_if_absent() -> None:
+    """Test that add only succeeds for absent or expired keys."""
+    store = MemoryTTLStore()
+    assert await store.add("lock", b"a", ttl=60)
+    assert not await store.add("lock", b"b", ttl=60)
+    assert await store.get("lock") == b"a"
+
+    await store.set("stale", b"x", ttl=0)
+    assert await store.add("stale", b"y", ttl=60)
+
+
+async def test_memory_store_is_bounded() -> None:
+    """Test that the oldest entries are dropped beyond max_entries."""
+    store = MemoryTTLStore(max_entries=2)
+    for key in ("a", "b", "c"):
+        await store.set(key, b"1", ttl=60)
+
+    assert await store.get("a") is None
+    assert store.health_check().details == {"backend": "memory", "entries": 2}
+
+
+def test_redis_store_requires_redis_package() -> None:
+    """Test that a missing redis package is reported when the backend is selected."""
+    try:
+        import redis  # noqa: F401
+    except ImportError:
+        with pytest.raises(RuntimeError, match="redis package"):
+            RedisTTLStore("redis://localhost:6379/0")
+    else:
+        pytest.skip("redis is installed")
+
+
+async def test_non_evicting_store_refuses_new_keys_when_full() -> None:
+    """Test that live keys are kept and expired ones make room before a key is refused."""
+    store = MemoryTTLStore(max_entries=2, evict=False)
+    await store.set("a", b"1", ttl=60)
+    await store.set("b", b"1", ttl=0)
+    await store.set("c", b"1", ttl=60)
+
+    with pytest.raises(StoreFullError):
+        await store.add("d", b"1", ttl=60)
+    await store.set("a", b"2", ttl=60)
+    assert await store.get("a") == b"2"
+    assert await store.get("c") == b"1"
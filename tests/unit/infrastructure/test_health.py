@@ -0,0 +1,32 @@
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from src.infrastructure.health import database_check, directory_writable_check, pool_check
+
+
+def test_database_check_measures_round_trip() -> None:
+    """Test that the database probe succeeds against a live engine."""
+    result = database_check(create_engine("sqlite://"))()
+    assert result.healthy
+    assert result.latency_ms >= 0
+
+
+def test_pool_check_detects_saturation() -> None:
+    """Test that the pool probe fails once all connections are checked out."""
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=0)
+    assert pool_check(engine)().healthy
+
+    with engine.connect():
+        result = pool_check(engine)()
+        assert not result.healthy
+        assert result.details == {"checked_out": 1, "capacity": 1, "saturation": 1.0}
+        assert database_check(engine)().error == "connection pool exhausted"
+
+
+def test_directory_writable_check(tmp_path) -> None:
+    """Test the upload directory probe on writable and unusable paths."""
+    assert directory_writable_check("uploads", tmp_path)().healthy
+
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    assert not directory_writable_check("uploads", blocker / "sub")().healthy
@@ -0,0 +1,36 @@
+from uuid import uuid4
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.infrastructure.analytics.item_analysis import ItemAnalysis  # noqa: E402
+
+
+def test_item_analysis_across_chunks() -> None:
+    """Test difficulty, discrimination and option counts accumulated over chunks."""
+    quiz_id, easy, hard = uuid4(), uuid4(), uuid4()
+    easy_right, right, wrong = uuid4(), uuid4(), uuid4()
+    analysis = ItemAnalysis()
+    analysis.add([(easy, quiz_id, easy_right, True, 90), (easy, quiz_id, easy_right, True, 40)])
+    analysis.add(
+        [
+            (hard, quiz_id, right, True, 100),
+            (hard, quiz_id, wrong, False, 20),
+            (hard, quiz_id, None, False, 30),
+            (hard, quiz_id, wrong, False, 10),
+        ]
+    )
+
+    stats = {row["question_id"]: row for row in analysis.results()}
+    assert analysis.rows == 6
+    assert stats[easy]["p_value"] == 1.0
+    assert stats[easy]["discrimination"] is None
+    assert stats[hard]["responses"] == 4
+    assert stats[hard]["p_value"] == 0.25
+
+    scores = np.array([100, 20, 30, 10], dtype=float)
+    expected = np.corrcoef([1, 0, 0, 0], scores)[0, 1]
+    assert stats[hard]["discrimination"] == pytest.approx(expected, abs=1e-4)
+    assert stats[easy]["option_counts"] == {str(easy_right): 2}
+    assert stats[hard]["option_counts"] == {str(right): 1, str(wrong): 2}
@@ -0,0 +1,39 @@
+from uuid import uuid4
+
+from src.domain.entities.journey_progress import QuizProgress
+from src.domain.entities.results import Result
+from src.domain.events import ResultsRecorded
+from src.infrastructure.journey_progress import JourneyProgressCache
+
+
+def test_recorded_results_invalidate_only_their_users() -> None:
+    """Test that a user's new result drops all of their journeys and nobody else's."""
+    cache = JourneyProgressCache(ttl=60)
+    alice, bob = uuid4(), uuid4()
+    journeys = [uuid4(), uuid4()]
+    progress = [QuizProgress(uuid4(), "Quiz")]
+    for journey_id in journeys:
+        cache.put(alice, journey_id, progress)
+    cache.put(bob, journeys[0], progress)
+
+    results = (Result(None, alice, "Alice", uuid4(), 80, 10), Result(None, None, "Guest", uuid4(), 50, 10))
+    cache.on_results_recorded(ResultsRecorded(results))
+
+    assert cache.get(alice, journeys[0]) is None
+    assert cache.get(alice, journeys[1]) is None
+    assert cache.get(bob, journeys[0]) is progress
+
+
+def test_cache_is_bounded_and_expires() -> None:
+    """Test that the least recently used entries are evicted and stale ones are not served."""
+    cache = JourneyProgressCache(ttl=60, max_entries=2)
+    user_id = uuid4()
+    journeys = [uuid4() for _ in range(3)]
+    for journey_id in journeys:
+        cache.put(user_id, journey_id, [])
+
+    assert cache.get(user_id, journeys[0]) is None
+    assert cache.get(user_id, journeys[2]) == []
+
+    cache.ttl = 0
+    assert cache.get(user_id, journeys[2]) is None
@@ -0,0 +1,36 @@
+from uuid import uuid4
+
+from src.infrastructure.leaderboard import LeaderboardCache
+
+
+def test_cache_keeps_top_k_sorted(make_result) -> None:
+    """Test that recorded results are merged into warm boards, bounded to the size."""
+    quiz_id = uuid4()
+    cache = LeaderboardCache(size=3, ttl=60)
+    assert cache.get(quiz_id, 3) is None
+
+    cache.put(quiz_id, [make_result(quiz_id, score) for score in (90, 80, 70)])
+    cache.record(
+        (
+            make_result(quiz_id, 85, 5, aware=True),
+            make_result(quiz_id, 10),
+            make_result(uuid4(), 100),
+        )
+    )
+
+    assert [r.score for r in cache.get(quiz_id, 3)] == [90, 85, 80]
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_cache_orders_ties_by_time_and_expires(make_result) -> None:
+    """Test that earlier attempts win ties and stale boards are reloaded."""
+    quiz_id = uuid4()
+    cache = LeaderboardCache(size=5, ttl=0)
+    later, earlier = make_result(quiz_id, 90, 10), make_result(quiz_id, 90, 1)
+    cache.put(quiz_id, [later, earlier])
+    assert cache.get(quiz_id, 5) is None
+
+    cache.ttl = 60
+    cache.put(quiz_id, [later, earlier])
+    assert cache.get(quiz_id, 5) == [earlier, later]
+
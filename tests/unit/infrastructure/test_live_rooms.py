@@ -0,0 +1,114 @@
+import asyncio
+import json
+
+from src.domain.entities.option import Option
+from src.domain.entities.question import Question
+from src.domain.entities.quiz import Quiz
+from src.infrastructure.live_rooms import (
+    SLOW_CLIENT_CLOSE_CODE,
+    Connection,
+    LiveRoom,
+    LiveRoomRegistry,
+)
+
+
+class FakeSocket:
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.closed_with = None
+        self.unblock = asyncio.Event()
+        if not blocked:
+            self.unblock.set()
+
+    async def send(self, message: str) -> None:
+        await self.unblock.wait()
+        self.sent.append(json.loads(message))
+
+    async def close(self, code: int) -> None:
+        self.closed_with = code
+
+    def connection(self, queue_size: int = 64) -> Connection:
+        return Connection(self.send, self.close, queue_size=queue_size)
+
+
+def _quiz() -> Quiz:
+    quiz = Quiz(title="Live", description="Live quiz")
+    quiz.questions = [
+        Question(
+            text="Question",
+            quiz_id=quiz.id,
+            options=[Option(reference_id=1), Option(reference_id=2)],
+            correct_answer=1,
+        )
+    ]
+    return quiz
+
+
+async def test_slow_client_is_dropped_without_blocking_others() -> None:
+    """Test that a client whose queue fills up is closed while others keep receiving."""
+    room = LiveRoom("ROOM", _quiz(), host_id=None, counts_interval=0.01)
+    room.start()
+    fast, slow = FakeSocket(), FakeSocket(blocked=True)
+    room.join("Fast", None, fast.connection())
+    room.join("Slow", None, slow.connection(queue_size=2))
+
+    room.next_question()
+    room.reveal()
+    await room.flush()
+    await asyncio.sleep(0.01)
+    room.stop()
+
+    assert [m["type"] for m in fast.sent] == ["welcome", "question", "reveal"]
+    assert slow.closed_with == SLOW_CLIENT_CLOSE_CODE
+
+
+async def test_answer_counts_are_coalesced() -> None:
+    """Test that many answers within one interval produce a single counts broadcast."""
+    room = LiveRoom("ROOM", _quiz(), host_id=None, counts_interval=0.05)
+    room.start()
+    host = FakeSocket()
+    room.hosts.append(host.connection())
+    room.next_question()
+    question = room.current_question
+    for n in range(20):
+        participant = room.join(f"P{n}", None, FakeSocket().connection())
+        assert room.answer(participant, question.id, question.options[n % 2].id)
+    assert not room.answer(participant, question.id, question.options[0].id)
+
+    await asyncio.sleep(0.2)
+    room.stop()
+
+    counts = [m for m in host.sent if m["type"] == "counts"]
+    assert len(counts) == 1
+    assert counts[0]["answered"] == 20
+
+
+async def test_close_stops_the_sending_task() -> None:
+    """Test that closing a connection stops its task without sending a close frame."""
+    socket = FakeSocket(blocked=True)
+    connection = socket.connection()
+    connection.offer("{}")
+    connection.close()
+    await asyncio.sleep(0)
+
+    assert connection._task.done()
+    assert not connection.offer("{}")
+    assert socket.closed_with is None
+
+
+async def test_registry_close_disconnects_everyone() -> None:
+    """Test that closing a room stops its fan-out and every host and participant task."""
+    registry = LiveRoomRegistry()
+    room = registry.create(_quiz(), host_id=None)
+    host, player = FakeSocket(), FakeSocket()
+    room.hosts.append(host.connection())
+    participant = room.join("Player", None, player.connection())
+    connections = room.connections()
+
+    registry.close(room.code)
+    await asyncio.sleep(0)
+
+    assert registry.get(room.code) is None
+    assert all(connection._task.done() for connection in connections)
+    assert host.closed_with == player.closed_with == 1000
+    assert room.hosts == [] and participant.connection is None
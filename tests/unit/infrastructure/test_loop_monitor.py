@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+from src.infrastructure.observability.loop_monitor import EventLoopMonitor, percentile
+
+
+def blocking_call(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def test_percentile() -> None:
+    """Test nearest-rank percentiles."""
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 0.5) == 51.0
+    assert percentile(values, 0.99) == 100.0
+    assert percentile([], 0.5) == 0.0
+
+
+async def test_monitor_reports_blocking_call() -> None:
+    """Test that a blocked loop is detected with the stack of the blocking frame."""
+    monitor = EventLoopMonitor(interval=0.01, threshold=0.05)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    blocking_call(0.2)
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    snapshot = monitor.snapshot(include_stacks=True)
+    assert not snapshot["running"]
+    assert snapshot["samples"] > 0
+    assert snapshot["lag_ms"]["max"] >= 100
+    assert snapshot["blocked_count"] >= 1
+    assert "blocking_call" in snapshot["recent_blocking"][0]["stack"]
+
+
+async def test_monitor_idle_loop_has_no_reports() -> None:
+    """Test that an idle loop produces lag samples but no blocking reports."""
+    monitor = EventLoopMonitor(interval=0.01, threshold=0.1)
+    monitor.start()
+    await asyncio.sleep(0.1)
+    await monitor.stop()
+
+    snapshot = monitor.snapshot()
+    assert snapshot["blocked_count"] == 0
+    assert "recent_blocking" not in snapshot
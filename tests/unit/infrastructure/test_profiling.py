@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from src.infrastructure.observability.profiling import ProfileStore, SamplingProfiler
+
+
+def busy_wait(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_sampling_profiler_exports_speedscope() -> None:
+    """Test that samples of the profiled thread are exported in speedscope format."""
+    with SamplingProfiler(interval=0.001) as profiler:
+        busy_wait(0.05)
+
+    assert profiler.sample_count > 0
+    data = profiler.to_speedscope("busy")
+    profile = data["profiles"][0]
+    assert len(profile["samples"]) == len(profile["weights"]) == profiler.sample_count
+    names = {frame["name"] for frame in data["shared"]["frames"]}
+    assert "busy_wait" in names
+
+
+def test_profile_store_prunes_and_rejects_bad_ids(tmp_path) -> None:
+    """Test that the store keeps the newest profiles and validates ids."""
+    store = ProfileStore(str(tmp_path), max_files=2)
+    for i in range(3):
+        store.save(f"req-{i}", {"i": i})
+
+    assert len(list(tmp_path.iterdir())) == 2
+    assert store.load("../etc/passwd") is None
+    with pytest.raises(ValueError):
+        store.save("../escape", {})
@@ -0,0 +1,31 @@
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.observability import current_query_stats, track_queries
+
+
+def test_track_queries_counts_statements() -> None:
+    """Test that statements executed inside the block are counted and timed."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with track_queries() as stats:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+        conn.execute(text("SELECT 3"))
+
+    assert stats.count == 2
+    assert stats.total_time >= 0
+    assert current_query_stats() is None
+
+
+def test_track_queries_flags_repeated_statements() -> None:
+    """Test that identical statements are reported as repeated."""
+    engine = create_engine("sqlite://")
+    with engine.connect() as conn:
+        with track_queries() as stats:
+            for i in range(3):
+                conn.execute(text("SELECT :value"), {"value": i})
+            conn.execute(text("SELECT 1"))
+
+    assert stats.repeated(threshold=3) == {"SELECT ?": 3}
+    assert stats.repeated(threshold=4) == {}
@@ -0,0 +1,81 @@
+import json
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from src.api.schemas.quizzes import QuizCreate
+from src.infrastructure.database.models import (
+    Base,
+    QuestionModel,
+    QuestionOptionModel,
+    QuizModel,
+)
+from src.infrastructure.database.quiz_import import LineSplitter, QuizImporter
+
+
+def _quiz_line(n: int) -> bytes:
+    return json.dumps(
+        {
+            "title": f"Imported quiz {n}",
+            "description": "From another platform",
+            "questions": [
+                {
+                    "text": f"Question {q}",
+                    "options": [
+                        {"reference_id": 1, "text": "Yes"},
+                        {"reference_id": 2, "text": "No"},
+                    ],
+                    "correct_answer": 1,
+                }
+                for q in range(3)
+            ],
+        }
+    ).encode()
+
+
+def test_line_splitter_handles_chunk_boundaries_and_long_lines() -> None:
+    """Test that lines are numbered across chunks and over-long lines are not buffered."""
+    lines = LineSplitter(max_bytes=8)
+    chunks = [b"ab", b"c\nde", b"f\n", b"0123456789", b"abc\nlast"]
+
+    received = [pair for chunk in chunks for pair in lines.feed(chunk)]
+    received += list(lines.close())
+
+    assert received == [(1, b"abc"), (2, b"def"), (3, None), (4, b"last")]
+
+
+def test_importer_writes_batches_and_reports_bad_lines(tmp_path) -> None:
+    """Test that valid lines are written in batches and invalid ones reported by line number."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'import.db'}")
+    Base.metadata.create_all(engine)
+    bad_answer = json.loads(_quiz_line(99))
+    bad_answer["questions"][1]["correct_answer"] = 5
+    body = b"\n".join(
+        [
+            _quiz_line(1),
+            b"{not json",
+            _quiz_line(2),
+            b"",
+            json.dumps({"title": "x", "description": "Too short a title"}).encode(),
+            json.dumps(bad_answer).encode(),
+            _quiz_line(3),
+        ]
+    )
+
+    with Session(engine) as db:
+        importer = QuizImporter(db, QuizCreate, batch_size=2)
+        report = importer.import_chunks(body[i : i + 50] for i in range(0, len(body), 50))
+
+    assert report.lines == 6
+    assert report.imported_quizzes == 3
+    assert report.imported_questions == 9
+    assert [e.line for e in report.errors] == [2, 5, 6]
+    assert report.errors[1].errors[0].startswith("title:")
+    assert "questions.1" in report.errors[2].errors[0]
+    with engine.connect() as conn:
+        def count(model: type) -> int:
+            return conn.execute(select(func.count()).select_from(model)).scalar_one()
+
+        assert count(QuizModel) == 3
+        assert count(QuestionModel) == 9
+        assert count(QuestionOptionModel) == 18
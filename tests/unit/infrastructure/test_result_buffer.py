@@ -0,0 +1,133 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.entities.results import Result
+from src.infrastructure.database.models import Base, QuizModel, ResultsModel
+from src.infrastructure.repositories.result_repository_impl import ResultRepositoryImpl
+from src.infrastructure.result_buffer import BufferFullError, ResultSpool, ResultWriteBuffer
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'results.db'}")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def quiz_id(session_factory):
+    quiz = QuizModel(title="Buffered quiz", description="For ingestion tests")
+    with session_factory() as db:
+        db.add(quiz)
+        db.commit()
+        return quiz.id
+
+
+def _count(session_factory) -> int:
+    with session_factory() as db:
+        return db.execute(select(func.count()).select_from(ResultsModel)).scalar()
+
+
+async def test_buffer_flushes_in_batches_and_on_stop(
+    session_factory, quiz_id, tmp_path, make_result
+) -> None:
+    """Test that queued results are written in batches and the rest on shutdown."""
+    spool = ResultSpool(tmp_path / "spool", segment_rows=10)
+    buffer = ResultWriteBuffer(session_factory, flush_interval=5, max_rows=20, spool=spool)
+    await buffer.start()
+
+    await asyncio.gather(*(buffer.submit(make_result(quiz_id)) for _ in range(25)))
+    await asyncio.sleep(0.1)
+    assert _count(session_factory) == 20
+
+    await buffer.stop()
+    assert _count(session_factory) == 25
+    assert buffer.flushed == 25
+    assert spool.leftover_segments() == []
+    with session_factory() as db:
+        stats = await ResultRepositoryImpl(db).get_quiz_stats(quiz_id)
+    assert stats.attempts == 25
+    assert stats.score_counts == {70: 25}
+
+
+async def test_buffer_rejects_when_full(session_factory, quiz_id, make_result) -> None:
+    """Test that a full queue refuses new results instead of growing."""
+    buffer = ResultWriteBuffer(session_factory, flush_interval=5, max_rows=100, max_queue=2)
+    await buffer.start()
+    await buffer.submit(make_result(quiz_id))
+    await buffer.submit(make_result(quiz_id))
+    with pytest.raises(BufferFullError):
+        await buffer.submit(make_result(quiz_id))
+    await buffer.stop()
+    assert _count(session_factory) == 2
+
+
+async def test_spooled_results_are_replayed_once(
+    session_factory, quiz_id, tmp_path, make_result
+) -> None:
+    """Test that results left in the spool by a crash are stored on the next start."""
+    spool_dir = tmp_path / "spool"
+    crashed = ResultSpool(spool_dir)
+    stored = make_result(quiz_id)
+    crashed.append([(1, stored), (2, make_result(quiz_id))])
+    crashed.close()
+    # The first result was flushed before the crash, the segment was not released yet
+    with session_factory() as db:
+        db.add(ResultsModel(id=stored.id, respondent_name="Student", quiz_id=quiz_id, score=70,
+                            total_questions=10, taken_at=stored.taken_at))
+        db.commit()
+    with open(next(spool_dir.rglob("*.ndjson")), "a", encoding="utf-8") as f:
+        f.write('{"id": "torn')
+
+    buffer = ResultWriteBuffer(session_factory, spool=ResultSpool(spool_dir))
+    await buffer.start()
+    await buffer.stop()
+
+    assert _count(session_factory) == 2
+    assert list(spool_dir.rglob("*.ndjson")) == []
+    assert list(spool_dir.iterdir()) == []
+
+
+async def test_live_spool_is_not_replayed_by_another_process(
+    session_factory, quiz_id, tmp_path, make_result
+) -> None:
+    """Test that a starting buffer leaves the segments of a spool that is still locked alone."""
+    spool_dir = tmp_path / "spool"
+    live = ResultSpool(spool_dir)
+    live.append([(1, make_result(quiz_id))])
+
+    buffer = ResultWriteBuffer(session_factory, spool=ResultSpool(spool_dir))
+    await buffer.start()
+    await buffer.stop()
+
+    assert _count(session_factory) == 0
+    assert live.leftover_segments() != []
+    live.close()
+
+
+async def test_poison_row_is_dead_lettered(session_factory, quiz_id, tmp_path, make_result) -> None:
+    """Test that a row the database keeps refusing is isolated instead of blocking the queue."""
+    spool = ResultSpool(tmp_path / "spool", segment_rows=3)
+    buffer = ResultWriteBuffer(
+        session_factory, flush_interval=5, max_rows=8, spool=spool, max_retries=1, retry_delay=0
+    )
+    await buffer.start()
+    poison = Result(None, None, None, quiz_id, 50, 10)
+    results = [make_result(quiz_id) for _ in range(7)]
+    results.insert(3, poison)
+    await asyncio.gather(*(buffer.submit(r) for r in results))
+    await buffer.stop()
+
+    assert _count(session_factory) == 7
+    assert buffer.flushed == 7
+    assert buffer.dead_lettered == 1
+    assert spool.leftover_segments() == []
+    [dead_letter] = (tmp_path / "spool" / "dead-letter").glob("*.ndjson")
+    [line] = dead_letter.read_text(encoding="utf-8").splitlines()
+    record = json.loads(line)
+    assert record["id"] == str(poison.id)
+    assert record["error"].startswith("IntegrityError")
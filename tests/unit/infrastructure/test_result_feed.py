@@ -0,0 +1,62 @@
+import asyncio
+import json
+import threading
+from uuid import uuid4
+
+from src.domain.events import ResultsRecorded
+from src.infrastructure.result_feed import ResultFeed
+
+
+def _data(event: str) -> dict:
+    return json.loads(event.split("data: ", 1)[1])
+
+
+async def test_updates_are_coalesced_per_interval(make_result) -> None:
+    """Test that results recorded within one interval reach subscribers as one update."""
+    quiz_id = uuid4()
+    feed = ResultFeed(interval=0.05, leaderboard_size=3)
+    first, second = feed.subscribe(quiz_id), feed.subscribe(quiz_id)
+    leader, runner_up = make_result(quiz_id, 90), make_result(quiz_id, 70)
+    feed.seed(quiz_id, [leader, runner_up], attempts=2)
+    assert _data(feed.snapshot(quiz_id))["total_attempts"] == 2
+
+    recorded = [make_result(quiz_id, 80, n) for n in range(1, 6)]
+    for result in recorded:
+        feed.on_results_recorded(ResultsRecorded((result, make_result(uuid4(), 100))))
+    # Publishers may run outside the event loop
+    thread = threading.Thread(
+        target=feed.on_results_recorded, args=(ResultsRecorded((make_result(quiz_id, 10),)),)
+    )
+    thread.start()
+    thread.join()
+
+    update = await asyncio.wait_for(first.get(), timeout=1)
+    assert await asyncio.wait_for(second.get(), timeout=1) is update
+    assert first.queue.empty()
+
+    data = _data(update)
+    assert data["total_attempts"] == 8
+    assert len(data["results"]) == 6
+    assert [(e["rank"], e["score"]) for e in data["leaderboard"]] == [(2, 80), (2, 80)]
+    assert data["removed"] == [str(runner_up.id)]
+
+
+async def test_slow_subscriber_is_dropped(make_result) -> None:
+    """Test that a subscriber that stops reading is dropped without affecting the others."""
+    quiz_id = uuid4()
+    feed = ResultFeed(interval=0, queue_size=2)
+    slow, fast = feed.subscribe(quiz_id), feed.subscribe(quiz_id)
+    feed.seed(quiz_id, [], attempts=0)
+
+    received = 0
+    for n in range(4):
+        feed.on_results_recorded(ResultsRecorded((make_result(quiz_id, n),)))
+        await fast.get()
+        received += 1
+
+    assert received == 4
+    assert slow.dropped
+    assert await slow.get() is None
+
+    feed.unsubscribe(fast)
+    assert not feed.is_seeded(quiz_id)
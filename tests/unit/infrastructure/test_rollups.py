@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from src.domain.entities.results import Result
+from src.infrastructure.analytics.rollups import compact, rebuild
+from src.infrastructure.database.models import (
+    Base,
+    QuizActivityDailyModel,
+    QuizActivityHourlyModel,
+)
+from src.infrastructure.repositories.result_repository_impl import ResultRepositoryImpl
+
+NOW = datetime(2024, 5, 31, 15, 30)
+
+
+async def _activity(db: Session, since: datetime, granularity: str, quiz_id) -> list:
+    buckets = await ResultRepositoryImpl(db).get_activity(since, granularity, quiz_id=quiz_id)
+    return [(b.start, b.attempts, b.score_sum) for b in buckets]
+
+
+async def test_compaction_folds_old_hours_into_days(tmp_path) -> None:
+    """Test that compaction moves old hours into daily rows without changing daily totals."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollups.db'}")
+    Base.metadata.create_all(engine)
+    quiz_id = uuid4()
+    results = [
+        Result(None, None, "Student", quiz_id, score, 10, NOW - timedelta(days=days, hours=hours))
+        for days, hours, score in [(20, 0, 50), (20, 1, 70), (20, 1, 90), (10, 3, 40), (0, 2, 80)]
+    ]
+    since = NOW.replace(hour=0, minute=0) - timedelta(days=29)
+    with Session(engine) as db:
+        await ResultRepositoryImpl(db).create_many(results)
+        before = await _activity(db, since, "day", quiz_id)
+        assert [attempts for _, attempts, _ in before] == [3, 1, 1]
+
+    assert compact(engine, retention_days=7, now=NOW) == 3
+    assert compact(engine, retention_days=7, now=NOW) == 0
+
+    with Session(engine) as db:
+        assert db.execute(select(func.count()).select_from(QuizActivityHourlyModel)).scalar() == 1
+        assert db.execute(select(func.count()).select_from(QuizActivityDailyModel)).scalar() == 2
+        assert await _activity(db, since, "day", quiz_id) == before
+        assert await _activity(db, NOW - timedelta(days=7), "hour", quiz_id) == [
+            (NOW.replace(hour=13, minute=0), 1, 80)
+        ]
+
+    rebuild(engine, retention_days=7)
+    with Session(engine) as db:
+        # Rebuilding compacts relative to the current time, so only totals are comparable
+        rebuilt = await _activity(db, since, "day", quiz_id)
+        assert [(a, s) for _, a, s in rebuilt] == [(a, s) for _, a, s in before]
@@ -0,0 +1,117 @@
+import io
+import json
+from typing import List, Optional
+from uuid import uuid4
+
+import pytest
+
+from src.infrastructure.observability import Span, Tracer, traced, traced_class, tracer
+from src.infrastructure.observability.exporters import ConsoleSpanExporter, JsonFileSpanExporter
+
+
+class MemoryExporter:
+    def __init__(self) -> None:
+        self.spans: List[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def shutdown(self) -> None:
+        pass
+
+
+@pytest.fixture
+def exporter():
+    memory = MemoryExporter()
+    tracer.configure(memory)
+    yield memory
+    tracer.configure(None)
+
+
+def test_disabled_tracer_records_nothing() -> None:
+    """Test that spans are not created without an exporter."""
+    disabled = Tracer()
+    with disabled.start_span("noop") as span:
+        assert span is None
+
+
+def test_spans_nest_under_current_span(exporter) -> None:
+    """Test that child spans share the trace id and point at their parent."""
+    with tracer.start_span("parent") as parent:
+        with tracer.start_span("child") as child:
+            pass
+
+    assert [s.name for s in exporter.spans] == ["child", "parent"]
+    assert child.trace_id == parent.trace_id
+    assert child.parent_id == parent.span_id
+    assert parent.parent_id is None
+
+
+def test_span_records_errors(exporter) -> None:
+    """Test that an exception marks the span as failed and propagates."""
+    with pytest.raises(ValueError):
+        with tracer.start_span("failing"):
+            raise ValueError("boom")
+
+    assert exporter.spans[0].status == "error"
+    assert "boom" in exporter.spans[0].error
+
+
+async def test_traced_class_records_ids_and_row_counts(exporter) -> None:
+    """Test that public coroutine methods get spans with id arguments and result sizes."""
+
+    @traced_class()
+    class FakeUseCases:
+        async def get_quiz(self, quiz_id, include_questions: bool = False) -> Optional[str]:
+            return None
+
+        async def get_all(self, skip: int = 0, limit: int = 100) -> List[int]:
+            return [1, 2, 3]
+
+    quiz_id = uuid4()
+    await FakeUseCases().get_quiz(quiz_id)
+    await FakeUseCases().get_all(limit=3)
+
+    get_quiz, get_all = exporter.spans
+    assert get_quiz.name == "FakeUseCases.get_quiz"
+    assert get_quiz.attributes == {"quiz_id": str(quiz_id), "result.found": False}
+    assert get_all.attributes == {"limit": 3, "result.count": 3}
+
+
+def test_traced_function(exporter) -> None:
+    """Test that plain functions can be traced under a custom name."""
+
+    @traced("argon2.hash")
+    def hash_password(password: str) -> str:
+        return password[::-1]
+
+    assert hash_password("secret") == "terces"
+    assert exporter.spans[0].name == "argon2.hash"
+    assert exporter.spans[0].attributes == {}
+
+
+def _span(name: str) -> Span:
+    return Span(name=name, trace_id="t" * 32, span_id="s" * 16, start_ns=0, end_ns=1_000_000)
+
+
+def test_console_exporter_prints_without_logging_setup() -> None:
+    """Test that console spans are printed even though the app configures no logging."""
+    stream = io.StringIO()
+    console = ConsoleSpanExporter(logger_name=f"tracing-test-{uuid4()}", stream=stream)
+
+    console.export(_span("GET /api/quizzes/"))
+
+    assert "OK GET /api/quizzes/ 1.00ms" in stream.getvalue()
+
+
+def test_json_exporter_writes_in_the_background(tmp_path) -> None:
+    """Test that queued spans reach the file by shutdown, one JSON object per line."""
+    path = tmp_path / "traces.jsonl"
+    json_file = JsonFileSpanExporter(str(path))
+
+    for n in range(3):
+        json_file.export(_span(f"span {n}"))
+    json_file.shutdown()
+
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["span 0", "span 1", "span 2"]